@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 """Current state processor - handles documentation labeled issues with full pipeline."""
 
+import os
+import time
 import requests
 from .shared_utils import (clean_title_for_filename, ensure_directory, get_current_timestamp,
-                          get_github_metadata, format_github_metadata_markdown, sanitize_for_ai)
+                          get_github_metadata, format_github_metadata_markdown, sanitize_for_ai,
+                          get_proper_path, get_content_root)
+from .scheduler import get_scheduler, INTERACTIVE
 from .changelog_manager import create_core_doc_metadata_section
+from .search_index import record_change
+from .metrics import record_llm_response, FS_OPERATIONS
 
 
 def process_current_state_update(api_key, issue_number, issue_title, issue_body, is_duplicate=False, other_types=None):
@@ -54,7 +60,9 @@ Be critical and realistic about what can be automated vs what needs manual revie
 """
     
     # Get AI analysis
-    response = requests.post(
+    start = time.perf_counter()
+    response = get_scheduler().call(
+        'openrouter', requests.post,
         "https://openrouter.ai/api/v1/chat/completions",
         headers={
             "Authorization": f"Bearer {api_key}",
@@ -64,8 +72,10 @@ Be critical and realistic about what can be automated vs what needs manual revie
             "model": "anthropic/claude-3.5-sonnet",
             "messages": [{"role": "user", "content": analysis_prompt}],
             "max_tokens": 800
-        }
+        },
+        priority=INTERACTIVE
     )
+    record_llm_response('current_state', response, time.perf_counter() - start)
     
     if response.status_code == 200:
         analysis = response.json()['choices'][0]['message']['content']
@@ -123,6 +133,8 @@ Be critical and realistic about what can be automated vs what needs manual revie
     
     with open(f"{work_dir}/processing-instructions.md", "w") as f:
         f.write(instructions_content)
+    FS_OPERATIONS.inc(2, component='current_state_processor', operation='write')
+    record_change(work_dir)
     
     print(f"✅ Current state analysis created: {work_dir}")
     print("📋 Manual processing required - see processing-instructions.md")
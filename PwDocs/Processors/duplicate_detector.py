@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""Near-duplicate issue detection with MinHash signatures and LSH banding."""
+
+import os
+import re
+import struct
+import sqlite3
+import hashlib
+from .shared_utils import ensure_directory, get_cache_dir, get_content_root
+from .search_index import tokenize
+
+# One-permutation MinHash: the top BIN_BITS of a shingle's 64-bit hash pick
+# its bin, the rest is the value kept as the bin's minimum
+BIN_BITS = 6
+NUM_BINS = 1 << BIN_BITS
+VALUE_BITS = 64 - BIN_BITS
+VALUE_MASK = (1 << VALUE_BITS) - 1
+EMPTY = 1 << 64
+
+# 16 bands of 4 rows: issues with Jaccard similarity 0.5 become candidates 64%
+# of the time, at 0.7 98% of the time, at 0.3 only 12% of the time
+BANDS = 16
+ROWS = NUM_BINS // BANDS
+
+DEFAULT_THRESHOLD = 0.5
+MODES = ('off', 'annotate', 'skip')
+
+SIGNATURE = struct.Struct(f'<{NUM_BINS}Q')
+BAND = struct.Struct(f'<B{ROWS}Q')
+
+# Issue documents written by the processors, in the order to prefer them
+ISSUE_FILES = ('bug-report.md', 'question.md', 'README.md', 'analysis.md')
+ISSUE_DIR = re.compile(r'^(\d+)-')
+# Generated sections that every issue document shares
+BOILERPLATE_SECTIONS = {
+    'github issue reference', 'status', 'answer', 'roadmap integration', 'closure information'
+}
+# Notices the processors put above the content, each running to the next blank line
+NOTICE_HEADERS = ('⚠️ **DUPLICATE PROCESSING NOTICE**', '⚠️ **POSSIBLE DUPLICATE**')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS signatures (
+    number INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    signature BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS buckets (
+    bucket INTEGER NOT NULL,
+    number INTEGER NOT NULL,
+    PRIMARY KEY (bucket, number)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS buckets_number ON buckets (number);
+"""
+
+
+def get_duplicate_mode():
+    """What process_issue does with likely duplicates: 'off', 'annotate' (default) or 'skip' the LLM call."""
+    mode = os.environ.get('PWDOCS_DUPLICATES', 'annotate').strip().lower()
+    return mode if mode in MODES else 'annotate'
+
+
+def get_duplicate_threshold():
+    """Estimated similarity at or above which an issue counts as a likely duplicate."""
+    try:
+        return float(os.environ.get('PWDOCS_DUPLICATE_THRESHOLD', DEFAULT_THRESHOLD))
+    except ValueError:
+        return DEFAULT_THRESHOLD
+
+
+def shingles(title, body=''):
+    """Words and word pairs of the title and body, the set the Jaccard similarity is taken over."""
+    words = tokenize(f"{title or ''}\n{body or ''}")
+    return set(words).union(f"{first} {second}" for first, second in zip(words, words[1:]))
+
+
+def _hash64(shingle):
+    return int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def signature(shingle_set):
+    """NUM_BINS-value MinHash signature from a single hash per shingle, or None for an empty set.
+
+    Empty bins borrow the minimum of the next non-empty bin, offset by the
+    distance, so short issues still get a full signature (rotation
+    densification).
+    """
+    bins = [EMPTY] * NUM_BINS
+    for shingle in shingle_set:
+        value = _hash64(shingle)
+        b = value >> VALUE_BITS
+        value &= VALUE_MASK
+        if value < bins[b]:
+            bins[b] = value
+    if not shingle_set:
+        return None
+
+    dense = list(bins)
+    for i in range(NUM_BINS):
+        if bins[i] == EMPTY:
+            distance = 1
+            while bins[(i + distance) % NUM_BINS] == EMPTY:
+                distance += 1
+            dense[i] = bins[(i + distance) % NUM_BINS] + (distance << VALUE_BITS)
+    return tuple(dense)
+
+
+def similarity(first, second):
+    """Estimated Jaccard similarity of the shingle sets behind two signatures."""
+    return sum(a == b for a, b in zip(first, second)) / NUM_BINS
+
+
+def _buckets(sig):
+    """One LSH bucket per band: a hash of the band number and its rows, as a signed 64-bit SQLite integer."""
+    buckets = []
+    for band in range(BANDS):
+        packed = BAND.pack(band, *sig[band * ROWS:(band + 1) * ROWS])
+        buckets.append(int.from_bytes(hashlib.blake2b(packed, digest_size=8).digest(), 'little', signed=True))
+    return buckets
+
+
+def extract_issue_text(path):
+    """(title, body) from a generated issue document, without the shared boilerplate."""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        lines = f.read().splitlines()
+    title = ''
+    body = []
+    skipping = in_notice = False
+    for line in lines:
+        if in_notice or line.startswith(NOTICE_HEADERS):
+            in_notice = bool(line.strip())
+        elif not title and line.startswith('# '):
+            heading = line[2:]
+            title = heading.split(': ', 1)[1] if ': ' in heading else heading
+        elif line.startswith('## '):
+            skipping = line[3:].strip().lower() in BOILERPLATE_SECTIONS
+        elif not skipping:
+            body.append(line)
+    # The processors escape markdown in issue bodies
+    return title, re.sub(r'\\(.)', r'\1', '\n'.join(body))
+
+
+def format_duplicate_notice(matches):
+    """Markdown notice listing likely duplicates, for the top of a generated document."""
+    if not matches:
+        return ""
+    notice = "⚠️ **POSSIBLE DUPLICATE**\n"
+    notice += "This issue looks similar to existing issues:\n"
+    for match in matches:
+        notice += f"- #{match['number']} {match['title']} ({match['similarity']:.0%} similar)\n"
+    return notice + "\n"
+
+
+class DuplicateIndex:
+    """MinHash signatures of known issues with an LSH band table for candidate lookup.
+
+    `find()` hashes the new issue once per shingle, looks up its 16 band
+    buckets in one indexed query and compares only the candidates'
+    signatures, so a check costs well under a millisecond.
+    """
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or os.path.join(get_cache_dir(), 'duplicates.sqlite3')
+        ensure_directory(os.path.dirname(self.db_path))
+        self._conn = sqlite3.connect(self.db_path, timeout=30)
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    def add(self, number, title, body=''):
+        """Store (or replace) an issue's signature; returns False if it has no words to sign."""
+        with self._conn:
+            return self._store(number, title, body)
+
+    def _store(self, number, title, body):
+        sig = signature(shingles(title, body))
+        if sig is None:
+            return False
+        number = int(number)
+        self._conn.execute('DELETE FROM buckets WHERE number = ?', (number,))
+        self._conn.execute('INSERT OR REPLACE INTO signatures (number, title, signature) VALUES (?, ?, ?)',
+                           (number, title, SIGNATURE.pack(*sig)))
+        self._conn.executemany('INSERT OR IGNORE INTO buckets (bucket, number) VALUES (?, ?)',
+                               ((bucket, number) for bucket in _buckets(sig)))
+        return True
+
+    def remove(self, number):
+        with self._conn:
+            self._conn.execute('DELETE FROM buckets WHERE number = ?', (int(number),))
+            self._conn.execute('DELETE FROM signatures WHERE number = ?', (int(number),))
+
+    def find(self, title, body='', threshold=None, exclude=None, limit=5):
+        """Known issues likely to duplicate this one, most similar first.
+
+        Returns [{'number', 'title', 'similarity'}] for candidates whose
+        estimated similarity reaches the threshold. `exclude` skips the
+        issue's own number when it is re-processed.
+        """
+        threshold = get_duplicate_threshold() if threshold is None else threshold
+        sig = signature(shingles(title, body))
+        if sig is None:
+            return []
+        rows = self._conn.execute(
+            f'SELECT number, title, signature FROM signatures WHERE number IN '
+            f'(SELECT number FROM buckets WHERE bucket IN ({",".join("?" * BANDS)}))',
+            _buckets(sig)).fetchall()
+
+        matches = []
+        for number, known_title, packed in rows:
+            if exclude is not None and number == int(exclude):
+                continue
+            score = similarity(sig, SIGNATURE.unpack(packed))
+            if score >= threshold:
+                matches.append({'number': number, 'title': known_title, 'similarity': score})
+        matches.sort(key=lambda match: (-match['similarity'], match['number']))
+        return matches[:limit]
+
+    def count(self):
+        return self._conn.execute('SELECT COUNT(*) FROM signatures').fetchone()[0]
+
+    def build(self, issues_dir=None):
+        """Sign every issue folder under Content/Issues (open and closed); returns the count added."""
+        issues_dir = issues_dir or os.path.join(get_content_root(), 'Issues')
+        added = 0
+        with self._conn:
+            for root, dirs, _ in os.walk(issues_dir):
+                for name in list(dirs):
+                    match = ISSUE_DIR.match(name)
+                    if not match:
+                        continue
+                    dirs.remove(name)  # An issue folder holds no further issues
+                    folder = os.path.join(root, name)
+                    path = next((os.path.join(folder, f) for f in ISSUE_FILES
+                                 if os.path.isfile(os.path.join(folder, f))), None)
+                    if path:
+                        title, body = extract_issue_text(path)
+                        added += self._store(match.group(1), title, body)
+        return added
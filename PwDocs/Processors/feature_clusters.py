@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""TF-IDF clustering of feature proposals into consolidation groups."""
+
+import os
+import numpy as np
+from .shared_utils import get_content_root
+from .search_index import tokenize
+from .duplicate_detector import extract_issue_text
+
+FEATURE_ROOTS = (os.path.join(get_content_root(), 'Issues', 'Features-Proposed'),)
+# Processor bookkeeping next to each proposal, not part of it
+SKIP_FILES = {'status.md'}
+
+DEFAULT_THRESHOLD = 0.35
+DEFAULT_MAX_GROUP = 6
+# How much a too-large group's threshold is raised before splitting it again
+SPLIT_STEP = 0.05
+
+# Terms in more than DENSE_MIN_DF proposals go through a dense matrix product;
+# rarer terms contribute per document pair, which keeps both parts small
+DENSE_MIN_DF = 64
+# Rows of the similarity matrix computed at once
+BLOCK_ROWS = 512
+
+
+def collect_proposals(roots=FEATURE_ROOTS):
+    """Feature proposal documents under the roots, sorted; a root's own README.md is its index."""
+    paths = []
+    for root in roots:
+        for dirpath, dirs, files in os.walk(root):
+            dirs.sort()
+            for name in files:
+                if not name.endswith('.md') or name in SKIP_FILES:
+                    continue
+                if name == 'README.md' and dirpath == root:
+                    continue
+                paths.append(os.path.join(dirpath, name))
+    return sorted(paths)
+
+
+class TfidfMatrix:
+    """L2-normalised TF-IDF vectors in CSR form: row i of document i is
+    indices/data[indptr[i]:indptr[i + 1]], with columns into `terms`.
+
+    Term frequencies are sublinear (1 + log tf) and idf is smoothed,
+    log((1 + n) / (1 + df)) + 1, so terms in every document still count a
+    little and two-document corpora are not all zeros.
+    """
+
+    def __init__(self, indptr, indices, data, terms, df):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.terms = terms
+        self.df = df
+
+    @property
+    def shape(self):
+        return len(self.indptr) - 1, len(self.terms)
+
+    @classmethod
+    def from_texts(cls, texts):
+        vocabulary = {}
+        indptr = [0]
+        indices = []
+        counts = []
+        for text in texts:
+            row = {}
+            for token in tokenize(text):
+                column = vocabulary.setdefault(token, len(vocabulary))
+                row[column] = row.get(column, 0) + 1
+            indices.extend(sorted(row))
+            counts.extend(row[column] for column in sorted(row))
+            indptr.append(len(indices))
+
+        n = len(indptr) - 1
+        indptr = np.asarray(indptr, dtype=np.int64)
+        indices = np.asarray(indices, dtype=np.int64)
+        data = 1.0 + np.log(np.asarray(counts, dtype=np.float64))
+        df = np.bincount(indices, minlength=len(vocabulary))
+        data *= (np.log((1.0 + n) / (1.0 + df)) + 1.0)[indices]
+
+        rows = np.repeat(np.arange(n), np.diff(indptr))
+        norms = np.sqrt(np.bincount(rows, weights=data * data, minlength=n))
+        norms[norms == 0] = 1.0
+        data /= norms[rows]
+
+        terms = [None] * len(vocabulary)
+        for term, column in vocabulary.items():
+            terms[column] = term
+        return cls(indptr, indices, data, terms, df)
+
+    def rows(self):
+        """Row number of every stored value."""
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    def top_terms(self, members, limit=5):
+        """Terms with the largest summed weight over the given rows."""
+        weights = np.zeros(self.shape[1])
+        for row in members:
+            start, end = self.indptr[row], self.indptr[row + 1]
+            weights[self.indices[start:end]] += self.data[start:end]
+        best = np.argsort(-weights, kind='stable')[:limit]
+        return [self.terms[column] for column in best if weights[column] > 0]
+
+
+def _sparse_pairs(matrix, rows, low):
+    """Summed products over the rare terms, as sorted unique keys i * n + j (i < j) and values.
+
+    Values of a term with document frequency d form one group of d entries
+    once sorted by column; all groups with the same d are expanded to their
+    d * (d - 1) / 2 pairs in one step.
+    """
+    n = matrix.shape[0]
+    columns = matrix.indices[low]
+    order = np.lexsort((rows[low], columns))
+    docs = rows[low][order]
+    values = matrix.data[low][order]
+    sizes = matrix.df[columns[order]]
+
+    keys, products = [], []
+    for d in np.unique(sizes):
+        selected = sizes == d
+        group_docs = docs[selected].reshape(-1, d)
+        group_values = values[selected].reshape(-1, d)
+        first, second = np.triu_indices(d, 1)
+        keys.append((group_docs[:, first] * n + group_docs[:, second]).ravel())
+        products.append((group_values[:, first] * group_values[:, second]).ravel())
+    if not keys:
+        return np.empty(0, dtype=np.int64), np.empty(0)
+
+    keys, inverse = np.unique(np.concatenate(keys), return_inverse=True)
+    return keys, np.bincount(inverse.ravel(), weights=np.concatenate(products))
+
+
+def similar_pairs(matrix, threshold=DEFAULT_THRESHOLD, dense_min_df=DENSE_MIN_DF, block_rows=BLOCK_ROWS):
+    """Exact cosine similarity of every document pair, returning those >= threshold.
+
+    Returns (first, second, similarity) arrays with first < second. Only
+    terms shared by two or more documents matter to a pair: the frequent
+    ones are multiplied as a dense float32 matrix a block of rows at a
+    time, the rare ones are added from their document pairs.
+    """
+    n = matrix.shape[0]
+    rows = matrix.rows()
+    entry_df = matrix.df[matrix.indices]
+    dense = entry_df > dense_min_df
+    low = (entry_df >= 2) & ~dense
+
+    dense_columns, dense_index = np.unique(matrix.indices[dense], return_inverse=True)
+    vectors = np.zeros((n, len(dense_columns)), dtype=np.float32)
+    vectors[rows[dense], dense_index.ravel()] = matrix.data[dense]
+    pair_keys, pair_values = _sparse_pairs(matrix, rows, low)
+
+    found_first, found_second, found_similarity = [], [], []
+    for start in range(0, n, block_rows):
+        end = min(start + block_rows, n)
+        block = vectors[start:end] @ vectors.T
+        lo, hi = np.searchsorted(pair_keys, [start * n, end * n])
+        block[pair_keys[lo:hi] // n - start, pair_keys[lo:hi] % n] += pair_values[lo:hi]
+
+        first, second = np.nonzero(block >= threshold)
+        first += start
+        upper = second > first
+        found_first.append(first[upper])
+        found_second.append(second[upper])
+        found_similarity.append(block[first[upper] - start, second[upper]])
+
+    if not found_first:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    return np.concatenate(found_first), np.concatenate(found_second), np.concatenate(found_similarity)
+
+
+def _components(members, edges):
+    """Connected components of members over (first, second, similarity) edges.
+
+    Returns [(members, edges)] per component, members sorted.
+    """
+    parent = {member: member for member in members}
+
+    def find(member):
+        while parent[member] != member:
+            parent[member] = parent[parent[member]]
+            member = parent[member]
+        return member
+
+    for first, second, _ in edges:
+        a, b = find(first), find(second)
+        if a != b:
+            parent[max(a, b)] = min(a, b)
+    groups = {}
+    for member in members:
+        groups.setdefault(find(member), ([], []))[0].append(member)
+    for edge in edges:
+        groups[find(edge[0])][1].append(edge)
+    return list(groups.values())
+
+
+def cluster(n, first, second, similarity, threshold=DEFAULT_THRESHOLD, max_group=DEFAULT_MAX_GROUP):
+    """Groups of two or more documents linked by similarity >= threshold.
+
+    A group larger than max_group is split again at a threshold raised by
+    SPLIT_STEP, so chains of loosely related proposals end up as several
+    tight groups rather than one merge of everything.
+    """
+    edges = [(int(a), int(b), float(s)) for a, b, s in zip(first, second, similarity)]
+    pending = [(list(range(n)), edges, threshold)]
+    groups = []
+    while pending:
+        members, edges, level = pending.pop()
+        kept = [edge for edge in edges if edge[2] >= level]
+        for component, component_edges in _components(members, kept):
+            if len(component) < 2:
+                continue
+            if len(component) > max_group and level + SPLIT_STEP <= 1.0:
+                pending.append((component, component_edges, level + SPLIT_STEP))
+            else:
+                groups.append((component, component_edges))
+    return groups
+
+
+def consolidation_groups(paths, threshold=DEFAULT_THRESHOLD, max_group=DEFAULT_MAX_GROUP):
+    """Overlapping proposals among paths, largest and tightest groups first.
+
+    Each group is {'paths', 'similarity', 'terms'}: paths start with the
+    proposal most similar to the rest (the one to merge into), similarity
+    is the mean over the group's linked pairs and terms are its most
+    characteristic words.
+    """
+    texts = []
+    for path in paths:
+        title, body = extract_issue_text(path)
+        texts.append(f"{title}\n{body}")
+    matrix = TfidfMatrix.from_texts(texts)
+    first, second, similarity = similar_pairs(matrix, threshold)
+
+    result = []
+    for members, edges in cluster(len(paths), first, second, similarity, threshold, max_group):
+        centrality = {member: 0.0 for member in members}
+        for a, b, score in edges:
+            centrality[a] += score
+            centrality[b] += score
+        ordered = sorted(members, key=lambda member: (-centrality[member], paths[member]))
+        result.append({
+            'paths': [paths[member] for member in ordered],
+            'similarity': round(sum(score for _, _, score in edges) / len(edges), 3),
+            'terms': matrix.top_terms(members)
+        })
+    result.sort(key=lambda group: (-len(group['paths']), -group['similarity'], group['paths'][0]))
+    return result
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Label decision table: which issue type, source folder and status move a set of labels implies."""
+
+import os
+import sys
+import json
+import time
+import random
+import timeit
+
+DEFAULT_RULES_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  'label_rules.json')
+
+# Process-wide compiled table, see get_label_rules()
+_rules = None
+
+
+def label_names(labels):
+    """Lower-cased label names from a list of names or GitHub {'name': ...} dicts.
+
+    A frozenset is taken to be the result of an earlier call and returned as
+    is, so callers deciding several things about one label set convert once.
+    """
+    if isinstance(labels, frozenset):
+        return labels
+    if not labels:
+        return frozenset()
+    try:
+        if isinstance(next(iter(labels)), str):
+            return frozenset(map(str.lower, labels))
+        return frozenset([label.get('name', '').lower() for label in labels])
+    except (TypeError, AttributeError):
+        # A mix of names and dicts
+        return frozenset((label.get('name', '') if isinstance(label, dict) else label).lower()
+                         for label in labels)
+
+
+class LabelRules:
+    """Compiled form of label_rules.json.
+
+    Every rule list is turned into frozensets and dicts keyed by label, so a
+    decision is a handful of hash lookups over the issue's own labels rather
+    than a scan of the table. Rule order in the file is precedence order.
+    """
+
+    def __init__(self, table):
+        self.table = table
+
+        self.issue_types = tuple(rule['type'] for rule in table['issue_types'])
+        self.type_by_label = {}
+        self.type_by_title_word = {}
+        for rule in table['issue_types']:
+            for label in rule['labels']:
+                self.type_by_label.setdefault(label.lower(), rule['type'])
+            for word in rule.get('title_words', []):
+                self.type_by_title_word.setdefault(word.lower(), rule['type'])
+
+        self.claude_labels = frozenset(label.lower() for label in table['claude_labels'])
+
+        # (label, source_type) in precedence order; the source labels are few, so
+        # walking them beats walking the issue's labels
+        self._source_order = tuple((label.lower(), rule['source_type'])
+                                   for rule in table['source_types'] for label in rule['labels'])
+        self.source_types = tuple(rule['source_type'] for rule in table['source_types'])
+
+        self.status_rules = tuple(table['status_labels'])
+        self._status_by_label = {rule['label'].lower(): (rank, rule)
+                                 for rank, rule in enumerate(self.status_rules)}
+        self.status_labels = frozenset(self._status_by_label)
+        # process_label_change's own precedence, which differs from the status order above
+        self.label_change_rules = tuple((label.lower(), self._status_by_label[label.lower()][1])
+                                        for label in table['label_change_order'])
+
+        self.local_to_github = {path: list(labels) for path, labels in table['local_labels'].items()}
+        self.github_to_local = {rule['label']: rule['local_path'] for rule in self.status_rules}
+
+    def issue_type(self, labels, title=None):
+        """Processing type for the labels, a list of types when several apply.
+
+        Falls back to the first word of the title, then 'STANDARD_ISSUE'.
+        """
+        matched = {self.type_by_label[name] for name in label_names(labels)
+                   if name in self.type_by_label}
+        if len(matched) > 1:
+            return [issue_type for issue_type in self.issue_types if issue_type in matched]
+        if matched:
+            return matched.pop()
+
+        if title:
+            words = title.split()
+            if words:
+                issue_type = self.type_by_title_word.get(words[0].lower())
+                if issue_type:
+                    return issue_type
+
+        return 'STANDARD_ISSUE'
+
+    def requires_claude(self, labels):
+        return not self.claude_labels.isdisjoint(label_names(labels))
+
+    def source_type(self, labels):
+        """Local source folder type ('features-proposed', 'bugs', ...) for the labels, or None."""
+        names = label_names(labels)
+        for label, source_type in self._source_order:
+            if label in names:
+                return source_type
+        return None
+
+    def status_rule(self, labels):
+        """The highest-precedence status rule among the labels, or None."""
+        best = None
+        for name in label_names(labels):
+            match = self._status_by_label.get(name)
+            if match and (best is None or match[0] < best[0]):
+                best = match
+        return best[1] if best else None
+
+    def added_status_rules(self, old_labels, new_labels):
+        """Status rules whose label was added between old and new, in precedence order."""
+        added = label_names(new_labels) - label_names(old_labels)
+        matches = [self._status_by_label[name] for name in added if name in self._status_by_label]
+        return [rule for _, rule in sorted(matches, key=lambda match: match[0])]
+
+    def label_change_rule(self, old_labels, new_labels):
+        """The one status rule a label change applies: the first added label in label_change_order."""
+        old = label_names(old_labels)
+        new = label_names(new_labels)
+        for label, rule in self.label_change_rules:
+            if label in new and label not in old:
+                return rule
+        return None
+
+
+def load_label_rules(path=None):
+    """Read and compile a label rules file (PWDOCS_LABEL_RULES or the bundled label_rules.json)."""
+    path = path or os.environ.get('PWDOCS_LABEL_RULES') or DEFAULT_RULES_FILE
+    with open(path, 'r') as f:
+        return LabelRules(json.load(f))
+
+
+def get_label_rules():
+    """The compiled label rules, loaded once per process."""
+    global _rules
+    if _rules is None:
+        _rules = load_label_rules()
+    return _rules
+
+
+def _scan_issue_type(table, labels):
+    """Uncompiled reference: walk the raw table with list membership tests."""
+    names = [label.lower() for label in labels]
+    matched = [rule['type'] for rule in table['issue_types']
+               if any(label in names for label in rule['labels'])]
+    return matched if len(matched) > 1 else (matched[0] if matched else 'STANDARD_ISSUE')
+
+
+def _chain_label_change(old_labels, new_labels):
+    """Uncompiled reference: the if/elif chain process_label_change used before the table.
+
+    Returns (source_type, status label) for the first move the chain makes, or None.
+    """
+    old = set(label.get('name', '') for label in old_labels)
+    new = set(label.get('name', '') for label in new_labels)
+    for status in ('wontfix', 'duplicate', 'invalid'):
+        if status in new and status not in old:
+            if 'feature' in old or 'enhancement' in old:
+                return 'features-proposed', status
+            elif 'bug' in old:
+                return 'bugs', status
+            elif 'question' in old:
+                return 'questions', status
+            return None
+    return None
+
+
+def label_change_batch(size=10000, seed=38):
+    """A reproducible batch of label-change events as (old_labels, new_labels) GitHub label dicts."""
+    rng = random.Random(seed)
+    pool = ['bug', 'feature', 'enhancement', 'question', 'documentation', 'priority-high',
+            'needs-triage', 'area/ui', 'area/api', 'good first issue']
+    statuses = ['wontfix', 'duplicate', 'invalid', 'roadmap-approved']
+    batch = []
+    for _ in range(size):
+        old = rng.sample(pool, rng.randint(1, 4)) + rng.sample(statuses, rng.randint(0, 1))
+        new = old + rng.sample(statuses, rng.randint(1, 2))
+        batch.append(([{'name': name} for name in old], [{'name': name} for name in new]))
+    return batch
+
+
+def _compiled_label_change(rules, old_labels, new_labels):
+    """The table-driven counterpart of _chain_label_change."""
+    old = label_names(old_labels)
+    rule = rules.label_change_rule(old, new_labels)
+    source_type = rules.source_type(old) if rule else None
+    return (source_type, rule['label']) if source_type else None
+
+
+def benchmark_batch(size=10000, repeat=5):
+    """Best-of-repeat seconds to decide a label-change batch: (if/elif chain, compiled table)."""
+    rules = get_label_rules()
+    batch = label_change_batch(size)
+    timings = []
+    for decide in (_chain_label_change, lambda old, new: _compiled_label_change(rules, old, new)):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for old, new in batch:
+                decide(old, new)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        timings.append(best)
+    return tuple(timings)
+
+
+def benchmark(number=200000):
+    """Time the compiled decisions per call against a scan of the raw table, then a label-change batch."""
+    rules = get_label_rules()
+    labels = ['priority-high', 'needs-triage', 'bug', 'area/ui', 'question']
+    cases = [
+        ("issue_type (raw table scan)", lambda: _scan_issue_type(rules.table, labels)),
+        ("issue_type (compiled)", lambda: rules.issue_type(labels)),
+        ("requires_claude", lambda: rules.requires_claude(labels)),
+        ("source_type", lambda: rules.source_type(labels)),
+        ("added_status_rules", lambda: rules.added_status_rules(labels, labels + ['wontfix'])),
+        ("label_change_rule", lambda: rules.label_change_rule(labels, labels + ['wontfix'])),
+    ]
+    for name, func in cases:
+        seconds = timeit.timeit(func, number=number)
+        print(f"{name:<30} {seconds / number * 1e9:8.0f} ns/call")
+
+    size = 20000
+    chain, compiled = benchmark_batch(size)
+    print(f"{size} label changes: if/elif chain {chain * 1000:.1f}ms, compiled table {compiled * 1000:.1f}ms")
+
+
+if __name__ == '__main__':
+    if '--benchmark' in sys.argv:
+        benchmark()
+    else:
+        print(json.dumps(get_label_rules().table, indent=2))
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""Process-wide metrics: counters, gauges and fixed-bucket histograms.
+
+Metrics are kept in memory and flushed when the process exits, to a
+Prometheus textfile (for node exporter's textfile collector) and a JSON
+snapshot. Each flush adds this run's counts to the totals already on
+disk, so short-lived tools like process_issue.py build up running totals.
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+from contextlib import contextmanager
+from .shared_utils import get_cache_dir, write_file_atomic
+
+try:
+    import fcntl
+except ImportError:  # Windows: concurrent flushes are not serialised
+    fcntl = None
+
+TEXTFILE_NAME = 'pwdocs.prom'
+SNAPSHOT_NAME = 'pwdocs.json'
+
+# Latency buckets in seconds, from a warm cache lookup to a slow LLM call
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Process-wide registry, see get_registry()
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics_dir():
+    """Where flushes go: PWDOCS_METRICS names a directory (e.g. node exporter's
+    textfile directory), 'off' disables flushing, unset means .pwdocs-cache/metrics."""
+    setting = os.environ.get('PWDOCS_METRICS', '').strip()
+    if setting.lower() in ('0', 'off', 'false'):
+        return None
+    return setting or os.path.join(get_cache_dir(), 'metrics')
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name} takes labels {self.label_names}, got {tuple(sorted(labels))}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _labels(self, key):
+        return dict(zip(self.label_names, key))
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(_Metric):
+    """Monotonic count; flushes add to the total on disk."""
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        if amount < 0:
+            raise ValueError(f"{self.name}: counters only go up")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            return [{'labels': self._labels(key), 'value': value} for key, value in self._values.items()]
+
+
+class Gauge(_Metric):
+    """Current value; a flush replaces the value on disk."""
+    kind = 'gauge'
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            return [{'labels': self._labels(key), 'value': value} for key, value in self._values.items()]
+
+    def reset(self):
+        pass  # The last value stays current until it is set again
+
+
+class Histogram(_Metric):
+    """Observations counted into fixed upper-bound buckets, plus their sum and count."""
+    kind = 'histogram'
+
+    def __init__(self, name, help_text, labels=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        # Linear scan: a dozen buckets beats bisect's call overhead
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of the with-block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self):
+        with self._lock:
+            result = []
+            for key, (counts, total, count) in self._values.items():
+                cumulative, running = [], 0
+                for bucket_count in counts:
+                    running += bucket_count
+                    cumulative.append(running)
+                result.append({'labels': self._labels(key), 'counts': cumulative,
+                               'sum': total, 'count': count})
+            return result
+
+
+class MetricsRegistry:
+    """Named metrics and their persistence."""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name, help_text, labels, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, labels, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"{name} is already registered as a {metric.kind}")
+            return metric
+
+    def counter(self, name, help_text, labels=()):
+        return self._get(Counter, name, help_text, labels)
+
+    def gauge(self, name, help_text, labels=()):
+        return self._get(Gauge, name, help_text, labels)
+
+    def histogram(self, name, help_text, labels=(), buckets=DEFAULT_BUCKETS):
+        return self._get(Histogram, name, help_text, labels, buckets=buckets)
+
+    def snapshot(self):
+        """JSON-serializable state of every metric with samples."""
+        metrics = {}
+        with self._lock:
+            registered = list(self._metrics.values())
+        for metric in registered:
+            samples = metric.samples()
+            if not samples:
+                continue
+            entry = {'type': metric.kind, 'help': metric.help, 'labels': list(metric.label_names)}
+            if metric.kind == 'histogram':
+                entry['buckets'] = list(metric.buckets)
+            entry['samples'] = samples
+            metrics[metric.name] = entry
+        return {'generated': time.strftime('%Y-%m-%dT%H:%M:%S%z'), 'metrics': metrics}
+
+    def reset(self):
+        """Clear counters and histograms once their counts are persisted."""
+        with self._lock:
+            registered = list(self._metrics.values())
+        for metric in registered:
+            metric.reset()
+
+    def flush(self, directory=None):
+        """Add this process's metrics to the snapshot in directory and rewrite both files.
+
+        Returns the merged snapshot, or None if nothing was recorded.
+        """
+        directory = directory or get_metrics_dir()
+        current = self.snapshot()
+        if not directory or not current['metrics']:
+            return None
+        os.makedirs(directory, exist_ok=True)
+        snapshot_path = os.path.join(directory, SNAPSHOT_NAME)
+        with _flush_lock(directory):
+            merged = merge_snapshots(load_snapshot(snapshot_path), current)
+            add_hit_ratios(merged)
+            write_file_atomic(snapshot_path, json.dumps(merged, indent=2, sort_keys=True) + '\n')
+            write_file_atomic(os.path.join(directory, TEXTFILE_NAME), render_prometheus(merged))
+        self.reset()
+        return merged
+
+
+@contextmanager
+def _flush_lock(directory):
+    """Serialise the read-merge-write of concurrent flushes where flock is available."""
+    if fcntl is None:
+        yield
+        return
+    with open(os.path.join(directory, '.lock'), 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def load_snapshot(path):
+    """A previously flushed snapshot, or an empty one if missing or unreadable."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except (IOError, ValueError):
+        return {'metrics': {}}
+    return snapshot if isinstance(snapshot.get('metrics'), dict) else {'metrics': {}}
+
+
+def _sample_key(sample):
+    return tuple(sorted(sample['labels'].items()))
+
+
+def merge_snapshots(previous, current):
+    """previous + current: counters and histograms add up, gauges take the current value.
+
+    A metric whose type or buckets changed between runs starts over from
+    the current run.
+    """
+    metrics = {name: entry for name, entry in previous.get('metrics', {}).items()}
+    for name, entry in current['metrics'].items():
+        old = metrics.get(name)
+        if not old or old.get('type') != entry['type'] or old.get('buckets') != entry.get('buckets'):
+            metrics[name] = entry
+            continue
+        samples = {_sample_key(sample): dict(sample) for sample in old['samples']}
+        for sample in entry['samples']:
+            key = _sample_key(sample)
+            existing = samples.get(key)
+            if existing is None or entry['type'] == 'gauge':
+                samples[key] = sample
+            elif entry['type'] == 'counter':
+                existing['value'] += sample['value']
+            else:
+                existing['counts'] = [a + b for a, b in zip(existing['counts'], sample['counts'])]
+                existing['sum'] += sample['sum']
+                existing['count'] += sample['count']
+        metrics[name] = dict(entry, samples=list(samples.values()))
+    return {'generated': current['generated'], 'metrics': metrics}
+
+
+def add_hit_ratios(snapshot):
+    """Derive pwdocs_cache_hit_ratio{cache} from the hit/miss totals in pwdocs_cache_requests_total."""
+    requests = snapshot['metrics'].get('pwdocs_cache_requests_total')
+    if not requests:
+        return
+    totals = {}
+    for sample in requests['samples']:
+        cache = sample['labels'].get('cache')
+        hits, total = totals.get(cache, (0, 0))
+        if sample['labels'].get('result') == 'hit':
+            hits += sample['value']
+        totals[cache] = (hits, total + sample['value'])
+    snapshot['metrics']['pwdocs_cache_hit_ratio'] = {
+        'type': 'gauge', 'help': "Fraction of cache lookups served from the cache, all runs",
+        'labels': ['cache'],
+        'samples': [{'labels': {'cache': cache}, 'value': round(hits / total, 6) if total else 0.0}
+                    for cache, (hits, total) in sorted(totals.items())]
+    }
+
+
+def _escape(value, quote=True):
+    value = str(value).replace('\\', '\\\\').replace('\n', '\\n')
+    return value.replace('"', '\\"') if quote else value
+
+
+def _format_labels(labels, extra=None):
+    pairs = list(labels.items()) + ([extra] if extra else [])
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_prometheus(snapshot):
+    """Prometheus text exposition format (0.0.4) for a snapshot."""
+    lines = []
+    for name in sorted(snapshot['metrics']):
+        entry = snapshot['metrics'][name]
+        lines.append(f"# HELP {name} {_escape(entry['help'], quote=False)}")
+        lines.append(f"# TYPE {name} {entry['type']}")
+        for sample in sorted(entry['samples'], key=_sample_key):
+            labels = sample['labels']
+            if entry['type'] != 'histogram':
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(sample['value'])}")
+                continue
+            bounds = [_format_value(float(bound)) for bound in entry['buckets']] + ['+Inf']
+            for bound, count in zip(bounds, sample['counts']):
+                lines.append(f"{name}_bucket{_format_labels(labels, ('le', bound))} {count}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(float(sample['sum']))}")
+            lines.append(f"{name}_count{_format_labels(labels)} {sample['count']}")
+    return '\n'.join(lines) + '\n'
+
+
+def _flush_at_exit():
+    try:
+        _registry.flush()
+    except OSError as e:
+        print(f"⚠️ Could not write metrics: {e}", file=sys.stderr)
+
+
+def get_registry():
+    """The process-wide registry, flushed when the process exits."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = MetricsRegistry()
+            atexit.register(_flush_at_exit)
+        return _registry
+
+
+# Metrics recorded across the tools
+
+_r = get_registry()
+LLM_REQUESTS = _r.counter('pwdocs_llm_requests_total',
+                          "OpenRouter chat completions by processor and HTTP status", ('processor', 'status'))
+LLM_TOKENS = _r.counter('pwdocs_llm_tokens_total',
+                        "OpenRouter tokens sent (in) and generated (out)", ('processor', 'direction'))
+LLM_LATENCY = _r.histogram('pwdocs_llm_request_seconds',
+                           "OpenRouter request latency including scheduler queueing", ('processor',))
+RETRIES = _r.counter('pwdocs_retries_total',
+                     "Calls retried after throttling or rate limits", ('component', 'backend'))
+CACHE_REQUESTS = _r.counter('pwdocs_cache_requests_total',
+                            "Cache lookups by cache and result (hit or miss)", ('cache', 'result'))
+FS_OPERATIONS = _r.counter('pwdocs_fs_operations_total',
+                           "Filesystem operations by component and operation", ('component', 'operation'))
+GITHUB_REQUESTS = _r.counter('pwdocs_github_requests_total',
+                             "GitHub REST requests by method and HTTP status", ('method', 'status'))
+GITHUB_LATENCY = _r.histogram('pwdocs_github_request_seconds', "GitHub REST request latency", ('method',))
+LABEL_SYNC_ISSUES = _r.counter('pwdocs_label_sync_issues_total',
+                               "Issues whose labels were synced to GitHub, by result", ('result',))
+LABEL_SYNC_LATENCY = _r.histogram('pwdocs_label_sync_seconds', "Duration of a label sync batch")
+DASHBOARD_LATENCY = _r.histogram('pwdocs_dashboard_generate_seconds',
+                                 "Time to generate the documentation state dashboard")
+DASHBOARD_SECTIONS = _r.gauge('pwdocs_dashboard_sections', "Sections in the last generated dashboard")
+del _r
+
+
+def record_llm_response(processor, response, seconds):
+    """Count an OpenRouter response: status, latency and the token usage it reports."""
+    LLM_REQUESTS.inc(processor=processor, status=response.status_code)
+    LLM_LATENCY.observe(seconds, processor=processor)
+    if response.status_code != 200:
+        return
+    try:
+        usage = response.json().get('usage') or {}
+    except ValueError:
+        return
+    LLM_TOKENS.inc(usage.get('prompt_tokens', 0), processor=processor, direction='in')
+    LLM_TOKENS.inc(usage.get('completion_tokens', 0), processor=processor, direction='out')
@@ -1,43 +1,56 @@
 #!/usr/bin/env python3
 """Question processor - handles question labeled issues."""
 
+import os
 from .shared_utils import (clean_title_for_filename, ensure_directory, get_current_timestamp,
-                          get_github_metadata, format_github_metadata_markdown, escape_markdown)
+                          get_github_metadata, format_github_metadata_markdown, escape_markdown,
+                          get_proper_path, get_content_root)
+from .search_index import record_change
+from .duplicate_detector import format_duplicate_notice
+from .tracing import span
+from .metrics import FS_OPERATIONS
 
 
-def process_question(api_key, issue_number, issue_title, issue_body, is_duplicate=False, other_types=None):
+def process_question(api_key, issue_number, issue_title, issue_body, is_duplicate=False, other_types=None,
+                     similar_issues=None):
     """Process question issues."""
-    clean_title = clean_title_for_filename(issue_title)
-    base_path = get_proper_path([get_content_root(), 'Issues', 'Questions'])
-    question_dir = os.path.join(base_path, f"{issue_number}-{clean_title}")
+    with span('path'):
+        clean_title = clean_title_for_filename(issue_title)
+        base_path = get_proper_path([get_content_root(), 'Issues', 'Questions'])
+        question_dir = os.path.join(base_path, f"{issue_number}-{clean_title}")
     
-    ensure_directory(question_dir)
+        ensure_directory(question_dir)
     
     # Get GitHub metadata
     github_metadata = get_github_metadata(issue_number, issue_title)
     
-    # Build content with metadata and duplication warning
-    content = f"# Question: {issue_title}\n\n"
+    with span('render'):
+        # Build content with metadata and duplication warning
+        content = f"# Question: {issue_title}\n\n"
     
-    # Add duplication warning if needed
-    if is_duplicate:
-        content += "⚠️ **DUPLICATE PROCESSING NOTICE**\n"
-        content += f"This issue was processed multiple ways due to multiple labels: {other_types}\n"
-        content += "See other generated files for this issue.\n\n"
+        # Add duplication warning if needed
+        if is_duplicate:
+            content += "⚠️ **DUPLICATE PROCESSING NOTICE**\n"
+            content += f"This issue was processed multiple ways due to multiple labels: {other_types}\n"
+            content += "See other generated files for this issue.\n\n"
     
-    content += format_github_metadata_markdown(github_metadata)
-    content += "## Question\n\n"
-    # Escape markdown in issue body to prevent formatting issues
-    content += escape_markdown(issue_body)
-    content += "\n\n## Answer\n\n"
-    content += "*To be answered...*\n"
-    content += "\n\n## Status\n\n"
-    content += "- Status: Open\n"
-    content += "- Priority: TBD\n"
+        content += format_duplicate_notice(similar_issues)
+        content += format_github_metadata_markdown(github_metadata)
+        content += "## Question\n\n"
+        # Escape markdown in issue body to prevent formatting issues
+        content += escape_markdown(issue_body)
+        content += "\n\n## Answer\n\n"
+        content += "*To be answered...*\n"
+        content += "\n\n## Status\n\n"
+        content += "- Status: Open\n"
+        content += "- Priority: TBD\n"
     
-    # Write question
-    with open(f"{question_dir}/question.md", "w") as f:
-        f.write(content)
+    with span('write'):
+        # Write question
+        with open(f"{question_dir}/question.md", "w") as f:
+            f.write(content)
     
+        FS_OPERATIONS.inc(component='question_processor', operation='write')
+        record_change(question_dir)
     print(f"✅ Created question: {question_dir}")
     return True
\ No newline at end of file
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""Rate-limit-aware scheduler for calls to GitHub and OpenRouter."""
+
+import os
+import sys
+import time
+import heapq
+import itertools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from .metrics import RETRIES
+
+# Priority classes: lower runs first
+INTERACTIVE = 0  # A person or a single event is waiting on the result
+NORMAL = 1
+BULK = 2         # Batch syncs, reconciliation, backfills
+
+# backend -> (requests per second, burst, max concurrent calls)
+DEFAULT_BACKENDS = {
+    'github': (10.0, 20, 8),
+    'openrouter': (2.0, 4, 4),
+}
+
+# Responses that mean "slow down"
+THROTTLE_STATUS = (429, 503)
+
+# Backends whose client already retries throttled requests: GitHubClient.request
+# backs off and retries on its own and reports every response through observe(),
+# so re-queuing its calls here as well would multiply attempts and waits
+CLIENT_RETRIED = frozenset({'github'})
+MAX_BACKOFF_SECONDS = 300
+
+# Process-wide scheduler, see get_scheduler()
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second up to `burst` tokens."""
+
+    def __init__(self, rate, burst):
+        self.configured_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def time_until_token(self, now):
+        """Seconds until a token is available (0 if one is available now)."""
+        self._refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self):
+        self.tokens -= 1
+
+
+class _Backend:
+    def __init__(self, name, rate, burst, max_concurrency):
+        self.name = name
+        self.bucket = TokenBucket(rate, burst)
+        self.max_concurrency = max_concurrency
+        self.queue = []  # heap of (priority, seq, enqueued, task)
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.consecutive_throttles = 0
+        self.stats = {
+            'submitted': 0, 'completed': 0, 'failed': 0, 'throttled': 0, 'retried': 0,
+            'max_queue_depth': 0, 'wait_seconds': 0.0, 'max_wait_seconds': 0.0,
+            'backoff_seconds': 0.0
+        }
+
+
+class RateLimitedScheduler:
+    """Runs submitted calls per backend under a token bucket and a concurrency cap.
+
+    Queued calls start in priority order (then FIFO). Responses fed to
+    `observe()` adapt each backend: Retry-After and an exhausted
+    X-RateLimit-Remaining pause it until the advertised reset, a 429/503
+    without headers pauses it with exponential backoff, and every throttle
+    halves the bucket rate, which then creeps back to the configured rate
+    on successful calls. Calls whose result is a throttled response are
+    re-queued up to `max_retries` times, except on `client_retried`
+    backends, whose client does its own retrying.
+    """
+
+    def __init__(self, backends=None, max_retries=3, client_retried=CLIENT_RETRIED):
+        backends = backends or DEFAULT_BACKENDS
+        self.backends = {name: _Backend(name, *config) for name, config in backends.items()}
+        self.max_retries = max_retries
+        self.client_retried = frozenset(client_retried)
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._executor = ThreadPoolExecutor(
+            max_workers=sum(backend.max_concurrency for backend in self.backends.values()),
+            thread_name_prefix='pwdocs-scheduler')
+        self._dispatcher = None
+        self._shutdown = False
+
+    # Submitting work
+
+    def submit(self, backend, func, *args, priority=NORMAL, **kwargs):
+        """Queue func(*args, **kwargs) on a backend; returns a Future."""
+        future = Future()
+        task = {'func': func, 'args': args, 'kwargs': kwargs, 'future': future, 'attempts': 0}
+        with self._cond:
+            self.backends[backend].stats['submitted'] += 1
+            self._enqueue(self.backends[backend], priority, task)
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(target=self._dispatch, name='pwdocs-dispatcher',
+                                                    daemon=True)
+                self._dispatcher.start()
+        return future
+
+    def call(self, backend, func, *args, priority=NORMAL, **kwargs):
+        """Run func through the scheduler and wait for its result."""
+        return self.submit(backend, func, *args, priority=priority, **kwargs).result()
+
+    def _enqueue(self, backend, priority, task):
+        heapq.heappush(backend.queue, (priority, next(self._seq), time.monotonic(), task))
+        backend.stats['max_queue_depth'] = max(backend.stats['max_queue_depth'], len(backend.queue))
+        self._cond.notify()
+
+    # Dispatching
+
+    def _next_ready(self, now):
+        """Pick the highest-priority runnable call, or return the seconds until one may be."""
+        best, wake = None, None
+        for backend in self.backends.values():
+            if not backend.queue or backend.in_flight >= backend.max_concurrency:
+                continue
+            wait = max(backend.paused_until - now, backend.bucket.time_until_token(now))
+            if wait > 0:
+                wake = wait if wake is None else min(wake, wait)
+            elif best is None or backend.queue[0][:2] < best.queue[0][:2]:
+                best = backend
+        return best, wake
+
+    def _dispatch(self):
+        with self._cond:
+            while not self._shutdown:
+                now = time.monotonic()
+                backend, wake = self._next_ready(now)
+                if backend is None:
+                    self._cond.wait(wake)
+                    continue
+
+                priority, _, enqueued, task = heapq.heappop(backend.queue)
+                backend.bucket.take()
+                backend.in_flight += 1
+                waited = now - enqueued
+                backend.stats['wait_seconds'] += waited
+                backend.stats['max_wait_seconds'] = max(backend.stats['max_wait_seconds'], waited)
+                self._executor.submit(self._run, backend, priority, task)
+
+    def _run(self, backend, priority, task):
+        task['attempts'] += 1
+        try:
+            result = task['func'](*task['args'], **task['kwargs'])
+        except BaseException as e:
+            with self._cond:
+                backend.in_flight -= 1
+                backend.stats['failed'] += 1
+                self._cond.notify()
+            task['future'].set_exception(e)
+            return
+
+        throttled = False
+        if backend.name not in self.client_retried and hasattr(result, 'headers'):
+            throttled = self.observe(backend.name, result)
+        with self._cond:
+            backend.in_flight -= 1
+            if throttled and task['attempts'] <= self.max_retries:
+                backend.stats['retried'] += 1
+                self._enqueue(backend, priority, task)
+                RETRIES.inc(component='scheduler', backend=backend.name)
+                return
+            backend.stats['completed'] += 1
+            self._cond.notify()
+        task['future'].set_result(result)
+
+    # Adapting to the server
+
+    def observe(self, backend_name, response):
+        """Adapt a backend to a response's status and rate-limit headers; returns True if throttled."""
+        backend = self.backends.get(backend_name)
+        if backend is None:
+            return False
+        headers = response.headers
+        now = time.monotonic()
+        pause = 0.0
+
+        retry_after = headers.get('Retry-After')
+        if retry_after:
+            try:
+                pause = float(retry_after)
+            except ValueError:
+                pause = 0.0
+
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is not None and reset and int(float(remaining)) <= 0:
+            reset = float(reset)
+            if reset > 1e12:  # OpenRouter sends milliseconds
+                reset /= 1000
+            pause = max(pause, reset - time.time())
+
+        throttled = getattr(response, 'status_code', 200) in THROTTLE_STATUS or (
+            getattr(response, 'status_code', 200) == 403 and pause > 0)
+
+        with self._cond:
+            bucket = backend.bucket
+            if throttled:
+                backend.consecutive_throttles += 1
+                backend.stats['throttled'] += 1
+                bucket.rate = max(bucket.configured_rate / 16, bucket.rate / 2)
+                if pause <= 0:
+                    pause = min(MAX_BACKOFF_SECONDS, 2 ** (backend.consecutive_throttles - 1))
+            else:
+                backend.consecutive_throttles = 0
+                bucket.rate = min(bucket.configured_rate, bucket.rate + bucket.configured_rate / 10)
+
+            pause = min(max(pause, 0.0), MAX_BACKOFF_SECONDS)
+            if pause > 0 and now + pause > backend.paused_until:
+                backend.stats['backoff_seconds'] += now + pause - max(now, backend.paused_until)
+                backend.paused_until = now + pause
+            self._cond.notify()
+        return throttled
+
+    # Introspection
+
+    def stats(self):
+        """Per-backend counters, current queue depth, wait times and the adapted rate."""
+        with self._cond:
+            result = {}
+            for name, backend in self.backends.items():
+                stats = dict(backend.stats)
+                started = stats['completed'] + stats['failed'] + stats['retried'] + backend.in_flight
+                stats['queue_depth'] = len(backend.queue)
+                stats['in_flight'] = backend.in_flight
+                stats['mean_wait_seconds'] = stats['wait_seconds'] / started if started else 0.0
+                stats['rate'] = backend.bucket.rate
+                stats['paused_for'] = max(0.0, backend.paused_until - time.monotonic())
+                result[name] = stats
+            return result
+
+    def print_stats(self, file=sys.stderr):
+        for name, stats in self.stats().items():
+            if not stats['submitted']:
+                continue
+            print(f"📊 {name}: {stats['completed']} done, {stats['failed']} failed, "
+                  f"{stats['throttled']} throttled, queue {stats['queue_depth']} "
+                  f"(max {stats['max_queue_depth']}), wait mean {stats['mean_wait_seconds'] * 1000:.0f}ms "
+                  f"max {stats['max_wait_seconds'] * 1000:.0f}ms, rate {stats['rate']:.1f}/s", file=file)
+
+    def shutdown(self, wait=True):
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+        self._executor.shutdown(wait=wait)
+
+
+def _backend_config():
+    """DEFAULT_BACKENDS with PWDOCS_RATE_<BACKEND>="rate,burst,concurrency" overrides."""
+    backends = dict(DEFAULT_BACKENDS)
+    for name in backends:
+        override = os.environ.get(f"PWDOCS_RATE_{name.upper()}")
+        if override:
+            rate, burst, concurrency = override.split(',')
+            backends[name] = (float(rate), int(burst), int(concurrency))
+    return backends
+
+
+def get_scheduler():
+    """The process-wide scheduler shared by the processors and label scripts."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = RateLimitedScheduler(_backend_config())
+        return _scheduler
@@ -0,0 +1,567 @@
+#!/usr/bin/env python3
+"""Incremental BM25 full-text index over the Markdown under Content/ and ClaudeDocs/."""
+
+import os
+import re
+import math
+import bisect
+import mmap
+import time
+import heapq
+import struct
+import sqlite3
+import tempfile
+from array import array
+from contextlib import closing, contextmanager
+from .shared_utils import ensure_directory, get_cache_dir, get_content_root
+
+try:
+    import fcntl
+except ImportError:  # Windows: concurrent updates are not serialised
+    fcntl = None
+
+SEARCH_ROOTS = (get_content_root(), 'ClaudeDocs')
+INDEXED_EXTENSIONS = ('.md', '.txt')
+
+# Bump when tokenization or the segment layout changes; older files are rebuilt
+INDEX_VERSION = 1
+MAGIC = b'PWSX'
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Fold the delta segment into the main one once it holds this many documents,
+# or this fraction of the main segment's documents if that is more
+MERGE_MIN_DOCS = 64
+MERGE_FRACTION = 0.1
+
+TOKEN = re.compile(r'[^\W_]+')
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or that the this to was were will with
+""".split())
+
+# magic, version, docs, terms, postings, tombstones, term bytes, path bytes, total doc length
+HEADER = struct.Struct('<4sIIIIIIIQ')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    in_delta INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS docs_in_delta ON docs (in_delta);
+CREATE TABLE IF NOT EXISTS doc_terms (
+    doc_id INTEGER NOT NULL,
+    term TEXT NOT NULL,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (doc_id, term)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS removed (
+    doc_id INTEGER PRIMARY KEY
+);
+"""
+
+# In-process memo: segment path -> ((mtime_ns, size), _Segment)
+_memo = {}
+
+
+def get_index_dir():
+    """Get the directory holding the search index."""
+    return os.path.join(get_cache_dir(), 'search')
+
+
+def tokenize(text):
+    """Lowercased word tokens, without stopwords and single characters."""
+    return [token for token in TOKEN.findall(text.lower())
+            if len(token) > 1 and token not in STOPWORDS]
+
+
+def record_change(*paths, index_dir=None):
+    """Note files or directories that were written, moved or deleted.
+
+    Cheap enough for the processors' write path: the paths are appended to
+    a journal that the next search or update applies. Never raises, since
+    indexing must not fail issue processing.
+    """
+    try:
+        index_dir = index_dir or get_index_dir()
+        ensure_directory(index_dir)
+        with open(os.path.join(index_dir, 'journal'), 'a') as f:
+            f.write(''.join(os.path.relpath(path) + '\n' for path in paths))
+    except OSError:
+        pass
+
+
+def _under(path, prefix):
+    return path == prefix or path.startswith(prefix + os.sep)
+
+
+@contextmanager
+def _update_lock(index_dir):
+    """Serialise updates of one index across processes where flock is available."""
+    if fcntl is None:
+        yield
+        return
+    with open(os.path.join(index_dir, '.lock'), 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _release(path):
+    """Unmap this process's view of a segment; Windows can't replace or delete a mapped file."""
+    memo = _memo.pop(path, None)
+    if memo:
+        memo[1].close()
+
+
+def write_segment(path, docs, term_rows, tombstones=()):
+    """Write a segment file.
+
+    docs is [(doc_id, path, length)], term_rows yields (term, doc_id, tf)
+    sorted by term bytes then doc_id, and tombstones are doc ids whose
+    copies in the main segment are stale. After the header come uint32
+    arrays - doc ids, doc lengths, path offsets, term offsets, postings
+    start per term, posting docs, posting term frequencies, tombstones -
+    then the UTF-8 term blob and path blob.
+    """
+    dense = {doc_id: i for i, (doc_id, _, _) in enumerate(docs)}
+    doc_ids = array('I', (doc_id for doc_id, _, _ in docs))
+    doc_lengths = array('I', (length for _, _, length in docs))
+    path_offsets = array('I', [0])
+    path_blob = bytearray()
+    for _, doc_path, _ in docs:
+        path_blob += doc_path.encode('utf-8')
+        path_offsets.append(len(path_blob))
+
+    term_offsets = array('I', [0])
+    term_starts = array('I')
+    posting_docs = array('I')
+    posting_tfs = array('I')
+    term_blob = bytearray()
+    current = None
+    for term, doc_id, tf in term_rows:
+        if term != current:
+            current = term
+            term_starts.append(len(posting_docs))
+            term_blob += term.encode('utf-8')
+            term_offsets.append(len(term_blob))
+        posting_docs.append(dense[doc_id])
+        posting_tfs.append(tf)
+    term_starts.append(len(posting_docs))
+    tombstones = array('I', sorted(tombstones))
+
+    header = HEADER.pack(MAGIC, INDEX_VERSION, len(docs), len(term_starts) - 1, len(posting_docs),
+                         len(tombstones), len(term_blob), len(path_blob), sum(doc_lengths))
+
+    _release(path)
+    # A unique temp name per writer, as in shared_utils.write_file_atomic
+    tmp = tempfile.NamedTemporaryFile('wb', dir=os.path.dirname(path) or '.',
+                                      prefix=os.path.basename(path) + '.', suffix='.tmp', delete=False)
+    try:
+        with tmp:
+            tmp.write(header)
+            for section in (doc_ids, doc_lengths, path_offsets, term_offsets, term_starts,
+                            posting_docs, posting_tfs, tombstones):
+                tmp.write(section.tobytes())
+            tmp.write(term_blob)
+            tmp.write(path_blob)
+        os.replace(tmp.name, path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+
+class _Segment:
+    """Read-only view of a segment file, memory-mapped so a query touches only its terms' pages."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.doc_count, self.term_count, posting_count, tombstone_count,
+         term_bytes, path_bytes, self.total_length) = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != INDEX_VERSION:
+            self._mmap.close()
+            raise ValueError(f"Unsupported search index segment {path}")
+
+        view = memoryview(self._mmap)
+        offset = HEADER.size
+
+        def take(count):
+            nonlocal offset
+            section = view[offset:offset + 4 * count].cast('I')
+            offset += 4 * count
+            return section
+
+        self._sections = [
+            take(self.doc_count), take(self.doc_count), take(self.doc_count + 1),
+            take(self.term_count + 1), take(self.term_count + 1),
+            take(posting_count), take(posting_count), take(tombstone_count)
+        ]
+        (self.doc_ids, self.doc_lengths, self.path_offsets, self.term_offsets, self.term_starts,
+         self.posting_docs, self.posting_tfs, self.tombstones) = self._sections
+        # Slicing the mmap itself gives bytes, which compare in term order
+        self.term_base = offset
+        self.path_base = offset + term_bytes
+        self.size = len(self._mmap)
+        self._dense = None
+        self._norms = None
+
+    def _term(self, i):
+        return self._mmap[self.term_base + self.term_offsets[i]:self.term_base + self.term_offsets[i + 1]]
+
+    def find(self, term):
+        """(start, end) of a term's postings, or None - a binary search over the sorted terms."""
+        key = term.encode('utf-8')
+        low, high = 0, self.term_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._term(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.term_count and self._term(low) == key:
+            return self.term_starts[low], self.term_starts[low + 1]
+        return None
+
+    def path(self, doc):
+        start, end = self.path_offsets[doc], self.path_offsets[doc + 1]
+        return self._mmap[self.path_base + start:self.path_base + end].decode('utf-8')
+
+    def length_norms(self, avg_length):
+        """BM25's k1 * (1 - b + b * length / avg_length) for every document, cached per average."""
+        if self._norms is None or self._norms[0] != avg_length:
+            scale = K1 * B / avg_length
+            self._norms = (avg_length, [K1 * (1 - B) + scale * length for length in self.doc_lengths])
+        return self._norms[1]
+
+    def dense_ids(self, doc_ids):
+        """Positions in this segment of the given doc ids (ids not in it are skipped)."""
+        if self._dense is None:
+            self._dense = {doc_id: i for i, doc_id in enumerate(self.doc_ids)}
+        return {self._dense[doc_id] for doc_id in doc_ids if doc_id in self._dense}
+
+    def close(self):
+        for section in self._sections:
+            section.release()
+        self._mmap.close()
+
+
+def _contains(sorted_docs, doc):
+    i = bisect.bisect_left(sorted_docs, doc)
+    return i < len(sorted_docs) and sorted_docs[i] == doc
+
+
+def bm25(segments, terms, limit):
+    """[(score, segment number, doc)] of the best matches across segments.
+
+    segments is [(segment, dead docs)]. Dead documents are skipped, and
+    left out of the document counts and frequencies, so the scores match a
+    freshly merged index.
+    """
+    live_docs = 0
+    total_length = 0
+    for segment, dead in segments:
+        live_docs += segment.doc_count - len(dead)
+        total_length += segment.total_length - sum(segment.doc_lengths[doc] for doc in dead)
+    if not live_docs:
+        return []
+    avg_length = total_length / live_docs or 1
+
+    # Docs of later segments are numbered after those of earlier ones
+    bases = []
+    base = 0
+    for segment, _ in segments:
+        bases.append(base)
+        base += segment.doc_count
+
+    scores = {}
+    for term in set(terms):
+        spans = []
+        df = 0
+        for (segment, dead), base in zip(segments, bases):
+            span = segment.find(term)
+            if span:
+                docs = segment.posting_docs[span[0]:span[1]]
+                # Postings are sorted by doc, so dead docs are found by bisection
+                dead_here = sum(1 for doc in dead if _contains(docs, doc))
+                df += len(docs) - dead_here
+                spans.append((segment, dead if dead_here else (), base, docs, span))
+        if not df:
+            continue
+        idf = math.log(1 + (live_docs - df + 0.5) / (df + 0.5)) * (K1 + 1)
+        for segment, dead, base, docs, span in spans:
+            norms = segment.length_norms(avg_length)
+            tfs = segment.posting_tfs[span[0]:span[1]].tolist()
+            for doc, tf in zip(docs.tolist(), tfs):
+                if dead and doc in dead:
+                    continue
+                key = base + doc
+                scores[key] = scores.get(key, 0.0) + idf * tf / (tf + norms[doc])
+
+    results = []
+    for key, score in heapq.nlargest(limit, scores.items(), key=lambda item: item[1]):
+        number = bisect.bisect_right(bases, key) - 1
+        results.append((score, number, key - bases[number]))
+    return results
+
+
+class SearchIndex:
+    """BM25 index over the documentation, updated per file.
+
+    Each document's term frequencies live in a SQLite forward index, so a
+    changed file only costs re-tokenizing that file. Queries read two
+    memory-mapped segments: the main one, and a delta holding just the
+    documents changed since it was written, with tombstones for their old
+    copies. Updates rewrite only the delta until it grows past
+    MERGE_FRACTION of the main segment, when both are merged.
+    """
+
+    def __init__(self, index_dir=None, roots=SEARCH_ROOTS):
+        self.index_dir = index_dir or get_index_dir()
+        self.roots = [os.path.normpath(root) for root in roots]
+        self.db_path = os.path.join(self.index_dir, 'docs.sqlite3')
+        self.main_path = os.path.join(self.index_dir, 'main.seg')
+        self.delta_path = os.path.join(self.index_dir, 'delta.seg')
+        self.journal_path = os.path.join(self.index_dir, 'journal')
+        ensure_directory(self.index_dir)
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    # Updating
+
+    def _walk(self, path):
+        """(path, stat) for every indexed file at or under path."""
+        if os.path.isfile(path):
+            if path.endswith(INDEXED_EXTENSIONS):
+                yield path, os.stat(path)
+            return
+        stack = [path]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(INDEXED_EXTENSIONS):
+                            yield os.path.normpath(entry.path), entry.stat()
+            except OSError:
+                continue
+
+    def _index_file(self, conn, path, st):
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                tokens = tokenize(f.read())
+        except OSError:
+            return False
+        counts = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+
+        row = conn.execute('SELECT id FROM docs WHERE path = ?', (path,)).fetchone()
+        if row:
+            doc_id = row[0]
+            conn.execute('DELETE FROM doc_terms WHERE doc_id = ?', (doc_id,))
+            conn.execute('UPDATE docs SET mtime_ns = ?, size = ?, length = ?, in_delta = 1 WHERE id = ?',
+                         (st.st_mtime_ns, st.st_size, len(tokens), doc_id))
+        else:
+            doc_id = conn.execute('INSERT INTO docs (path, mtime_ns, size, length) VALUES (?, ?, ?, ?)',
+                                  (path, st.st_mtime_ns, st.st_size, len(tokens))).lastrowid
+        conn.executemany('INSERT INTO doc_terms (doc_id, term, tf) VALUES (?, ?, ?)',
+                         ((doc_id, term, tf) for term, tf in counts.items()))
+        return True
+
+    def _remove(self, conn, doc_ids):
+        for doc_id in doc_ids:
+            conn.execute('DELETE FROM doc_terms WHERE doc_id = ?', (doc_id,))
+            conn.execute('DELETE FROM docs WHERE id = ?', (doc_id,))
+            conn.execute('INSERT OR IGNORE INTO removed (doc_id) VALUES (?)', (doc_id,))
+
+    def _sync_path(self, conn, path):
+        """Re-index what changed at or under path and drop documents that are gone.
+
+        Returns (indexed, removed) counts.
+        """
+        known = {row[0]: row[1:] for row in conn.execute(
+            'SELECT path, id, mtime_ns, size FROM docs WHERE path = ? OR (path > ? AND path < ?)',
+            (path, path + os.sep, path + chr(ord(os.sep) + 1)))}
+        indexed = 0
+        for file_path, st in self._walk(path):
+            row = known.pop(file_path, None)
+            if row and (row[1], row[2]) == (st.st_mtime_ns, st.st_size):
+                continue
+            indexed += self._index_file(conn, file_path, st)
+        self._remove(conn, [row[0] for row in known.values()])
+        return indexed, len(known)
+
+    @staticmethod
+    def _read_journal(path):
+        try:
+            with open(path, 'r') as f:
+                return {os.path.normpath(line.rstrip('\n')) for line in f if line.strip()}
+        except FileNotFoundError:
+            return set()
+
+    def _take_journal(self):
+        """Paths recorded since the last update; the journal is claimed by renaming it.
+
+        If an earlier update died before applying its claim, the new journal
+        must not replace it: both are applied, and the journal is left in
+        place to be claimed next time, when its unchanged files are skipped.
+        """
+        claimed = self.journal_path + '.applying'
+        if os.path.exists(claimed):
+            paths = self._read_journal(claimed) | self._read_journal(self.journal_path)
+            return sorted(paths), claimed
+        try:
+            os.replace(self.journal_path, claimed)
+        except FileNotFoundError:
+            return [], None
+        return sorted(self._read_journal(claimed)), claimed
+
+    def update(self, paths=None, full=False):
+        """Bring the index up to date.
+
+        With paths, only those files or directories are checked; otherwise
+        the journal is applied, or every root is re-scanned when there is
+        no index yet. Files are re-read only when their mtime or size
+        changed; full re-reads everything and rewrites the main segment.
+        Concurrent updates of the same index run one after the other.
+        """
+        start = time.perf_counter()
+        with _update_lock(self.index_dir):
+            stats = self._update(paths, full)
+        stats['elapsed_ms'] = (time.perf_counter() - start) * 1000
+        return stats
+
+    def _update(self, paths, full):
+        claimed = None
+        if full or not os.path.exists(self.main_path):
+            paths = self.roots
+        elif paths is None:
+            paths, claimed = self._take_journal()
+        paths = [os.path.normpath(path) for path in paths]
+        paths = [path for path in paths if any(_under(path, root) for root in self.roots)]
+
+        indexed = removed = 0
+        with closing(self._connect()) as conn:
+            with conn:
+                if full:
+                    conn.execute('DELETE FROM doc_terms')
+                    conn.execute('DELETE FROM docs')
+                for path in paths:
+                    counts = self._sync_path(conn, path)
+                    indexed += counts[0]
+                    removed += counts[1]
+            if full or not os.path.exists(self.main_path):
+                self._merge(conn)
+            elif indexed or removed:
+                self._write_delta(conn)
+        if claimed:
+            try:
+                os.remove(claimed)
+            except FileNotFoundError:
+                pass  # Applied and removed by an update that could not be locked out
+
+        stats = self.stats()
+        stats.update(indexed=indexed, removed=removed)
+        return stats
+
+    def _merge(self, conn):
+        """Write every document into a new main segment and drop the delta."""
+        docs = conn.execute('SELECT id, path, length FROM docs ORDER BY id').fetchall()
+        # BINARY collation orders TEXT by its UTF-8 bytes, the order find() searches in
+        rows = conn.execute('SELECT term, doc_id, tf FROM doc_terms ORDER BY term, doc_id')
+        write_segment(self.main_path, docs, rows)
+        with conn:
+            conn.execute('UPDATE docs SET in_delta = 0 WHERE in_delta = 1')
+            conn.execute('DELETE FROM removed')
+        _release(self.delta_path)
+        if os.path.exists(self.delta_path):
+            os.remove(self.delta_path)
+
+    def _write_delta(self, conn):
+        """Rewrite the delta segment from the documents changed since the last merge."""
+        docs = conn.execute('SELECT id, path, length FROM docs WHERE in_delta = 1 ORDER BY id').fetchall()
+        main_docs = conn.execute('SELECT COUNT(*) FROM docs WHERE in_delta = 0').fetchone()[0]
+        if len(docs) > max(MERGE_MIN_DOCS, MERGE_FRACTION * main_docs):
+            self._merge(conn)
+            return
+        rows = conn.execute(
+            'SELECT term, doc_id, tf FROM doc_terms WHERE doc_id IN '
+            '(SELECT id FROM docs WHERE in_delta = 1) ORDER BY term, doc_id')
+        tombstones = [doc_id for doc_id, _, _ in docs]
+        tombstones += [row[0] for row in conn.execute('SELECT doc_id FROM removed')]
+        write_segment(self.delta_path, docs, rows, tombstones)
+
+    # Querying
+
+    def _segment(self, path):
+        """A mapped segment, re-mapped only when it changed on disk; None if it doesn't exist."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        memo = _memo.get(path)
+        if memo and memo[0] == stamp:
+            return memo[1]
+        _release(path)
+        segment = _Segment(path)
+        _memo[path] = (stamp, segment)
+        return segment
+
+    def _segments(self):
+        """[(segment, dead docs)]: the main segment, then the delta if there is one."""
+        main = self._segment(self.main_path)
+        if not main:
+            return []
+        delta = self._segment(self.delta_path)
+        if not delta:
+            return [(main, set())]
+        return [(main, main.dense_ids(delta.tombstones)), (delta, set())]
+
+    def pending(self):
+        """Whether recorded changes are waiting to be applied."""
+        return os.path.exists(self.journal_path) or os.path.exists(self.journal_path + '.applying')
+
+    def search(self, query, limit=10):
+        """Best matches for a free-text query as [{'path', 'score'}], highest score first.
+
+        Applies pending recorded changes first, so results include files
+        the processors just wrote.
+        """
+        if self.pending() or not os.path.exists(self.main_path):
+            self.update()
+        segments = self._segments()
+        return [{'path': segments[number][0].path(doc), 'score': round(score, 4)}
+                for score, number, doc in bm25(segments, tokenize(query), limit)]
+
+    def stats(self):
+        """Live document count, delta size, term count of the main segment and bytes on disk."""
+        segments = self._segments()
+        stats = {'docs': 0, 'delta_docs': 0, 'terms': 0, 'bytes': 0}
+        for number, (segment, dead) in enumerate(segments):
+            stats['docs'] += segment.doc_count - len(dead)
+            stats['bytes'] += segment.size
+            if number:
+                stats['delta_docs'] = segment.doc_count
+            else:
+                stats['terms'] = segment.term_count
+        return stats
+
+
+def search(query, limit=10):
+    """Search the default index (see SearchIndex.search)."""
+    return SearchIndex().search(query, limit)
@@ -6,44 +6,22 @@ import re
 import yaml
 import html
 import glob
+import tempfile
 from datetime import datetime
+from .label_rules import get_label_rules
+
+# Read once at import: os.umask() can only be queried by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
 
 
 def get_issue_type(labels, title=None):
-    """Determine issue type based on labels with title fallback."""
-    label_names = [label.lower() for label in labels] if labels else []
-    
-    # Check for multiple processing labels
-    processing_types = []
-    if 'documentation' in label_names or 'docs' in label_names:
-        processing_types.append('CURRENT_STATE_UPDATE')
-    if 'enhancement' in label_names or 'feature' in label_names:
-        processing_types.append('FEATURE_PROPOSAL')
-    if 'bug' in label_names:
-        processing_types.append('BUG_REPORT')
-    if 'question' in label_names:
-        processing_types.append('QUESTION')
-    
-    # If multiple processing types, return list for dual processing
-    if len(processing_types) > 1:
-        return processing_types
-    elif len(processing_types) == 1:
-        return processing_types[0]
-    
-    # Fallback to first word of title
-    if title:
-        first_word = title.split()[0].lower() if title.split() else ''
-        if first_word in ['feature', 'feat', 'add', 'implement']:
-            return 'FEATURE_PROPOSAL'
-        elif first_word in ['doc', 'docs', 'documentation', 'update']:
-            return 'CURRENT_STATE_UPDATE'
-        elif first_word in ['bug', 'fix', 'error', 'issue']:
-            return 'BUG_REPORT'
-        elif first_word in ['question', 'help', 'how']:
-            return 'QUESTION'
-    
-    # No processing needed
-    return 'STANDARD_ISSUE'
+    """Determine issue type based on labels with title fallback.
+
+    Returns a list of types when several processing labels are present
+    (dual processing). The rules live in label_rules.json.
+    """
+    return get_label_rules().issue_type(labels, title)
 
 
 def validate_issue_number(issue_number):
@@ -59,32 +37,79 @@ def escape_markdown(text):
     """Escape markdown special characters."""
     if not text:
         return text
-    # Escape markdown special characters
+    # Escape markdown special characters, the backslash first so the escapes stay single
     text = str(text)
-    for char in ['*', '_', '[', ']', '(', ')', '#', '`', '>', '|', '\\']:
+    for char in ['\\', '*', '_', '[', ']', '(', ')', '#', '`', '>', '|']:
         text = text.replace(char, '\\' + char)
     return text
 
 
+# Prompt injection phrases, as words that must appear in this order on one line.
+# A phrase is removed from its first word through the last occurrence of its
+# final word on that line - what the regex 'word1.*word2.*word3' matches - but
+# found with literal searches, so the cost stays linear in the text length.
+INJECTION_PATTERNS = [
+    ('ignore', 'previous', 'instructions'),
+    ('disregard', 'above'),
+    ('forget', 'everything'),
+    ('new', 'instructions', ':'),
+    ('system', 'prompt', ':'),
+    ('assistant', ':'),
+    ('</', '>'),  # HTML/XML tags
+    ('```', '```'),  # Code blocks that might contain instructions
+]
+
+
+def _compile_injection_pattern(words):
+    """(first word, middle words, reversed last word) as case-insensitive literal regexes."""
+    first, *middle, last = [re.compile(re.escape(word), re.IGNORECASE) for word in words]
+    return first, middle, re.compile(re.escape(words[-1][::-1]), re.IGNORECASE)
+
+
+_INJECTION_MATCHERS = [_compile_injection_pattern(words) for words in INJECTION_PATTERNS]
+
+
+def _remove_injection(text, matcher):
+    """Replace every match of one injection pattern with [REMOVED]."""
+    first, middle, last_reversed = matcher
+    pieces = []
+    copied = search_from = 0
+    while search_from <= len(text):
+        start = first.search(text, search_from)
+        if not start:
+            break
+        line_end = text.find('\n', start.end())
+        if line_end == -1:
+            line_end = len(text)
+
+        # The earliest chain of middle words leaves the most room for the last one
+        cursor = start.end()
+        for word in middle:
+            found = word.search(text, cursor, line_end)
+            cursor = found.end() if found else None
+            if cursor is None:
+                break
+        last = last_reversed.search(text[cursor:line_end][::-1]) if cursor is not None else None
+
+        if last:
+            pieces.append(text[copied:start.start()])
+            pieces.append('[REMOVED]')
+            copied = search_from = line_end - last.start()
+        else:
+            # A later start on this line finds the same words or fewer
+            search_from = line_end + 1
+    pieces.append(text[copied:])
+    return ''.join(pieces)
+
+
 def sanitize_for_ai(text):
     """Sanitize text for AI prompts to prevent injection."""
     if not text:
         return text
     # Remove potential prompt injection patterns
     text = str(text)
-    # Remove common injection attempts
-    injection_patterns = [
-        r'ignore.*previous.*instructions',
-        r'disregard.*above',
-        r'forget.*everything',
-        r'new.*instructions.*:',
-        r'system.*prompt.*:',
-        r'assistant.*:',
-        r'</.*>',  # HTML/XML tags
-        r'```.*```',  # Code blocks that might contain instructions
-    ]
-    for pattern in injection_patterns:
-        text = re.sub(pattern, '[REMOVED]', text, flags=re.IGNORECASE)
+    for matcher in _INJECTION_MATCHERS:
+        text = _remove_injection(text, matcher)
     return text
 
 
@@ -162,6 +187,30 @@ def ensure_directory(path):
     return proper_path
 
 
+def write_file_atomic(path, content):
+    """Write a file via a temporary file and rename, so readers never see a partial write."""
+    directory = os.path.dirname(path)
+    if directory:
+        ensure_directory(directory)
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        mode = 0o666 & ~_UMASK
+    # A unique temp name per writer, so concurrent writers (watch mode and a
+    # manual run) never truncate each other's half-written file
+    tmp = tempfile.NamedTemporaryFile('w', dir=directory or '.', prefix=os.path.basename(path) + '.',
+                                      suffix='.tmp', delete=False)
+    try:
+        with tmp:
+            tmp.write(content)
+        # NamedTemporaryFile creates 0600; give the file the mode open() would have
+        os.chmod(tmp.name, mode)
+        os.replace(tmp.name, path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+
 def get_current_timestamp():
     """Get current timestamp in standard format."""
     return datetime.now().strftime('%Y-%m-%d')
@@ -177,10 +226,14 @@ def get_pwdocs_root():
     return "PwDocs"
 
 
+def get_cache_dir():
+    """Get the directory for local tooling caches."""
+    return ".pwdocs-cache"
+
+
 def requires_claude(labels):
     """Check if issue requires Claude Code analysis."""
-    label_names = [label.lower() for label in labels] if labels else []
-    return 'needs-claude' in label_names or 'strategic' in label_names
+    return get_label_rules().requires_claude(labels)
 
 
 def get_analysis_dir():
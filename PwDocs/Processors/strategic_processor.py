@@ -5,6 +5,7 @@ import os
 from datetime import datetime
 from .shared_utils import (ensure_directory, get_content_root,
                          get_github_metadata, format_github_metadata_markdown)
+from .search_index import record_change
 
 def process_strategic_content(api_key, issue_number, issue_title, issue_body, 
                             is_duplicate=False, other_types=None):
@@ -46,6 +47,7 @@ def process_strategic_content(api_key, issue_number, issue_title, issue_body,
     # Write the file
     with open(filepath, "w") as f:
         f.write("\n".join(content))
+    record_change(filepath)
     
     print(f"✨ Created strategic analysis request: {filepath}")
     print("👉 Please engage Claude Code for analysis")
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Span-based tracing for the issue pipeline, written as JSON lines."""
+
+import os
+import json
+import math
+import time
+import uuid
+import threading
+from .shared_utils import get_cache_dir
+
+# Trace files are appended to, one span per line; see summarize()
+DEFAULT_TRACE_FILE = 'traces.jsonl'
+PERCENTILES = (50, 90, 99)
+
+# Resolved on first use, see _get_writer()
+_writer = None
+_writer_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_trace_path():
+    """Where spans go: PWDOCS_TRACE names a file, or '1' for .pwdocs-cache/traces/; None when off."""
+    setting = os.environ.get('PWDOCS_TRACE', '').strip()
+    if not setting or setting.lower() in ('0', 'off', 'false'):
+        return None
+    if setting.lower() in ('1', 'on', 'true'):
+        return os.path.join(get_cache_dir(), 'traces', DEFAULT_TRACE_FILE)
+    return setting
+
+
+class _TraceWriter:
+    """Appends finished spans to the trace file, one write per line so concurrent runs interleave safely."""
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+
+    def write(self, record):
+        line = json.dumps(record, separators=(',', ':'), default=str) + '\n'
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+
+def _get_writer():
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                path = get_trace_path()
+                _writer = _TraceWriter(path) if path else False
+    return _writer
+
+
+def reset():
+    """Forget the resolved trace file, so PWDOCS_TRACE is read again on the next span."""
+    global _writer
+    with _writer_lock:
+        if _writer:
+            _writer._file.close()
+        _writer = None
+
+
+class _NoopSpan:
+    """What span() returns while tracing is off: entering, exiting and set() do nothing."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **attributes):
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class Span:
+    """One timed stage. Spans opened inside it on the same thread become its children."""
+
+    def __init__(self, writer, name, attributes):
+        self._writer = writer
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self):
+        stack = getattr(_local, 'stack', None)
+        if stack is None:
+            stack = _local.stack = []
+        parent = stack[-1] if stack else None
+        self.trace = parent.trace if parent else uuid.uuid4().hex
+        self.parent = parent.id if parent else None
+        self.id = uuid.uuid4().hex[:16]
+        stack.append(self)
+        self.start = time.time()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration_ms = (time.perf_counter() - self._started) * 1000
+        _local.stack.pop()
+        record = {
+            'trace': self.trace, 'span': self.id, 'parent': self.parent, 'name': self.name,
+            'start': round(self.start, 6), 'duration_ms': round(duration_ms, 3)
+        }
+        if self.attributes:
+            record['attributes'] = self.attributes
+        if exc_type is not None:
+            record['error'] = exc_type.__name__
+        self._writer.write(record)
+        return False
+
+    def set(self, **attributes):
+        """Attach attributes learned while the span runs, e.g. a response status."""
+        self.attributes.update(attributes)
+
+
+def span(name, **attributes):
+    """Context manager timing one pipeline stage.
+
+        with span('llm', model=model) as current:
+            response = ...
+            current.set(status=response.status_code)
+
+    With PWDOCS_TRACE unset this returns a shared no-op object, so
+    instrumented code pays one function call and an attribute check.
+    """
+    writer = _writer if _writer is not None else _get_writer()
+    if not writer:
+        return _NOOP
+    return Span(writer, name, attributes)
+
+
+def read_traces(paths):
+    """Span records from JSON-lines trace files, skipping lines that do not parse."""
+    records = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    return records
+
+
+def percentile(ordered, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    return ordered[max(1, math.ceil(len(ordered) * p / 100)) - 1]
+
+
+def summarize(records):
+    """Per-stage latency across runs, slowest total first.
+
+    Stages are span names. Each summary has count, errors, mean, the
+    PERCENTILES and max in milliseconds, and share: the stage's total
+    time as a fraction of the time spent in root spans.
+    """
+    durations = {}
+    errors = {}
+    root_total = 0.0
+    for record in records:
+        name = record.get('name')
+        duration = record.get('duration_ms')
+        if name is None or duration is None:
+            continue
+        durations.setdefault(name, []).append(duration)
+        if record.get('error'):
+            errors[name] = errors.get(name, 0) + 1
+        if record.get('parent') is None:
+            root_total += duration
+
+    stages = []
+    for name, values in durations.items():
+        values.sort()
+        total = sum(values)
+        summary = {'stage': name, 'count': len(values), 'errors': errors.get(name, 0),
+                   'mean_ms': round(total / len(values), 3)}
+        for p in PERCENTILES:
+            summary[f"p{p}_ms"] = percentile(values, p)
+        summary['max_ms'] = values[-1]
+        summary['share'] = round(total / root_total, 4) if root_total else 0.0
+        summary['total_ms'] = round(total, 3)
+        stages.append(summary)
+    stages.sort(key=lambda summary: -summary['total_ms'])
+    return stages
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""AST-based security checks: track untrusted input from its source to dangerous sinks."""
+
+import ast
+import sys
+
+# Bump when the checks change so cached results are discarded
+ENGINE_VERSION = 2
+
+# Names that always hold untrusted issue content
+SOURCE_NAMES = {'issue_title', 'issue_body'}
+
+# Env vars the workflows fill from the GitHub event payload; others are operator settings
+UNTRUSTED_ENV_PREFIXES = ('ISSUE_', 'OLD_LABELS', 'NEW_LABELS', 'COMMENT_', 'PR_')
+
+# Calls whose result is safe whatever went in
+SANITIZERS = {
+    'sanitize_for_ai', 'escape_markdown', 'clean_title_for_filename', 'validate_issue_number',
+    'int', 'float', 'bool', 'len', 'quote', 'escape'
+}
+
+SUBPROCESS_CALLS = {'run', 'call', 'check_call', 'check_output', 'Popen'}
+SHELL_CALLS = {('os', 'system'), ('os', 'popen')}
+HTTP_POST_CALLS = {('requests', 'post'), ('requests', 'request'), ('session', 'post')}
+
+CHECKS = {
+    'taint_open': ('HIGH', "Untrusted {source} reaches a file path in open()"),
+    'taint_shell': ('HIGH', "Untrusted {source} reaches a shell command"),
+    'taint_subprocess': ('MEDIUM', "Untrusted {source} reaches subprocess arguments"),
+    'taint_prompt': ('MEDIUM', "Unsanitized {source} reaches an HTTP request body (LLM prompt) - use sanitize_for_ai()"),
+    'taint_f_string': ('MEDIUM', "Unsanitized {source} in an f-string - validate or escape it"),
+}
+
+
+def _dotted(node):
+    """('os', 'environ') for os.environ, ('open',) for open, None for anything else."""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if isinstance(node, ast.Name):
+        parts.append(node.id)
+        return tuple(reversed(parts))
+    return None
+
+
+def _env_source(key):
+    """Source label for reading env var `key`, or None for operator-controlled settings."""
+    if isinstance(key, ast.Constant) and isinstance(key.value, str):
+        if not key.value.startswith(UNTRUSTED_ENV_PREFIXES):
+            return None
+        return f"env var {key.value}"
+    return 'env var'
+
+
+def _is_environ(node):
+    dotted = _dotted(node)
+    return bool(dotted) and (dotted[-2:] == ('os', 'environ') or dotted == ('environ',))
+
+
+def _source_of(node):
+    """Source label if the expression reads argv or an untrusted env var directly."""
+    if isinstance(node, ast.Subscript) and _is_environ(node.value):
+        return _env_source(node.slice)
+    dotted = _dotted(node)
+    if dotted and (dotted[-2:] == ('sys', 'argv') or dotted == ('argv',)):
+        return 'sys.argv'
+    return None
+
+
+class _FunctionTaint(ast.NodeVisitor):
+    """Taint analysis of one scope (module or function body), statement by statement.
+
+    Assignments propagate taint to names; sanitizer calls clear it. Inside
+    branches and loops a clean assignment does not clear taint, since the
+    tainted value may still flow past the branch.
+    """
+
+    def __init__(self, analyzer, tainted):
+        self.analyzer = analyzer
+        self.tainted = dict(tainted)
+        self.conditional = 0
+        self.reported = set()
+
+    # Expressions
+
+    def taint(self, node):
+        """The source label an expression carries, or None."""
+        if node is None:
+            return None
+        if isinstance(node, ast.Name):
+            if node.id in self.tainted:
+                return self.tainted[node.id]
+            return node.id if node.id in SOURCE_NAMES else None
+        if isinstance(node, ast.Subscript) and _is_environ(node.value):
+            return _source_of(node)
+        if isinstance(node, (ast.Attribute, ast.Subscript)):
+            return _source_of(node) or _source_of(node.value) or self.taint(node.value)
+        if isinstance(node, ast.Call):
+            dotted = _dotted(node.func) or ()
+            if dotted and dotted[-1] in SANITIZERS:
+                return None
+            # A sanitizer handed over as the converter, take_option(args, '--max', 10, int),
+            # decides what comes back
+            converter = _dotted(node.args[-1]) if node.args else None
+            if converter and converter[-1] in SANITIZERS:
+                return None
+            if dotted[-2:] in (('os', 'getenv'), ('environ', 'get')) or dotted == ('getenv',):
+                return _env_source(node.args[0]) if node.args else None
+            # Results of calls on or with untrusted values are untrusted
+            for child in [node.func] + node.args + [keyword.value for keyword in node.keywords]:
+                source = self.taint(child)
+                if source:
+                    return source
+            return None
+        if isinstance(node, ast.FormattedValue):
+            return self.taint(node.value)
+        if isinstance(node, (ast.Compare, ast.Lambda, ast.Constant)):
+            return None
+        if isinstance(node, (ast.ListComp, ast.SetComp, ast.GeneratorExp, ast.DictComp)):
+            return next(filter(None, (self.taint(gen.iter) for gen in node.generators)), None)
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.expr):
+                source = self.taint(child)
+                if source:
+                    return source
+        return None
+
+    # Statements
+
+    def _bind(self, target, source):
+        if isinstance(target, ast.Name):
+            if source:
+                self.tainted[target.id] = source
+            elif not self.conditional:
+                self.tainted.pop(target.id, None)
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            for element in target.elts:
+                self._bind(element.value if isinstance(element, ast.Starred) else element, source)
+
+    def visit_Assign(self, node):
+        self.generic_visit(node)
+        source = self.taint(node.value)
+        for target in node.targets:
+            self._bind(target, source)
+
+    def visit_AnnAssign(self, node):
+        self.generic_visit(node)
+        if node.value is not None:
+            self._bind(node.target, self.taint(node.value))
+
+    def visit_AugAssign(self, node):
+        self.generic_visit(node)
+        source = self.taint(node.value)
+        if source:
+            self._bind(node.target, source)
+
+    def visit_NamedExpr(self, node):
+        self.generic_visit(node)
+        self._bind(node.target, self.taint(node.value))
+
+    def _visit_block(self, node):
+        self.conditional += 1
+        self.generic_visit(node)
+        self.conditional -= 1
+
+    def visit_For(self, node):
+        self.visit(node.iter)
+        self._bind(node.target, self.taint(node.iter))
+        self.conditional += 1
+        for child in node.body + node.orelse:
+            self.visit(child)
+        self.conditional -= 1
+
+    visit_AsyncFor = visit_For
+
+    def visit_If(self, node):
+        self._visit_block(node)
+
+    visit_While = visit_Try = visit_If
+
+    def visit_With(self, node):
+        for item in node.items:
+            self.visit(item.context_expr)
+            if item.optional_vars is not None:
+                self._bind(item.optional_vars, self.taint(item.context_expr))
+        for child in node.body:
+            self.visit(child)
+
+    visit_AsyncWith = visit_With
+
+    def visit_FunctionDef(self, node):
+        self.analyzer.analyze_function(node, self.tainted)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Lambda(self, node):
+        pass  # Analyzed where it is called, if at all
+
+    def visit_ClassDef(self, node):
+        for child in node.body:
+            self.visit(child)
+
+    # Sinks
+
+    def _report(self, check, node, source):
+        if id(node) in self.reported:
+            return
+        self.reported.add(id(node))
+        self.analyzer.report(check, node, source)
+
+    def _mark_f_strings(self, node):
+        """Don't report f-strings again when the sink they feed was reported."""
+        for child in ast.walk(node):
+            if isinstance(child, ast.JoinedStr):
+                self.reported.add(id(child))
+
+    def _check_call(self, node, func, args, keywords):
+        dotted = _dotted(func) or ()
+        name = dotted[-1] if dotted else None
+
+        if dotted == ('open',) or dotted[-2:] in (('io', 'open'), ('codecs', 'open')):
+            path = args[0] if args else next((k.value for k in keywords if k.arg == 'file'), None)
+            source = self.taint(path)
+            if source:
+                self._report('taint_open', node, source)
+                self._mark_f_strings(path)
+            return
+
+        shell = any(keyword.arg == 'shell' and isinstance(keyword.value, ast.Constant)
+                    and keyword.value.value is True for keyword in keywords)
+        if dotted[-2:] in SHELL_CALLS or (len(dotted) >= 2 and dotted[-2] == 'subprocess'
+                                           and name in SUBPROCESS_CALLS):
+            values = list(args) + [keyword.value for keyword in keywords]
+            source = next(filter(None, map(self.taint, values)), None)
+            if source:
+                is_shell = dotted[-2:] in SHELL_CALLS or shell
+                self._report('taint_shell' if is_shell else 'taint_subprocess', node, source)
+                for value in values:
+                    self._mark_f_strings(value)
+            return
+
+        if dotted[-2:] in HTTP_POST_CALLS:
+            bodies = [keyword.value for keyword in keywords if keyword.arg in ('json', 'data')]
+            source = next(filter(None, map(self.taint, bodies)), None)
+            if source:
+                self._report('taint_prompt', node, source)
+                for body in bodies:
+                    self._mark_f_strings(body)
+
+    def visit_Call(self, node):
+        if _dotted(node.func) == ('print',):
+            # Echoing input to the log is fine; don't report the f-strings printed
+            for arg in node.args:
+                self._mark_f_strings(arg)
+        self._check_call(node, node.func, node.args, node.keywords)
+        # Calls routed through a helper, e.g. scheduler.call('openrouter', requests.post, url, json=...)
+        for i, arg in enumerate(node.args):
+            if isinstance(arg, ast.Attribute) and (_dotted(arg) or ())[-2:] in HTTP_POST_CALLS:
+                self._check_call(node, arg, node.args[i + 1:], node.keywords)
+        self.generic_visit(node)
+
+    def visit_JoinedStr(self, node):
+        if id(node) not in self.reported:
+            source = next(filter(None, (self.taint(value) for value in node.values
+                                        if isinstance(value, ast.FormattedValue))), None)
+            # Command-line arguments come from the person running the script
+            if source and source != 'sys.argv':
+                self._report('taint_f_string', node, source)
+        self.generic_visit(node)
+
+
+class TaintAnalyzer:
+    """Parses a module once and reports taint reaching sinks, in the security_linter finding format."""
+
+    def __init__(self, text):
+        self.lines = text.splitlines()
+        self.findings = []
+        self.tree = ast.parse(text)
+
+    def analyze_function(self, node, outer_tainted):
+        # Enclosing-scope taint stays visible, except where a parameter shadows it
+        tainted = dict(outer_tainted)
+        arguments = node.args
+        for arg in arguments.posonlyargs + arguments.args + arguments.kwonlyargs + [
+                arguments.vararg, arguments.kwarg]:
+            if arg is not None and arg.arg not in SOURCE_NAMES:
+                tainted.pop(arg.arg, None)
+        visitor = _FunctionTaint(self, tainted)
+        for child in node.body:
+            visitor.visit(child)
+
+    def run(self):
+        visitor = _FunctionTaint(self, {})
+        for child in self.tree.body:
+            visitor.visit(child)
+        self.findings.sort(key=lambda finding: (finding['line'], finding['check']))
+        return self.findings
+
+    def report(self, check, node, source):
+        severity, message = CHECKS[check]
+        if source == 'sys.argv':
+            severity = 'MEDIUM'  # The person running the script chose it
+        line = node.lineno
+        self.findings.append({
+            'line': line,
+            'severity': severity,
+            'message': message.format(source=source),
+            'code': self.lines[line - 1].strip() if line <= len(self.lines) else '',
+            'check': check
+        })
+
+
+def analyze_text(text):
+    """Taint findings for a module's source; a syntax error is reported as no findings."""
+    try:
+        return TaintAnalyzer(text).run()
+    except SyntaxError:
+        return []
+
+
+def main(paths):
+    """Print the taint findings for each of the given files."""
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for finding in analyze_text(f.read()):
+                print(f"{path}:{finding['line']} {finding['severity']} [{finding['check']}] {finding['message']}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Group overlapping feature proposals and hand each group to aider for consolidation."""
+
+import sys
+import json
+import time
+import shlex
+import subprocess
+from Processors.feature_clusters import (collect_proposals, consolidation_groups,
+                                         DEFAULT_THRESHOLD, DEFAULT_MAX_GROUP)
+
+AIDER_ARGS = ['aider', '--yes', '--auto-commit', '--architect']
+
+CONSOLIDATE_MESSAGE = """These feature proposals overlap. Consolidate them into {primary}.
+
+- Preserve every distinct requirement, rating, dependency and scope boundary
+- Merge duplicated content once, formatted consistently
+- At the top of each other file, add a note that it was consolidated into {primary}
+
+Do not conduct analysis or make recommendations."""
+
+
+def aider_command(group):
+    """aider invocation that merges one consolidation group into its first proposal."""
+    command = list(AIDER_ARGS)
+    for path in group['paths']:
+        command += ['--file', path]
+    return command + ['--message', CONSOLIDATE_MESSAGE.format(primary=group['paths'][0])]
+
+
+def take_option(args, name, default, convert):
+    """Remove '--name value' from args and return the converted value."""
+    if name in args[:-1]:
+        position = args.index(name)
+        value = convert(args[position + 1])
+        del args[position:position + 2]
+        return value
+    return default
+
+
+def print_usage():
+    print("Usage:")
+    print("  consolidate_features.py groups [--threshold T] [--max-group N] [--json]  # Overlapping proposals")
+    print("  consolidate_features.py aider [--threshold T] [--max-group N] [--run]    # aider command per group")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2 or sys.argv[1] not in ('groups', 'aider'):
+        print_usage()
+        sys.exit(1)
+
+    action = sys.argv[1]
+    args = sys.argv[2:]
+    threshold = take_option(args, '--threshold', DEFAULT_THRESHOLD, float)
+    max_group = take_option(args, '--max-group', DEFAULT_MAX_GROUP, int)
+
+    start = time.perf_counter()
+    paths = collect_proposals()
+    groups = consolidation_groups(paths, threshold, max_group)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"🧩 {len(groups)} consolidation group(s) among {len(paths)} proposal(s) in {elapsed_ms:.0f}ms",
+          file=sys.stderr)
+
+    if action == 'groups':
+        if '--json' in args:
+            print(json.dumps(groups, indent=2))
+        else:
+            for number, group in enumerate(groups, 1):
+                print(f"\nGroup {number} ({group['similarity']:.2f} similar: {', '.join(group['terms'])})")
+                for path in group['paths']:
+                    print(f"  {path}")
+
+    elif action == 'aider':
+        for group in groups:
+            command = aider_command(group)
+            if '--run' not in args:
+                print(shlex.join(command))
+                continue
+            print(f"\n🔧 Consolidating into {group['paths'][0]}")
+            if subprocess.run(command).returncode != 0:
+                print(f"❌ aider failed for {group['paths'][0]}")
+                sys.exit(1)
@@ -2,19 +2,28 @@
 """Generate a one-page documentation state summary showing staleness, bugs, questions, and sprint status."""
 
 import os
+import sys
+import time
+import re
+import heapq
+import argparse
 import yaml
-import glob
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
+# Run as a plain script, so make the Processors package importable
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scan_cache import ScanCache
+from roadmap_index import RoadmapIndex, ROADMAP_FILE
+from staleness import BAND_LABELS, DEFAULT_ROOTS, band_index, compute_staleness
+from state_renderers import RENDERERS
+from Processors.shared_utils import get_content_root, write_file_atomic
+from Processors.metrics import DASHBOARD_LATENCY, DASHBOARD_SECTIONS, get_registry
 
-def get_changelog_info(template_file):
-    """Get last update info from changelog."""
-    changelog_file = template_file.replace('.md', '-changelog.yaml')
-    
-    if not os.path.exists(changelog_file):
-        return None, None
-    
+
+def _parse_changelog(changelog_file):
+    """Parse the latest (date, issue) pair from a changelog file."""
     try:
         with open(changelog_file, 'r') as f:
             changelog = yaml.safe_load(f) or {'changelog': []}
@@ -22,10 +31,22 @@ def get_changelog_info(template_file):
         entries = changelog.get('changelog', [])
         if entries:
             latest = entries[0]
-            return latest['date'], latest['github_issue']
+            return [str(latest['date']), latest['github_issue']]
     except:
         pass
     
+    return None
+
+
+def get_changelog_info(template_file, cache=None):
+    """Get last update info from changelog."""
+    changelog_file = template_file.replace('.md', '-changelog.yaml')
+    cache = cache or ScanCache(enabled=False)
+    
+    latest = cache.read(changelog_file, _parse_changelog, 'changelog')
+    if latest:
+        return latest[0], latest[1]
+    
     return None, None
 
 
@@ -49,200 +70,442 @@ def get_file_age(file_path, last_changelog_date=None):
 
 def get_staleness_indicator(age_days):
     """Get staleness indicator based on age."""
-    if age_days < 7:
-        return "✅ Fresh"
-    elif age_days < 30:
-        return "🟡 Recent"
-    elif age_days < 90:
-        return "🟠 Aging"
-    else:
-        return "🔴 Stale"
+    return BAND_LABELS[band_index(age_days)]
+
+
+# Issue sections collected from the Content tree: (content subpath, marker file, ranked)
+# Ranked sections list their top items by priority/status/date instead of by name.
+ISSUE_SECTIONS = {
+    'bugs': (('Issues', 'Bugs'), 'bug-report.md', True),
+    'questions': (('Issues', 'Questions'), 'question.md', True),
+    'features': (('Issues', 'Features-Proposed'), 'README.md', False),
+    'updates': (('Technical', 'Updates'), 'analysis.md', False),
+}
+
+# Bounded reads of bug-report.md / question.md: the title and processed date sit
+# in the header, the Status/Priority block is the last section the processors write
+HEADER_BYTES = 4096
+TAIL_BYTES = 1024
+ISSUE_HEADING = re.compile(r'^# (?:Bug Report|Question): (.+)$', re.MULTILINE)
+PROCESSED_LINE = re.compile(r'^- \*\*Processed\*\*: (\S+)', re.MULTILINE)
+STATUS_LINE = re.compile(r'^- Status: (.+)$', re.MULTILINE)
+PRIORITY_LINE = re.compile(r'^- Priority: (.+)$', re.MULTILINE)
+
+PRIORITY_RANK = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
+CLOSED_STATUSES = {'closed', 'resolved', 'answered', 'fixed'}
+
+
+def _push_bounded(heap, item, limit):
+    """Keep the `limit` largest items seen so far in a min-heap."""
+    if len(heap) < limit:
+        heapq.heappush(heap, item)
+    elif item > heap[0]:
+        heapq.heappushpop(heap, item)
+
+
+class _Reversed:
+    """Heap item with reversed ordering, so a bounded min-heap keeps the smallest N keys."""
+    __slots__ = ('key', 'name', 'header')
+
+    def __init__(self, key, name, header=None):
+        self.key = key
+        self.name = name
+        self.header = header
+
+    def __lt__(self, other):
+        return self.key > other.key
+
+    def __gt__(self, other):
+        return self.key < other.key
+
+
+def _last_match(pattern, text):
+    matches = pattern.findall(text)
+    return matches[-1].strip() if matches else None
+
 
+def read_issue_header(path):
+    """Read title, processed date, status and priority from an issue document.
 
-def get_bugs_summary():
+    Only the first HEADER_BYTES and last TAIL_BYTES of the file are loaded,
+    so the cost does not grow with the length of the issue body.
+    """
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(HEADER_BYTES)
+            size = f.seek(0, os.SEEK_END)
+            if size > HEADER_BYTES + TAIL_BYTES:
+                f.seek(-TAIL_BYTES, os.SEEK_END)
+                tail = f.read()
+            else:
+                f.seek(len(head))
+                tail = head + f.read()
+    except OSError:
+        return None
+    
+    head = head.decode('utf-8', errors='replace')
+    tail = tail.decode('utf-8', errors='replace')
+    heading = ISSUE_HEADING.search(head)
+    processed = PROCESSED_LINE.search(head)
+    return {
+        'title': heading.group(1).strip() if heading else None,
+        'processed': processed.group(1) if processed else None,
+        'status': _last_match(STATUS_LINE, tail),
+        'priority': _last_match(PRIORITY_LINE, tail)
+    }
+
+
+def issue_rank(header):
+    """Sort key for ranked sections: open first, then priority, then longest waiting."""
+    status = (header.get('status') or 'open').lower()
+    priority = (header.get('priority') or '').lower()
+    return (status in CLOSED_STATUSES,
+            PRIORITY_RANK.get(priority, len(PRIORITY_RANK)),
+            header.get('processed') or '9999-99-99')
+
+
+def _issue_entry(section_dir, dir_name, marker, header=None):
+    """Build a listing entry from an `<issue>-<slug>` directory name and optional header."""
+    parts = dir_name.split('-', 1)
+    issue_num = parts[0] if parts else "?"
+    title = parts[1].replace('-', ' ').title() if len(parts) > 1 else dir_name
+    entry = {
+        'issue': f"#{issue_num}",
+        'title': title,
+        'name': dir_name,
+        'path': os.path.join(section_dir, dir_name, marker)
+    }
+    if header:
+        entry['title'] = header['title'] or title
+        entry.update({key: header[key] for key in ('status', 'priority', 'processed')})
+    return entry
+
+
+def collect_issue_sections(cache=None, top_n=5, newest_n=3, names=None):
+    """Walk every issue section once and return counts, top-N and newest-N.
+
+    Each section directory is read with a single ``os.scandir``; the entry
+    stats are reused to validate cached listings of the issue directories,
+    so an unchanged issue costs no extra syscalls. Ranked sections read the
+    header of each issue document (cached by mtime/size) and keep the
+    highest-ranked N over the whole set.
+    """
+    cache = cache or ScanCache(enabled=False)
+    sections = {}
+    
+    for section in names or ISSUE_SECTIONS:
+        subpath, marker, ranked = ISSUE_SECTIONS[section]
+        section_dir = os.path.join(get_content_root(), *subpath)
+        count = 0
+        first = []   # bounded heap keeping the first N by rank (or name)
+        newest = []  # bounded heap keeping the newest N by mtime
+        
+        try:
+            with os.scandir(section_dir) as it:
+                entries = [entry for entry in it if entry.is_dir()]
+        except OSError:
+            entries = []
+        
+        for entry in entries:
+            mtime = entry.stat().st_mtime_ns
+            if (marker, False) not in cache.list_dir(entry.path, mtime):
+                continue
+            count += 1
+            key, header = entry.name, None
+            if ranked:
+                header = cache.read(os.path.join(entry.path, marker), read_issue_header, 'issue-header') or {}
+                key = (issue_rank(header), entry.name)
+            _push_bounded(first, _Reversed(key, entry.name, header), top_n)
+            _push_bounded(newest, (mtime, entry.name), newest_n)
+        
+        sections[section] = {
+            'count': count,
+            'top': [_issue_entry(section_dir, item.name, marker, item.header)
+                    for item in sorted(first, reverse=True)],
+            'newest': [_issue_entry(section_dir, name, marker)
+                       for _, name in sorted(newest, reverse=True)]
+        }
+    
+    return sections
+
+
+def get_bugs_summary(cache=None, sections=None):
     """Get summary of open bugs."""
-    bugs_dir = "bugs"
-    if not os.path.exists(bugs_dir):
-        return []
-    
-    bugs = []
-    for bug_dir in sorted(glob.glob(f"{bugs_dir}/*")):
-        if os.path.isdir(bug_dir):
-            bug_file = os.path.join(bug_dir, "bug-report.md")
-            if os.path.exists(bug_file):
-                # Extract issue number and title from directory name
-                dir_name = os.path.basename(bug_dir)
-                parts = dir_name.split('-', 1)
-                issue_num = parts[0] if parts else "?"
-                title = parts[1].replace('-', ' ').title() if len(parts) > 1 else dir_name
-                
-                bugs.append({
-                    'issue': f"#{issue_num}",
-                    'title': title,
-                    'path': bug_file
-                })
-    
-    return bugs[:5]  # Top 5 bugs
-
-
-def get_questions_summary():
+    sections = sections or collect_issue_sections(cache)
+    return sections['bugs']['top']  # Top 5 bugs
+
+
+def get_questions_summary(cache=None, sections=None):
     """Get summary of open questions."""
-    questions_dir = "questions"
-    if not os.path.exists(questions_dir):
-        return []
-    
-    questions = []
-    for q_dir in sorted(glob.glob(f"{questions_dir}/*")):
-        if os.path.isdir(q_dir):
-            q_file = os.path.join(q_dir, "question.md")
-            if os.path.exists(q_file):
-                # Extract issue number and title from directory name
-                dir_name = os.path.basename(q_dir)
-                parts = dir_name.split('-', 1)
-                issue_num = parts[0] if parts else "?"
-                title = parts[1].replace('-', ' ').title() if len(parts) > 1 else dir_name
-                
-                questions.append({
-                    'issue': f"#{issue_num}",
-                    'title': title,
-                    'path': q_file
-                })
-    
-    return questions[:5]  # Top 5 questions
-
-
-def get_current_sprint():
+    sections = sections or collect_issue_sections(cache)
+    return sections['questions']['top']  # Top 5 questions
+
+
+def get_current_sprint(cache=None):
     """Get current sprint from roadmap."""
-    roadmap_file = "templates/roadmap.md"
-    if not os.path.exists(roadmap_file):
+    index = RoadmapIndex.load(ROADMAP_FILE, cache)
+    in_progress = index.phases_by_status('IN PROGRESS')
+    if not in_progress:
         return None
     
-    try:
-        with open(roadmap_file, 'r') as f:
-            content = f.read()
-        
-        # Look for IN PROGRESS phase
-        import re
-        # Try different IN PROGRESS patterns  
-        patterns = [
-            r'### Phase (\d+):\s*([^=\n]+)\s*[=⏳🔄]\s*\*\*IN PROGRESS\*\*(.*?)(?=###|\Z)'
-        ]
-        
-        match = None
-        for pattern in patterns:
-            match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-            if match:
-                break
-                
-        if match:
-            phase_num = match.group(1)
-            phase_title = match.group(2).strip()
-            phase_content = match.group(3)
-            
-            # Extract duration
-            duration_match = re.search(r'\*\*Duration\*\*:\s*([^\n]+)', phase_content)
-            duration = duration_match.group(1) if duration_match else "Unknown"
-            
-            return {
-                'phase': phase_num,
-                'title': phase_title,
-                'duration': duration.strip()
-            }
-    except:
-        pass
+    current = in_progress[0]
+    return {
+        'phase': current['phase'],
+        'title': current['title'],
+        'duration': current['duration'],
+        'also_in_progress': [phase['phase'] for phase in in_progress[1:]]
+    }
+
+
+CORE_DOCS = [
+    "templates/system-spec.md",
+    ROADMAP_FILE,
+    "templates/agent-spec.md",
+    "CLAUDE.md"
+]
+
+
+def collect_core_docs(cache):
+    """Collect changelog and staleness status for the core documents."""
+    docs = []
+    for doc in CORE_DOCS:
+        if os.path.exists(doc):
+            last_update, issue = get_changelog_info(doc, cache)
+            age = get_file_age(doc, last_update)
+            docs.append({
+                'name': os.path.basename(doc).replace('.md', ''),
+                'path': doc,
+                'last_update': last_update,
+                'issue': issue,
+                'age_days': age,
+                'status': get_staleness_indicator(age)
+            })
+    return docs
+
+
+def collect_staleness(cache):
+    """Collect age histograms for every Markdown document in the tree."""
+    return compute_staleness(cache=cache)
+
+
+def collect_sprint(cache):
+    """Collect the current sprint from the roadmap."""
+    return get_current_sprint(cache)
+
+
+def _issue_collector(name):
+    def collect(cache):
+        return collect_issue_sections(cache, names=[name])[name]
+    collect.__doc__ = f"Collect the {name} issue section."
+    return collect
+
+
+# Section collectors, in display order. Each takes a ScanCache and returns
+# JSON-serializable data; they share no state besides the cache.
+COLLECTORS = {
+    'core_docs': collect_core_docs,
+    'staleness': collect_staleness,
+    'sprint': collect_sprint,
+    'bugs': _issue_collector('bugs'),
+    'questions': _issue_collector('questions'),
+    'features': _issue_collector('features'),
+    'updates': _issue_collector('updates'),
+}
+
+
+def collect_state(cache=None, sections=None, max_workers=None):
+    """Run the section collectors concurrently and return the structured state."""
+    cache = cache or ScanCache()
+    names = sections or list(COLLECTORS)
     
-    return None
+    with ThreadPoolExecutor(max_workers=max_workers or len(names)) as pool:
+        futures = {name: pool.submit(COLLECTORS[name], cache) for name in names}
+        results = {name: futures[name].result() for name in names}
+    
+    return {
+        'generated': datetime.now().strftime('%Y-%m-%d %H:%M'),
+        'sections': results
+    }
+
 
+def generate_summary(cache=None, output_format='markdown', out=None, output_path=None):
+    """Generate the documentation state summary.
 
-def generate_summary():
-    """Generate the documentation state summary."""
-    print("# 📊 Documentation State Summary")
-    print(f"\n*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*\n")
+    Written atomically to output_path, with links relative to it, when
+    given; otherwise to out (default stdout) with links relative to the
+    working directory.
+    """
+    start = time.perf_counter()
+    cache = cache or ScanCache()
+    out = out or sys.stdout
     
-    # Core Documentation Status
-    print("## 📚 Core Documentation Status\n")
-    print("| Document | Last Update | Age | Status | Link |")
-    print("|----------|-------------|-----|--------|------|")
+    state = collect_state(cache)
+    if output_path:
+        write_file_atomic(output_path, RENDERERS[output_format](state, os.path.dirname(output_path)))
+    else:
+        out.write(RENDERERS[output_format](state))
     
-    core_docs = [
-        "templates/system-spec.md",
-        "templates/roadmap.md",
-        "templates/agent-spec.md",
-        "CLAUDE.md"
-    ]
+    cache.save()
     
-    for doc in core_docs:
-        if os.path.exists(doc):
-            last_update, issue = get_changelog_info(doc)
-            age = get_file_age(doc, last_update)
-            status = get_staleness_indicator(age)
-            update_str = f"{last_update} ({issue})" if last_update else "No changelog"
+    # Timing goes to stderr so the summary itself can be redirected to a file
+    DASHBOARD_LATENCY.observe(time.perf_counter() - start)
+    DASHBOARD_SECTIONS.set(len(state['sections']))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"⏱️ Summary generated in {elapsed_ms:.1f}ms - "
+          f"cache: {cache.hits} hits, {cache.misses} misses "
+          f"({cache.hit_ratio():.0%} served from cache, "
+          f"{cache.miss_seconds * 1000:.1f}ms re-reading changes)", file=sys.stderr)
+    return state
+
+
+DEFAULT_OUTPUT = os.path.join(get_content_root(), 'Technical', 'Documentation-State.md')
+
+
+def _stat_key(path):
+    """(mtime, size) of a path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def section_signature(name):
+    """Cheap fingerprint of the files a section depends on.
+
+    A section only needs regenerating when its signature changes. Issue
+    sections stat their directory and each issue directory (a new or
+    replaced marker file bumps the issue directory's mtime); ranked sections
+    also stat the marker file, since its Status/Priority can be edited in place.
+    """
+    if name in ISSUE_SECTIONS:
+        subpath, marker, ranked = ISSUE_SECTIONS[name]
+        section_dir = os.path.join(get_content_root(), *subpath)
+        try:
+            with os.scandir(section_dir) as it:
+                children = sorted((entry.name, entry.stat().st_mtime_ns,
+                                   _stat_key(os.path.join(entry.path, marker)) if ranked else None)
+                                  for entry in it if entry.is_dir())
+        except OSError:
+            return None
+        return (_stat_key(section_dir), tuple(children))
+    if name == 'sprint':
+        return _stat_key(ROADMAP_FILE)
+    if name == 'staleness':
+        # Every document and changelog the scan reads, by (mtime, size): an
+        # in-place save changes the file but not its directory's mtime.
+        # Ages are in days, so the date is part of the signature too
+        directories = []
+        stack = [root for root in DEFAULT_ROOTS if os.path.isdir(root)]
+        while stack:
+            directory = stack.pop()
+            files = []
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not entry.name.startswith('.'):
+                                stack.append(entry.path)
+                        elif entry.name.endswith(('.md', '-changelog.yaml')):
+                            try:
+                                st = entry.stat()
+                            except OSError:
+                                continue
+                            files.append((entry.name, st.st_mtime_ns, st.st_size))
+            except OSError:
+                continue
+            directories.append((directory, tuple(sorted(files))))
+        return (datetime.now().date(), tuple(sorted(directories)))
+    if name == 'core_docs':
+        # Each document and its changelog by (mtime, size), plus the date for the ages
+        return (datetime.now().date(),) + tuple(
+            (_stat_key(doc), _stat_key(doc.replace('.md', '-changelog.yaml')))
+            for doc in CORE_DOCS)
+    return None
+
+
+# Seconds between signature checks per section in watch mode, where slower
+# than the poll interval: the staleness signature stats every document
+SIGNATURE_INTERVALS = {'staleness': 5.0}
+
+
+def watch(output_path=DEFAULT_OUTPUT, output_format='markdown', interval=0.5, debounce=1.0,
+          cache=None):
+    """Poll the Content tree and regenerate changed sections of the summary.
+
+    Changes are debounced: regeneration waits until no further change has
+    been seen for `debounce` seconds. Only the sections whose signatures
+    changed are re-collected; the file is always rewritten atomically.
+    """
+    cache = cache or ScanCache()
+    render = RENDERERS[output_format]
+    base_dir = os.path.dirname(output_path)
+    signatures = {name: section_signature(name) for name in COLLECTORS}
+    checked = dict.fromkeys(COLLECTORS, time.monotonic())
+    
+    state = collect_state(cache)
+    write_file_atomic(output_path, render(state, base_dir))
+    cache.save()
+    print(f"👀 Watching for changes - writing {output_path} (Ctrl+C to stop)", file=sys.stderr)
+    
+    pending = set()
+    last_change = 0.0
+    try:
+        while True:
+            time.sleep(interval)
+            for name in COLLECTORS:
+                now = time.monotonic()
+                if now - checked[name] < SIGNATURE_INTERVALS.get(name, 0):
+                    continue
+                checked[name] = now
+                signature = section_signature(name)
+                if signature != signatures[name]:
+                    signatures[name] = signature
+                    pending.add(name)
+                    last_change = time.monotonic()
             
-            doc_name = os.path.basename(doc).replace('.md', '')
-            print(f"| {doc_name} | {update_str} | {age}d | {status} | [{doc}]({doc}) |")
-    
-    # Current Sprint
-    print("\n## 🏃 Current Sprint\n")
-    sprint = get_current_sprint()
-    if sprint:
-        print(f"**Phase {sprint['phase']}**: {sprint['title']}")
-        print(f"- **Duration**: {sprint['duration']}")
-        print(f"- **Details**: [View Roadmap](templates/roadmap.md#phase-{sprint['phase']})")
-    else:
-        print("*No active sprint found in roadmap*")
-    
-    # Open Bugs
-    print("\n## 🐛 Open Bugs\n")
-    bugs = get_bugs_summary()
-    if bugs:
-        for bug in bugs:
-            print(f"- {bug['issue']}: {bug['title']} ([view]({bug['path']}))")
-        
-        total_bugs = len(glob.glob("bugs/*"))
-        if total_bugs > 5:
-            print(f"\n*...and {total_bugs - 5} more bugs*")
-    else:
-        print("*No open bugs found*")
-    
-    # Open Questions
-    print("\n## ❓ Open Questions\n")
-    questions = get_questions_summary()
-    if questions:
-        for q in questions:
-            print(f"- {q['issue']}: {q['title']} ([view]({q['path']}))")
-        
-        total_questions = len(glob.glob("questions/*"))
-        if total_questions > 5:
-            print(f"\n*...and {total_questions - 5} more questions*")
+            if not pending or time.monotonic() - last_change < debounce:
+                continue
+            
+            start = time.perf_counter()
+            updated = collect_state(cache, sorted(pending))
+            state['sections'].update(updated['sections'])
+            state['generated'] = updated['generated']
+            write_file_atomic(output_path, render(state, base_dir))
+            cache.save()
+            # Long-running: publish metrics after every regeneration, not just at exit
+            DASHBOARD_LATENCY.observe(time.perf_counter() - start)
+            get_registry().flush()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"🔄 Regenerated {', '.join(sorted(pending))} in {elapsed_ms:.1f}ms", file=sys.stderr)
+            pending.clear()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--format', choices=sorted(RENDERERS), default='markdown',
+                        help="Output format (default: markdown)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Ignore the scan cache and re-read everything")
+    parser.add_argument('--watch', action='store_true',
+                        help="Keep running and regenerate the summary file on change")
+    parser.add_argument('--output',
+                        help="Write the summary to this file instead of stdout "
+                             f"(watch mode default: {DEFAULT_OUTPUT})")
+    parser.add_argument('--interval', type=float, default=0.5,
+                        help="Watch mode poll interval in seconds (default: 0.5)")
+    parser.add_argument('--debounce', type=float, default=1.0,
+                        help="Quiet period before regenerating in watch mode (default: 1.0)")
+    args = parser.parse_args()
+    
+    cache = ScanCache(enabled=not args.no_cache)
+    if args.watch:
+        watch(args.output or DEFAULT_OUTPUT, args.format, args.interval, args.debounce, cache)
     else:
-        print("*No open questions found*")
-    
-    # Recent Processing
-    print("\n## 🔄 Recent Issue Processing\n")
-    
-    # Check for recent feature proposals
-    features = sorted(glob.glob("features/proposed/*"), key=os.path.getmtime, reverse=True)[:3]
-    if features:
-        print("### Latest Features")
-        for feature in features:
-            dir_name = os.path.basename(feature)
-            parts = dir_name.split('-', 1)
-            issue_num = parts[0] if parts else "?"
-            print(f"- #{issue_num}: {os.path.basename(feature)} ([view]({feature}/README.md))")
-    
-    # Check for recent documentation updates
-    doc_updates = sorted(glob.glob("current-state-updates/*"), key=os.path.getmtime, reverse=True)[:3]
-    if doc_updates:
-        print("\n### Latest Documentation Updates")
-        for update in doc_updates:
-            dir_name = os.path.basename(update)
-            parts = dir_name.split('-', 1)
-            issue_num = parts[0] if parts else "?"
-            print(f"- #{issue_num}: {os.path.basename(update)} ([view]({update}/analysis.md))")
-    
-    print("\n---")
-    print("\n*Use `gdocs` alias to pull latest issues and regenerate this summary*")
+        generate_summary(cache, args.format, output_path=args.output)
 
 
 if __name__ == "__main__":
-    generate_summary()
\ No newline at end of file
+    main()
@@ -6,8 +6,10 @@ import sys
 import shutil
 from datetime import datetime
 from Processors.shared_utils import ensure_directory, get_content_root
+from Processors.search_index import record_change
+from roadmap_index import RoadmapIndex
 
-def update_status_file(status_path):
+def update_status_file(status_path, roadmap_index=None):
     """Update the status.md file to reflect roadmap inclusion."""
     with open(status_path, 'r') as f:
         content = f.read()
@@ -17,68 +19,130 @@ def update_status_file(status_path):
     
     # Add migration timestamp
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    moved_line = f'Moved to roadmap: {timestamp}'
+    
+    # Record which phase was active when the feature was approved
+    current_phase = (roadmap_index or RoadmapIndex.load()).current_phase()
+    if current_phase:
+        moved_line += f" (during Phase {current_phase['phase']}: {current_phase['title']})"
+    
     roadmap_section = '## Roadmap Integration'
     if roadmap_section in content:
         content = content.replace(
             roadmap_section,
-            f'## Roadmap Integration\nMoved to roadmap: {timestamp}'
+            f'## Roadmap Integration\n{moved_line}'
         )
     
     with open(status_path, 'w') as f:
         f.write(content)
 
-def move_to_roadmap(feature_number):
-    """Move an approved feature to the roadmap directory."""
-    features_dir = os.path.join(get_content_root(), 'Issues', 'Features-Proposed')
-    roadmap_dir = 'content/planning/roadmap'
-    
-    # Find feature directory
-    feature_dir = None
-    for d in os.listdir(features_dir):
-        if d.startswith(str(feature_number) + '-'):
-            feature_dir = d
-            break
-    
+ROADMAP_DIR = 'content/planning/roadmap'
+
+
+def _features_dir():
+    return os.path.join(get_content_root(), 'Issues', 'Features-Proposed')
+
+
+def _list_features(features_dir):
+    """Map feature number -> directory name for every `<number>-<slug>` folder."""
+    features = {}
+    try:
+        with os.scandir(features_dir) as it:
+            for entry in it:
+                number, _, slug = entry.name.partition('-')
+                if slug and number.isdigit() and entry.is_dir():
+                    features.setdefault(int(number), entry.name)
+    except OSError:
+        pass
+    return features
+
+
+def _promote(feature_number, feature_dir, features_dir, roadmap_dir, roadmap_index):
+    """Move one feature folder; returns a result dict. The caller records the move in the search index."""
+    result = {'feature': feature_number, 'success': False, 'source': None, 'target': None, 'error': None}
     if not feature_dir:
-        print(f"❌ Error: Feature #{feature_number} not found")
-        sys.exit(1)
-    
+        result['error'] = f"Feature #{feature_number} not found"
+        return result
+
     source_path = os.path.join(features_dir, feature_dir)
     target_path = os.path.join(roadmap_dir, feature_dir)
-    
-    # Check if feature exists
-    if not os.path.exists(source_path):
-        print(f"❌ Error: Feature directory not found: {source_path}")
-        sys.exit(1)
-    
-    # Check if already in roadmap
+    result['source'], result['target'] = source_path, target_path
+
     if os.path.exists(target_path):
-        print(f"❌ Error: Feature already exists in roadmap: {target_path}")
-        sys.exit(1)
-    
-    # Update status.md
-    status_path = os.path.join(source_path, 'status.md')
-    if os.path.exists(status_path):
-        update_status_file(status_path)
-    
-    # Move to roadmap directory
+        result['error'] = f"Feature already exists in roadmap: {target_path}"
+        return result
+
+    try:
+        status_path = os.path.join(source_path, 'status.md')
+        if os.path.exists(status_path):
+            update_status_file(status_path, roadmap_index)
+        shutil.move(source_path, target_path)
+    except (IOError, OSError) as e:
+        result['error'] = str(e)
+        return result
+
+    result['success'] = True
+    return result
+
+
+def promote_features(feature_numbers, roadmap_dir=ROADMAP_DIR, roadmap_index=None):
+    """Move approved features to the roadmap directory in one pass.
+
+    The proposed-features folder is listed once, the roadmap index is
+    loaded once for all status updates, and the moves are recorded in the
+    search index journal once at the end. Never exits; returns one result
+    dict per feature with 'feature', 'success', 'source', 'target' and
+    'error' (None on success).
+    """
+    features_dir = _features_dir()
+    features = _list_features(features_dir)
+    roadmap_index = roadmap_index or RoadmapIndex.load()
     ensure_directory(roadmap_dir)
-    shutil.move(source_path, target_path)
-    
-    print(f"✅ Moved feature #{feature_number} to roadmap")
-    print(f"📍 New location: {target_path}")
-    return True
+
+    results = [_promote(number, features.get(number), features_dir, roadmap_dir, roadmap_index)
+               for number in feature_numbers]
+    moved = [path for result in results if result['success'] for path in (result['source'], result['target'])]
+    if moved:
+        record_change(*moved)
+    return results
+
+
+def promote_feature(feature_number, roadmap_dir=ROADMAP_DIR, roadmap_index=None):
+    """Move one approved feature to the roadmap directory; returns its result dict."""
+    return promote_features([feature_number], roadmap_dir, roadmap_index)[0]
+
+
+def print_result(result):
+    if result['success']:
+        print(f"✅ Moved feature #{result['feature']} to roadmap")
+        print(f"📍 New location: {result['target']}")
+    else:
+        print(f"❌ Error: {result['error']}")
+
+
+def move_to_roadmap(feature_number):
+    """Move an approved feature to the roadmap directory and report it; returns success."""
+    result = promote_feature(feature_number)
+    print_result(result)
+    return result['success']
+
 
 if __name__ == '__main__':
-    if len(sys.argv) != 2:
-        print("Usage: feature_to_roadmap.py <feature_number>")
+    if len(sys.argv) < 2:
+        print("Usage: feature_to_roadmap.py <feature_number> [feature_number ...]")
         print("Example: feature_to_roadmap.py 42")
+        print("         feature_to_roadmap.py 42 43 57   # Bulk promotion")
         sys.exit(1)
     
     try:
-        feature_number = int(sys.argv[1])
+        feature_numbers = [int(arg) for arg in sys.argv[1:]]
     except ValueError:
         print("❌ Error: Feature number must be an integer")
         sys.exit(1)
     
-    move_to_roadmap(feature_number)
\ No newline at end of file
+    results = promote_features(feature_numbers)
+    for result in results:
+        print_result(result)
+    
+    if not all(result['success'] for result in results):
+        sys.exit(1)
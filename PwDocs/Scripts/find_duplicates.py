@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Find likely duplicate issues with the MinHash/LSH duplicate index."""
+
+import sys
+import time
+from Processors.duplicate_detector import DuplicateIndex, get_duplicate_mode, get_duplicate_threshold
+
+
+def print_usage():
+    print("Usage:")
+    print("  find_duplicates.py build                   # Sign every issue under Content/Issues")
+    print("  find_duplicates.py check <title> [body]    # Likely duplicates of an issue")
+    print("  find_duplicates.py status                  # Index size and settings")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print_usage()
+        sys.exit(1)
+
+    action = sys.argv[1]
+    index = DuplicateIndex()
+
+    if action == 'build':
+        start = time.perf_counter()
+        added = index.build()
+        print(f"✅ Signed {added} issue(s) in {(time.perf_counter() - start) * 1000:.0f}ms "
+              f"({index.count()} in index)")
+
+    elif action == 'check':
+        if len(sys.argv) < 3:
+            print_usage()
+            sys.exit(1)
+        title = sys.argv[2]
+        body = sys.argv[3] if len(sys.argv) > 3 else ''
+        start = time.perf_counter()
+        matches = index.find(title, body)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if not matches:
+            print(f"No likely duplicates of '{title}'")
+        for match in matches:
+            print(f"{match['similarity']:4.0%}  #{match['number']} {match['title']}")
+        print(f"\n🔁 {len(matches)} match(es) in {elapsed_ms:.2f}ms", file=sys.stderr)
+
+    elif action == 'status':
+        print(f"issues: {index.count()}")
+        print(f"mode: {get_duplicate_mode()}")
+        print(f"threshold: {get_duplicate_threshold()}")
+
+    else:
+        print(f"❌ Error: Invalid action '{action}'")
+        print_usage()
+        sys.exit(1)
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""In-process GitHub REST client for issues, labels and comments."""
+
+import os
+import json
+import time
+import threading
+import requests
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from Processors.shared_utils import get_cache_dir, write_file_atomic
+from Processors.metrics import CACHE_REQUESTS, GITHUB_LATENCY, GITHUB_REQUESTS, RETRIES
+
+DEFAULT_API_URL = "https://api.github.com"
+DEFAULT_REPO = "tmcfar/plotweaver-docs"
+
+
+def get_backend():
+    """Which GitHub backend the label scripts use: 'gh' (CLI, default) or 'api'."""
+    return os.environ.get('PWDOCS_GITHUB_BACKEND', 'gh')
+
+
+def retry_after_seconds(value, default):
+    """Seconds to wait for a Retry-After header: delay-seconds or an HTTP-date.
+
+    Falls back to `default` when the value is neither.
+    """
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError):
+        return default
+
+
+class GitHubAPIError(Exception):
+    """A GitHub API request failed."""
+
+    def __init__(self, status_code, message):
+        super().__init__(f"GitHub API error {status_code}: {message}")
+        self.status_code = status_code
+
+
+class GitHubClient:
+    """Pooled GitHub REST client with ETag caching and rate-limit handling.
+
+    GET responses are stored with their ETag and revalidated with
+    If-None-Match; a 304 is served from the cache and does not count
+    against the rate limit. The X-RateLimit-* headers of every response are
+    tracked, and requests wait for the reset when the budget is exhausted.
+    `base_url` (or GITHUB_API_URL) can point at a local fake server. With a
+    scheduler, every response also adapts its 'github' backend; retries
+    stay here, the scheduler does not re-queue GitHub calls.
+    """
+
+    def __init__(self, repo=None, token=None, base_url=None, cache_path=None,
+                 pool_size=16, max_rate_limit_wait=60, max_retries=3, scheduler=None):
+        self.repo = repo or os.environ.get('GITHUB_REPOSITORY', DEFAULT_REPO)
+        self.base_url = (base_url or os.environ.get('GITHUB_API_URL', DEFAULT_API_URL)).rstrip('/')
+        self.cache_path = cache_path or os.path.join(get_cache_dir(), 'github-etags.json')
+        self.max_rate_limit_wait = max_rate_limit_wait
+        self.max_retries = max_retries
+        self.scheduler = scheduler
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Accept': 'application/vnd.github+json',
+            'X-GitHub-Api-Version': '2022-11-28'
+        })
+        token = token or os.environ.get('GITHUB_TOKEN') or os.environ.get('GH_TOKEN')
+        if token:
+            self.session.headers['Authorization'] = f"Bearer {token}"
+
+        self.rate_limit = {'limit': None, 'remaining': None, 'reset': None}
+        self.stats = {'requests': 0, 'cache_hits': 0, 'rate_limit_waits': 0}
+        self._etags = self._load_cache()
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, 'r') as f:
+                return json.load(f)
+        except (IOError, ValueError):
+            return {}
+
+    def save_cache(self):
+        """Persist the ETag response cache."""
+        if not self._dirty:
+            return
+        with self._lock:
+            content = json.dumps(self._etags, separators=(',', ':'))
+            self._dirty = False
+        write_file_atomic(self.cache_path, content)
+
+    def _update_rate_limit(self, response):
+        headers = response.headers
+        if 'X-RateLimit-Remaining' not in headers:
+            return
+        with self._lock:
+            self.rate_limit = {
+                'limit': int(headers.get('X-RateLimit-Limit', 0)),
+                'remaining': int(headers['X-RateLimit-Remaining']),
+                'reset': int(headers.get('X-RateLimit-Reset', 0))
+            }
+
+    def _wait(self, seconds):
+        wait = min(max(seconds, 0), self.max_rate_limit_wait)
+        if wait > 0:
+            self.stats['rate_limit_waits'] += 1
+            print(f"⏳ GitHub rate limit reached - waiting {wait:.0f}s")
+            time.sleep(wait)
+
+    def _wait_for_budget(self):
+        """Block until the rate-limit window resets if the budget is used up."""
+        remaining, reset = self.rate_limit['remaining'], self.rate_limit['reset']
+        if remaining == 0 and reset:
+            self._wait(reset - time.time() + 1)
+
+    def request(self, method, path, params=None, json_body=None):
+        """Send a request and return (decoded JSON body, response)."""
+        url = f"{self.base_url}{path}"
+        cache_key = url + ('?' + '&'.join(f"{k}={v}" for k, v in sorted(params.items())) if params else '')
+
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_budget()
+            headers = {}
+            cached = self._etags.get(cache_key) if method == 'GET' else None
+            if cached:
+                headers['If-None-Match'] = cached['etag']
+
+            with GITHUB_LATENCY.time(method=method):
+                response = self.session.request(method, url, params=params, json=json_body,
+                                                headers=headers, timeout=30)
+            self.stats['requests'] += 1
+            GITHUB_REQUESTS.inc(method=method, status=response.status_code)
+            self._update_rate_limit(response)
+            if self.scheduler:
+                self.scheduler.observe('github', response)
+
+            if response.status_code == 304 and cached:
+                self.stats['cache_hits'] += 1
+                CACHE_REQUESTS.inc(cache='github_etag', result='hit')
+                return cached['body'], response
+            if method == 'GET':
+                CACHE_REQUESTS.inc(cache='github_etag', result='miss')
+
+            # Primary and secondary rate limits: back off and retry
+            if response.status_code in (403, 429) and attempt < self.max_retries and (
+                    'Retry-After' in response.headers or self.rate_limit['remaining'] == 0):
+                retry_after = response.headers.get('Retry-After')
+                if retry_after:
+                    self._wait(retry_after_seconds(retry_after, 2 ** attempt))
+                RETRIES.inc(component='github_client', backend='github')
+                continue
+
+            if response.status_code >= 400:
+                try:
+                    message = response.json().get('message', response.text)
+                except ValueError:
+                    message = response.text
+                raise GitHubAPIError(response.status_code, message)
+
+            body = response.json() if response.content else None
+            etag = response.headers.get('ETag')
+            if method == 'GET' and etag:
+                with self._lock:
+                    self._etags[cache_key] = {'etag': etag, 'body': body}
+                    self._dirty = True
+            return body, response
+
+        raise GitHubAPIError(response.status_code, "rate limited after retries")
+
+    def _paginate(self, path, params):
+        """Yield items from every page of a list endpoint."""
+        params = dict(params)
+        page = 1
+        while True:
+            params['page'] = page
+            items, response = self.request('GET', path, params=params)
+            yield from items or []
+            if 'rel="next"' not in response.headers.get('Link', ''):
+                return
+            page += 1
+
+    # Issues
+
+    def get_issue(self, issue_number):
+        return self.request('GET', f"/repos/{self.repo}/issues/{issue_number}")[0]
+
+    def list_issues(self, state='all', labels=None, since=None, per_page=100):
+        """Yield issues (newest update first), optionally filtered by labels or `since`."""
+        params = {'state': state, 'per_page': per_page, 'sort': 'updated', 'direction': 'desc'}
+        if labels:
+            params['labels'] = ','.join(labels)
+        if since:
+            params['since'] = since
+        return self._paginate(f"/repos/{self.repo}/issues", params)
+
+    # Labels
+
+    def get_labels(self, issue_number):
+        return self.request('GET', f"/repos/{self.repo}/issues/{issue_number}/labels")[0]
+
+    def add_labels(self, issue_number, labels):
+        """Add several labels to an issue in one request."""
+        return self.request('POST', f"/repos/{self.repo}/issues/{issue_number}/labels",
+                            json_body={'labels': list(labels)})[0]
+
+    def remove_label(self, issue_number, label):
+        return self.request('DELETE', f"/repos/{self.repo}/issues/{issue_number}/labels/"
+                            f"{requests.utils.quote(label, safe='')}")[0]
+
+    # Comments
+
+    def add_comment(self, issue_number, body):
+        return self.request('POST', f"/repos/{self.repo}/issues/{issue_number}/comments",
+                            json_body={'body': body})[0]
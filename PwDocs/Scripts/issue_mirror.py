@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""Local SQLite mirror of GitHub issue metadata, kept current by incremental sync."""
+
+import os
+import re
+import sys
+import json
+import time
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor
+from Processors.shared_utils import ensure_directory, get_cache_dir
+from github_client import GitHubClient
+
+LAST_PAGE = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    number INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    state TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS issue_labels (
+    number INTEGER NOT NULL,
+    label TEXT NOT NULL,
+    PRIMARY KEY (number, label)
+);
+CREATE INDEX IF NOT EXISTS issue_labels_label ON issue_labels (label, number);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _last_page(response):
+    """Number of the last page from a Link header (1 when there is a single page)."""
+    match = LAST_PAGE.search(response.headers.get('Link', ''))
+    return int(match.group(1)) if match else 1
+
+
+def _server_time(response):
+    """The response's Date header as a GitHub timestamp, falling back to the local clock."""
+    try:
+        moment = parsedate_to_datetime(response.headers['Date'])
+    except (KeyError, TypeError, ValueError):
+        moment = datetime.now(timezone.utc)
+    return moment.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class IssueMirror:
+    """Offline copy of issue number, title, labels, state and updated-at.
+
+    `sync()` asks GitHub only for issues updated since the newest
+    `updated_at` already mirrored. The first page reveals the page count;
+    the remaining pages are fetched concurrently over the pooled client.
+    The watermark only advances when the listing provably did not shift
+    while it was being paged. Pass a client with `base_url` pointing at a
+    fake server to test it.
+    """
+
+    def __init__(self, db_path=None, client=None):
+        self.db_path = db_path or os.path.join(get_cache_dir(), 'issues.sqlite3')
+        self.client = client
+        ensure_directory(os.path.dirname(self.db_path))
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    def _get_meta(self, conn, key):
+        row = conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row['value'] if row else None
+
+    def watermark(self):
+        """The newest updated_at mirrored so far, or None before the first sync."""
+        with closing(self._connect()) as conn:
+            return self._get_meta(conn, 'watermark')
+
+    def sync(self, full=False, max_workers=8, per_page=100):
+        """Fetch issues changed since the watermark (or all of them) and upsert them.
+
+        Returns a dict with the number of issues and pages fetched, the
+        `since` used, whether the watermark advanced and the elapsed time.
+        """
+        start = time.perf_counter()
+        self.client = self.client or GitHubClient()
+        since = None if full else self.watermark()
+
+        path = f"/repos/{self.client.repo}/issues"
+        params = {'state': 'all', 'per_page': per_page, 'sort': 'updated', 'direction': 'asc'}
+        if since:
+            params['since'] = since
+
+        def fetch(page):
+            items, response = self.client.request('GET', path, params=dict(params, page=page))
+            return items or [], response
+
+        first, response = fetch(1)
+        started = _server_time(response)
+        pages = [first]
+        last = _last_page(response)
+        unshifted = True
+        if last > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                pages += [items for items, _ in pool.map(fetch, range(2, last + 1))]
+            # Offset pages over a list sorted by updated_at are not a snapshot: an issue
+            # edited mid-sync jumps to the end and everything after its old slot moves
+            # back one, so an issue crossing into an already-fetched page is never seen.
+            # Such an edit leaves an updated_at at or after the first response, either in
+            # the pages or, if it came after the last page was read, in a re-read of that
+            # page (a 304 when nothing changed). If either shows one, hold the watermark so
+            # the next sync asks for the same window again.
+            tail, _ = fetch(last)
+            unshifted = tail == pages[-1] and all(
+                item['updated_at'] < started for items in pages for item in items)
+        self.client.save_cache()
+
+        issues = [item for items in pages for item in items if 'pull_request' not in item]
+        self._store(issues, advance=unshifted)
+
+        return {
+            'issues': len(issues),
+            'pages': last,
+            'since': since,
+            'advanced': unshifted and bool(issues),
+            'elapsed_ms': (time.perf_counter() - start) * 1000
+        }
+
+    def _store(self, issues, advance=True):
+        """Upsert issues and replace their labels; move the watermark to the newest if `advance`."""
+        if not issues:
+            return
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO issues (number, title, state, updated_at) VALUES (?, ?, ?, ?)',
+                [(item['number'], item['title'], item['state'], item['updated_at']) for item in issues])
+            numbers = [(item['number'],) for item in issues]
+            conn.executemany('DELETE FROM issue_labels WHERE number = ?', numbers)
+            conn.executemany(
+                'INSERT OR IGNORE INTO issue_labels (number, label) VALUES (?, ?)',
+                [(item['number'], label['name']) for item in issues for label in item.get('labels', [])])
+
+            if not advance:
+                return
+            newest = max(item['updated_at'] for item in issues)
+            current = self._get_meta(conn, 'watermark')
+            if current is None or newest > current:
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('watermark', ?)", (newest,))
+
+    # Queries
+
+    def _rows_to_issues(self, conn, rows):
+        labels = {}
+        numbers = [row['number'] for row in rows]
+        for i in range(0, len(numbers), 500):
+            chunk = numbers[i:i + 500]
+            marks = ','.join('?' * len(chunk))
+            for number, label in conn.execute(
+                    f'SELECT number, label FROM issue_labels WHERE number IN ({marks})', chunk):
+                labels.setdefault(number, []).append(label)
+        return [dict(row, labels=sorted(labels.get(row['number'], []))) for row in rows]
+
+    def get(self, issue_number):
+        """One mirrored issue as a dict, or None."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute('SELECT * FROM issues WHERE number = ?', (int(issue_number),)).fetchall()
+            issues = self._rows_to_issues(conn, rows)
+        return issues[0] if issues else None
+
+    def query(self, label=None, state=None):
+        """Mirrored issues (newest update first), optionally filtered by one label and state."""
+        sql = 'SELECT issues.* FROM issues'
+        clauses, args = [], []
+        if label:
+            sql += ' JOIN issue_labels ON issue_labels.number = issues.number'
+            clauses.append('issue_labels.label = ?')
+            args.append(label)
+        if state:
+            clauses.append('issues.state = ?')
+            args.append(state)
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        sql += ' ORDER BY issues.updated_at DESC, issues.number DESC'
+        with closing(self._connect()) as conn:
+            return self._rows_to_issues(conn, conn.execute(sql, args).fetchall())
+
+    def labels_by_issue(self):
+        """{issue_number: set(label names)} for every mirrored issue, like LabelSyncManager.fetch_issue_labels."""
+        with closing(self._connect()) as conn:
+            result = {row['number']: set() for row in conn.execute('SELECT number FROM issues')}
+            for number, label in conn.execute('SELECT number, label FROM issue_labels'):
+                result.setdefault(number, set()).add(label)
+        return result
+
+    def counts(self):
+        """Number of mirrored issues per state."""
+        with closing(self._connect()) as conn:
+            return dict(conn.execute('SELECT state, COUNT(*) FROM issues GROUP BY state').fetchall())
+
+
+def print_usage():
+    print("Usage:")
+    print("  issue_mirror.py sync [--full]                  # Incremental (or full) sync from GitHub")
+    print("  issue_mirror.py show <issue_number>            # Print one mirrored issue")
+    print("  issue_mirror.py list [--label L] [--state S]   # List mirrored issues")
+    print("  issue_mirror.py status                         # Counts and sync watermark")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print_usage()
+        sys.exit(1)
+
+    action = sys.argv[1]
+    mirror = IssueMirror()
+
+    if action == 'sync':
+        result = mirror.sync(full='--full' in sys.argv)
+        since = f"since {result['since']}" if result['since'] else "full"
+        print(f"✅ Mirrored {result['issues']} issue(s) from {result['pages']} page(s) "
+              f"({since}) in {result['elapsed_ms']:.0f}ms")
+        if result['issues'] and not result['advanced']:
+            print("⚠️  Issues changed during the sync; the watermark was kept for the next run")
+
+    elif action == 'show':
+        if len(sys.argv) < 3:
+            print_usage()
+            sys.exit(1)
+        issue = mirror.get(sys.argv[2])
+        if not issue:
+            print(f"❌ Issue #{sys.argv[2]} is not in the mirror")
+            sys.exit(1)
+        print(json.dumps(issue, indent=2))
+
+    elif action == 'list':
+        args = sys.argv[2:]
+        label = args[args.index('--label') + 1] if '--label' in args[:-1] else None
+        state = args[args.index('--state') + 1] if '--state' in args[:-1] else None
+        for issue in mirror.query(label, state):
+            print(f"#{issue['number']:<6} {issue['state']:<7} {issue['updated_at']}  {issue['title']}"
+                  f"  [{', '.join(issue['labels'])}]")
+
+    elif action == 'status':
+        for state, count in sorted(mirror.counts().items()):
+            print(f"{state}: {count}")
+        print(f"watermark: {mirror.watermark() or 'never synced'}")
+
+    else:
+        print(f"❌ Error: Invalid action '{action}'")
+        print_usage()
+        sys.exit(1)
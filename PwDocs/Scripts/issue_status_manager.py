@@ -6,6 +6,7 @@ import sys
 import shutil
 from datetime import datetime
 from Processors.shared_utils import ensure_directory, clean_title_for_filename, get_content_root
+from Processors.search_index import record_change
 
 class IssueStatusManager:
     def __init__(self):
@@ -19,10 +20,19 @@ class IssueStatusManager:
             'questions': 'Questions'
         }
     
+    def find_source_dir(self, source_type):
+        """Find a source directory case-insensitively (source types are lowercase, folders are not)."""
+        if not os.path.isdir(self.base_dir):
+            return None
+        for d in os.listdir(self.base_dir):
+            if d.lower() == source_type.lower() and os.path.isdir(os.path.join(self.base_dir, d)):
+                return os.path.join(self.base_dir, d)
+        return None
+    
     def _get_issue_path(self, issue_number, source_type):
         """Find issue directory given the number and type."""
-        source_dir = os.path.join(self.base_dir, source_type)
-        if not os.path.exists(source_dir):
+        source_dir = self.find_source_dir(source_type)
+        if not source_dir:
             return None
             
         for d in os.listdir(source_dir):
@@ -92,6 +102,7 @@ class IssueStatusManager:
         # Move to closed directory
         try:
             shutil.move(source_path, target_path)
+            record_change(source_path, target_path)
             print(f"✅ Moved issue #{issue_number} to Closed/{self.path_mapping[source_type]}")
             print(f"📍 New location: {target_path}")
             return True
@@ -120,6 +131,7 @@ class IssueStatusManager:
         
         try:
             shutil.move(source_path, target_path)
+            record_change(source_path, target_path)
             print(f"✅ Moved issue #{issue_number} to Closed/Other")
             print(f"📍 New location: {target_path}")
             return True
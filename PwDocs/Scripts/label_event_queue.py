@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Durable spool of GitHub label-change events with per-issue coalescing."""
+
+import os
+import sys
+import json
+import time
+import sqlite3
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+from Processors.shared_utils import ensure_directory, get_cache_dir
+
+# Claims older than this are assumed to belong to a crashed consumer
+STALE_CLAIM_SECONDS = 600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    issue INTEGER NOT NULL,
+    title TEXT,
+    old_labels TEXT NOT NULL,
+    new_labels TEXT NOT NULL,
+    received REAL NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    claimed_at REAL
+);
+CREATE INDEX IF NOT EXISTS events_state_issue ON events (state, issue, id);
+"""
+
+
+def _label_list(labels):
+    """Normalize a labels JSON string or list into a list of {'name': ...} dicts."""
+    if isinstance(labels, str):
+        labels = json.loads(labels or '[]')
+    return [label if isinstance(label, dict) else {'name': label} for label in labels]
+
+
+def coalesce(events):
+    """Collapse an issue's ordered events into one net (old_labels, new_labels, title).
+
+    bug -> duplicate -> invalid becomes a single bug -> invalid transition.
+    Returns None when the labels end up where they started.
+    """
+    old_labels = _label_list(events[0]['old_labels'])
+    new_labels = _label_list(events[-1]['new_labels'])
+    if {l.get('name') for l in old_labels} == {l.get('name') for l in new_labels}:
+        return None
+    return old_labels, new_labels, events[-1]['title']
+
+
+class LabelEventQueue:
+    """SQLite-backed queue of label events.
+
+    Producers append events; a consumer claims all pending events of the
+    issues nobody else is working on, coalesces them per issue and runs one
+    handler call per issue. Issues run in parallel, but an issue is never
+    claimed twice at once, so per-issue ordering is preserved.
+    """
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or os.path.join(get_cache_dir(), 'label-events.sqlite3')
+        ensure_directory(os.path.dirname(self.db_path))
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    def enqueue(self, issue_number, old_labels, new_labels, issue_title=None):
+        """Append a label-change event to the spool."""
+        with closing(self._connect()) as conn:
+            conn.execute(
+                'INSERT INTO events (issue, title, old_labels, new_labels, received) VALUES (?, ?, ?, ?, ?)',
+                (int(issue_number), issue_title,
+                 json.dumps(_label_list(old_labels)), json.dumps(_label_list(new_labels)), time.time()))
+
+    def _claim(self):
+        """Atomically claim pending events of issues with no active claim; return them grouped by issue."""
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute("UPDATE events SET state = 'pending', claimed_at = NULL "
+                         "WHERE state = 'claimed' AND claimed_at < ?", (now - STALE_CLAIM_SECONDS,))
+            conn.execute("UPDATE events SET state = 'claimed', claimed_at = ? "
+                         "WHERE state = 'pending' AND issue NOT IN "
+                         "(SELECT issue FROM events WHERE state = 'claimed')", (now,))
+            rows = conn.execute("SELECT * FROM events WHERE state = 'claimed' AND claimed_at = ? "
+                                "ORDER BY issue, id", (now,)).fetchall()
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+
+        grouped = {}
+        for row in rows:
+            grouped.setdefault(row['issue'], []).append(dict(row))
+        return grouped
+
+    def _finish(self, ids, state):
+        with closing(self._connect()) as conn:
+            conn.executemany("UPDATE events SET state = ?, claimed_at = NULL WHERE id = ?",
+                             [(state, event_id) for event_id in ids])
+
+    def drain(self, handler, max_workers=4):
+        """Process every pending issue once; returns (issues processed, events consumed, failures).
+
+        `handler(issue_number, old_labels, new_labels, issue_title)` is called
+        with the net transition of each issue and returns True on success. A
+        falsy result or an exception marks that issue's events 'failed' so
+        they can be inspected or retried.
+        """
+        grouped = self._claim()
+        if not grouped:
+            return 0, 0, 0
+
+        def run(issue, events):
+            transition = coalesce(events)
+            if transition is None:
+                return True
+            try:
+                if handler(issue, *transition):
+                    return True
+                print(f"❌ Failed to process label change for #{issue}")
+            except Exception as e:
+                print(f"❌ Failed to process label change for #{issue}: {e}")
+            return False
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {issue: pool.submit(run, issue, events) for issue, events in grouped.items()}
+            results = {issue: future.result() for issue, future in futures.items()}
+
+        failures = 0
+        for issue, ok in results.items():
+            ids = [event['id'] for event in grouped[issue]]
+            self._finish(ids, 'done' if ok else 'failed')
+            failures += not ok
+
+        events = sum(len(events) for events in grouped.values())
+        return len(grouped), events, failures
+
+    def retry_failed(self):
+        """Put failed events back in the queue; returns how many were re-queued.
+
+        A failed event of an issue that has since had a newer event processed
+        is marked 'superseded' instead: replaying it would undo that newer
+        transition.
+        """
+        conn = self._connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute("UPDATE events SET state = 'superseded' WHERE state = 'failed' AND EXISTS "
+                         "(SELECT 1 FROM events AS newer WHERE newer.issue = events.issue "
+                         "AND newer.state = 'done' AND newer.id > events.id)")
+            requeued = conn.execute("UPDATE events SET state = 'pending' WHERE state = 'failed'").rowcount
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+        return requeued
+
+    def counts(self):
+        """Number of events per state."""
+        with closing(self._connect()) as conn:
+            return dict(conn.execute('SELECT state, COUNT(*) FROM events GROUP BY state').fetchall())
+
+
+def print_usage():
+    print("Usage:")
+    print("  label_event_queue.py enqueue            # Spool the event from ISSUE_NUMBER, ISSUE_TITLE,")
+    print("                                          # OLD_LABELS and NEW_LABELS")
+    print("  label_event_queue.py drain [workers]    # Coalesce and process all pending events")
+    print("  label_event_queue.py retry              # Re-queue failed events not superseded")
+    print("  label_event_queue.py status             # Show queue counts")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print_usage()
+        sys.exit(1)
+
+    action = sys.argv[1]
+    queue = LabelEventQueue()
+
+    if action == 'enqueue':
+        issue_number = os.environ.get('ISSUE_NUMBER')
+        if not issue_number:
+            print("❌ Error: ISSUE_NUMBER must be set")
+            sys.exit(1)
+        queue.enqueue(issue_number, os.environ.get('OLD_LABELS', '[]'),
+                      os.environ.get('NEW_LABELS', '[]'), os.environ.get('ISSUE_TITLE'))
+        print(f"📥 Spooled label change for #{issue_number}")
+
+    elif action == 'drain':
+        # Imported here: process_label_change imports this module for --enqueue
+        from process_label_change import process_label_change
+        workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+        start = time.perf_counter()
+        issues, events, failures = queue.drain(process_label_change, workers)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"✅ Processed {events} event(s) as {issues} issue transition(s) in {elapsed_ms:.0f}ms")
+        if failures:
+            print(f"❌ {failures} issue(s) failed - see 'status' and 'retry'")
+            sys.exit(1)
+
+    elif action == 'retry':
+        print(f"🔁 Re-queued {queue.retry_failed()} failed event(s)")
+
+    elif action == 'status':
+        for state, count in sorted(queue.counts().items()):
+            print(f"{state}: {count}")
+
+    else:
+        print(f"❌ Error: Invalid action '{action}'")
+        print_usage()
+        sys.exit(1)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Full-repository reconciliation between local issue folders and GitHub labels."""
+
+import os
+import re
+import sys
+import time
+from label_sync_manager import LabelSyncManager
+from issue_mirror import IssueMirror
+from feature_to_roadmap import ROADMAP_DIR, promote_features, print_result
+
+ISSUE_DIR = re.compile(r'^(\d+)-')
+
+
+def _issue_dirs(parent):
+    """Yield (issue_number, path) for every `<number>-<slug>` directory in parent."""
+    try:
+        with os.scandir(parent) as it:
+            for entry in it:
+                match = ISSUE_DIR.match(entry.name)
+                if match and entry.is_dir():
+                    yield int(match.group(1)), entry.path
+    except OSError:
+        return
+
+
+def snapshot_local(status_manager):
+    """Map issue number -> list of local locations.
+
+    A location is a dict with the path, the source type for open issues
+    ('bugs', 'questions', 'features-proposed') and whether it is open.
+    Issues processed under several labels can have several locations.
+    """
+    local = {}
+
+    def add(number, path, source_type):
+        local.setdefault(number, []).append({
+            'path': path.replace(os.sep, '/'),
+            'source_type': source_type,
+            'open': source_type is not None
+        })
+
+    for source_type in status_manager.path_mapping:
+        source_dir = status_manager.find_source_dir(source_type)
+        if source_dir:
+            for number, path in _issue_dirs(source_dir):
+                add(number, path, source_type)
+
+    if os.path.isdir(status_manager.closed_dir):
+        with os.scandir(status_manager.closed_dir) as it:
+            for category in it:
+                if category.is_dir():
+                    for number, path in _issue_dirs(category.path):
+                        add(number, path, None)
+
+    for number, path in _issue_dirs(ROADMAP_DIR):
+        add(number, path, None)
+
+    return local
+
+
+def plan_reconciliation(local, remote, syncer):
+    """Compute the minimal moves and label edits that bring both sides in line.
+
+    GitHub labels set by people take precedence for open local issues (they
+    are moved, as sync_from_github would have done); local closed/roadmap
+    folders add whatever labels GitHub is missing, as sync_to_github would.
+    """
+    moves = []       # (issue_number, source_type, 'closed' | 'other', reason)
+    promotions = []  # issue numbers approved on GitHub but still proposed locally
+    edits = {}       # issue_number -> set of labels to add
+
+    for number, locations in sorted(local.items()):
+        labels = remote.get(number)
+        if labels is None:
+            continue  # Not on GitHub (or not visible to this token)
+
+        for location in locations:
+            if location['open']:
+                source_type = location['source_type']
+                rule = syncer.rules.status_rule(labels)
+                if rule is None:
+                    continue
+                if rule['action'] == 'roadmap':
+                    if source_type == 'features-proposed':
+                        promotions.append(number)
+                else:
+                    moves.append((number, source_type, rule['action'], f"Marked as {rule['label']} on GitHub"))
+            else:
+                missing = set(syncer.labels_for_path(location['path'])) - labels
+                if missing:
+                    edits.setdefault(number, set()).update(missing)
+
+    return {
+        'moves': moves,
+        'promotions': promotions,
+        'label_edits': [(number, sorted(labels), None) for number, labels in sorted(edits.items())]
+    }
+
+
+def apply_plan(plan, syncer, batch_size=50):
+    """Apply a reconciliation plan: local moves and roadmap promotions first, then label edits in pipelined batches."""
+    success = True
+    manager = syncer.status_manager
+
+    for number, source_type, action, reason in plan['moves']:
+        if action == 'other':
+            success &= manager.move_to_other(number, source_type, reason)
+        else:
+            success &= manager.move_to_closed(number, source_type, reason)
+
+    if plan['promotions']:
+        for result in promote_features(plan['promotions']):
+            print_result(result)
+            success &= result['success']
+
+    edits = plan['label_edits']
+    for i in range(0, len(edits), batch_size):
+        success &= syncer.apply_label_edits(edits[i:i + batch_size])
+
+    return success
+
+
+def print_plan(plan):
+    for number, source_type, action, reason in plan['moves']:
+        target = 'Closed/Other' if action == 'other' else 'Closed'
+        print(f"  move   #{number} {source_type} -> {target} ({reason})")
+    for number in plan['promotions']:
+        print(f"  roadmap #{number} features-proposed -> roadmap")
+    for number, labels, _ in plan['label_edits']:
+        print(f"  label  #{number} +{', +'.join(labels)}")
+
+
+def reconcile(dry_run=False, syncer=None, mirror=None):
+    """Snapshot both sides, plan, and (unless dry_run) apply the reconciliation.
+
+    With an IssueMirror the GitHub side comes from an incremental mirror
+    sync instead of a full issue listing.
+    """
+    start = time.perf_counter()
+    syncer = syncer or LabelSyncManager()
+
+    local = snapshot_local(syncer.status_manager)
+    if mirror is not None:
+        mirror.client = mirror.client or syncer.client
+        mirror.sync()
+        remote = mirror.labels_by_issue()
+    else:
+        remote = syncer.fetch_issue_labels()
+    if remote is None:
+        print("❌ Could not read issue labels from GitHub")
+        return False
+    snapshot_ms = (time.perf_counter() - start) * 1000
+
+    plan = plan_reconciliation(local, remote, syncer)
+    total = len(plan['moves']) + len(plan['promotions']) + len(plan['label_edits'])
+    print(f"🔍 {len(local)} local issues, {len(remote)} GitHub issues "
+          f"(snapshots in {snapshot_ms:.0f}ms) - {total} change(s) needed")
+    if not total:
+        print("✅ Local folders and GitHub labels are in sync")
+        return True
+
+    print_plan(plan)
+    if dry_run:
+        print("ℹ️ Dry run - nothing changed")
+        return True
+
+    success = apply_plan(plan, syncer)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"⏱️ Reconciliation finished in {elapsed_ms:.0f}ms")
+    return success
+
+
+if __name__ == '__main__':
+    if any(arg not in ('--dry-run', '--mirror') for arg in sys.argv[1:]):
+        print("Usage: label_reconciler.py [--dry-run] [--mirror]")
+        sys.exit(1)
+
+    mirror = IssueMirror() if '--mirror' in sys.argv else None
+    success = reconcile(dry_run='--dry-run' in sys.argv, mirror=mirror)
+    if not success:
+        sys.exit(1)
@@ -4,30 +4,33 @@
 import os
 import sys
 import json
+import time
 import subprocess
+import requests
 from datetime import datetime
 from issue_status_manager import IssueStatusManager
+from github_client import GitHubClient, GitHubAPIError, get_backend
+from feature_to_roadmap import promote_feature, print_result
+from Processors.label_rules import get_label_rules
+from Processors.scheduler import get_scheduler, INTERACTIVE, BULK
+from Processors.metrics import LABEL_SYNC_ISSUES, LABEL_SYNC_LATENCY
 
 class LabelSyncManager:
-    def __init__(self):
+    def __init__(self, client=None, scheduler=None):
         self.status_manager = IssueStatusManager()
         
-        # Label mappings between local states and GitHub labels
-        self.local_to_github = {
-            'Closed/Features-Not-Planned': ['wontfix'],
-            'Closed/Other/duplicate': ['duplicate'],
-            'Closed/Other/invalid': ['invalid'],
-            'Closed/Bugs': ['closed'],
-            'Closed/Questions': ['closed'],
-            'content/planning/roadmap': ['roadmap-approved']
-        }
+        # Every GitHub call goes through the shared rate-limit-aware scheduler
+        self.scheduler = scheduler or get_scheduler()
         
-        self.github_to_local = {
-            'wontfix': 'Closed/Features-Not-Planned',
-            'duplicate': 'Closed/Other',
-            'invalid': 'Closed/Other',
-            'roadmap-approved': 'content/planning/roadmap'
-        }
+        # GitHub access: in-process REST client when configured, gh CLI otherwise
+        if client is None and get_backend() == 'api':
+            client = GitHubClient(scheduler=self.scheduler)
+        self.client = client
+        
+        # Label mappings between local states and GitHub labels, from label_rules.json
+        self.rules = get_label_rules()
+        self.local_to_github = self.rules.local_to_github
+        self.github_to_local = self.rules.github_to_local
 
     def _run_gh_command(self, args):
         """Run a GitHub CLI command and return the result."""
@@ -41,49 +44,107 @@ class LabelSyncManager:
             print(f"❌ GitHub CLI error: {e.stderr}")
             return None
 
-    def sync_to_github(self, issue_number, local_path, reason=None):
-        """Sync local state changes to GitHub labels."""
-        # Determine labels based on local path
-        labels_to_add = []
-        labels_to_remove = []
-        
-        # Find matching labels for the local path
+    def _run_api_call(self, method, *args):
+        """Run a GitHubClient call, returning True or None on failure like _run_gh_command."""
+        try:
+            method(*args)
+            return True
+        except (GitHubAPIError, requests.RequestException) as e:
+            print(f"❌ GitHub API error: {e}")
+            return None
+
+    def labels_for_path(self, local_path):
+        """Determine the GitHub labels implied by a local path."""
+        labels = set()
         for local_pattern, gh_labels in self.local_to_github.items():
             if local_pattern in local_path:
-                labels_to_add.extend(gh_labels)
+                labels.update(gh_labels)
                 
                 # If moved to Closed, add 'closed' label
                 if 'Closed/' in local_path:
-                    labels_to_add.append('closed')
+                    labels.add('closed')
+        return sorted(labels)
+
+    def _sync_issue(self, issue_number, labels, reason=None):
+        """Add every label to one issue in a single edit, then comment if the edit succeeded.
+
+        Returns None on failure, like _run_gh_command.
+        """
+        comment = f"Status updated: {reason}" if reason else None
+        if self.client:
+            result = self._run_api_call(self.client.add_labels, issue_number, labels)
+            if result is not None and comment:
+                result = self._run_api_call(self.client.add_comment, issue_number, comment)
+            return result
+        
+        result = self._run_gh_command(['issue', 'edit', str(issue_number), '--add-label', ','.join(labels)])
+        if result is not None and comment:
+            result = self._run_gh_command(['issue', 'comment', str(issue_number), '--body', comment])
+        return result
+
+    def sync_to_github(self, issue_number, local_path, reason=None):
+        """Sync local state changes to GitHub labels."""
+        return self.sync_many_to_github([(issue_number, local_path, reason)], INTERACTIVE)
+
+    def sync_many_to_github(self, changes, priority=BULK):
+        """Sync several (issue_number, local_path, reason) changes to GitHub.
+
+        Each issue costs one label edit (all labels at once) plus one comment
+        when a reason is given; the comment is only posted once the edit has
+        succeeded. Issues are pipelined through the scheduler, so a bulk run
+        makes O(issues) calls instead of O(labels) and stays within GitHub's
+        rate limits.
+        """
+        edits = []
+        for issue_number, local_path, reason in changes:
+            labels = self.labels_for_path(local_path)
+            if not labels:
+                print(f"ℹ️ No GitHub labels to sync for #{issue_number} ({local_path})")
+                continue
+            edits.append((issue_number, labels, reason))
         
-        if not labels_to_add:
-            print("ℹ️ No GitHub labels to sync for this path")
+        return self.apply_label_edits(edits, priority)
+
+    def apply_label_edits(self, edits, priority=BULK):
+        """Apply (issue_number, labels, reason) edits, pipelining the issues through the scheduler."""
+        if not edits:
             return True
-            
-        # Remove duplicate labels
-        labels_to_add = list(set(labels_to_add))
         
-        # Add labels
-        for label in labels_to_add:
-            result = self._run_gh_command([
-                'issue', 'edit', str(issue_number),
-                '--add-label', label
-            ])
-            if result is None:
-                return False
-                
-        # Add comment if reason provided
-        if reason:
-            comment = f"Status updated: {reason}"
-            result = self._run_gh_command([
-                'issue', 'comment', str(issue_number),
-                '--body', comment
-            ])
-            if result is None:
-                return False
+        start = time.perf_counter()
+        futures = [self.scheduler.submit('github', self._sync_issue, issue_number, labels, reason,
+                                         priority=priority)
+                   for issue_number, labels, reason in edits]
+        results = [future.result() for future in futures]
+        if self.client:
+            self.client.save_cache()
+        
+        failed = {issue_number for (issue_number, _, _), result in zip(edits, results) if result is None}
+        for issue_number, labels, _ in edits:
+            LABEL_SYNC_ISSUES.inc(result='failed' if issue_number in failed else 'synced')
+            if issue_number in failed:
+                print(f"❌ Failed to sync #{issue_number} to GitHub")
+            else:
+                print(f"✅ Synced local changes to GitHub: Added labels {', '.join(labels)} to #{issue_number}")
+        
+        LABEL_SYNC_LATENCY.observe(time.perf_counter() - start)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"⏱️ {len(edits)} issue(s) synced in {elapsed_ms:.0f}ms")
+        self.scheduler.print_stats()
+        return not failed
+
+    def fetch_issue_labels(self):
+        """Snapshot {issue_number: set(label names)} for every issue in the repository."""
+        if self.client:
+            return {issue['number']: {label['name'] for label in issue.get('labels', [])}
+                    for issue in self.client.list_issues(state='all')
+                    if 'pull_request' not in issue}
         
-        print(f"✅ Synced local changes to GitHub: Added labels {', '.join(labels_to_add)}")
-        return True
+        output = self._run_gh_command(['issue', 'list', '--state', 'all', '--limit', '100000',
+                                       '--json', 'number,labels'])
+        if output is None:
+            return None
+        return {issue['number']: {label['name'] for label in issue['labels']}
+                for issue in json.loads(output)}
 
     def sync_from_github(self, issue_number, old_labels, new_labels, issue_title):
         """Sync GitHub label changes to local content structure."""
@@ -93,56 +154,34 @@ class LabelSyncManager:
         if isinstance(new_labels, str):
             new_labels = json.loads(new_labels)
         
-        # Extract label names
-        old_label_names = set(label.get('name', '') for label in old_labels)
-        new_label_names = set(label.get('name', '') for label in new_labels)
+        # Only react when a status label was added; act on the highest-precedence one
+        if not self.rules.added_status_rules(old_labels, new_labels):
+            return True
         
-        # Find added labels
-        added_labels = new_label_names - old_label_names
+        rule = self.rules.status_rule(new_labels)
+        issue_type = self.rules.source_type(new_labels)
+        if not issue_type:
+            return True
         
-        for label in added_labels:
-            if label in self.github_to_local:
-                target_location = self.github_to_local[label]
-                
-                # Determine issue type from existing labels
-                issue_type = None
-                if 'feature' in new_label_names or 'enhancement' in new_label_names:
-                    issue_type = 'features-proposed'
-                elif 'bug' in new_label_names:
-                    issue_type = 'bugs'
-                elif 'question' in new_label_names:
-                    issue_type = 'questions'
-                
-                if issue_type:
-                    if 'duplicate' in new_label_names:
-                        self.status_manager.move_to_other(
-                            issue_number, issue_type, 
-                            f"Marked as duplicate on GitHub"
-                        )
-                    elif 'invalid' in new_label_names:
-                        self.status_manager.move_to_other(
-                            issue_number, issue_type,
-                            f"Marked as invalid on GitHub"
-                        )
-                    elif 'wontfix' in new_label_names:
-                        self.status_manager.move_to_closed(
-                            issue_number, issue_type,
-                            f"Marked as wontfix on GitHub"
-                        )
-                    elif 'roadmap-approved' in new_label_names:
-                        # Use existing roadmap script
-                        subprocess.run([
-                            'python3', 
-                            'scripts/feature_to_roadmap.py', 
-                            str(issue_number)
-                        ])
+        if rule['action'] == 'roadmap':
+            result = promote_feature(issue_number)
+            print_result(result)
+            return result['success']
+        
+        reason = f"Marked as {rule['label']} on GitHub"
+        if rule['action'] == 'other':
+            return self.status_manager.move_to_other(issue_number, issue_type, reason)
+        return self.status_manager.move_to_closed(issue_number, issue_type, reason)
 
 def print_usage():
     print("Usage:")
     print("1. Sync local changes to GitHub:")
     print("   label_sync_manager.py to-github <issue_number> <local_path> [reason]")
     print("")
-    print("2. Sync GitHub changes to local:")
+    print("2. Sync many local changes to GitHub (JSON lines of {issue, path, reason}):")
+    print("   label_sync_manager.py to-github-batch <changes_file>")
+    print("")
+    print("3. Sync GitHub changes to local:")
     print("   label_sync_manager.py from-github <issue_number> <old_labels_json> <new_labels_json> <issue_title>")
     print("")
     print("Examples:")
@@ -152,12 +191,27 @@ def print_usage():
     print("  Sync from GitHub:")
     print("    label_sync_manager.py from-github 42 \"$OLD_LABELS\" \"$NEW_LABELS\" \"$ISSUE_TITLE\"")
 
+def load_batch(path):
+    """Read (issue_number, local_path, reason) changes from a JSON lines file."""
+    changes = []
+    with open(path, 'r') as f:
+        for line in f:
+            if line.strip():
+                change = json.loads(line)
+                changes.append((int(change['issue']), change['path'], change.get('reason')))
+    return changes
+
 if __name__ == '__main__':
     if len(sys.argv) < 3:
         print_usage()
         sys.exit(1)
     
     action = sys.argv[1]
+    
+    if action == 'to-github-batch':
+        success = LabelSyncManager().sync_many_to_github(load_batch(sys.argv[2]))
+        sys.exit(0 if success else 1)
+    
     try:
         issue_number = int(sys.argv[2])
     except ValueError:
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Per-rule and per-file timing for security_linter, with a scaling probe for ReDoS-prone rules."""
+
+import sys
+import time
+from ast_linter import analyze_text
+
+# A regex rule is slow if it needs more than this per MB of scanned source
+SLOW_MS_PER_MB = 200
+
+# Probe lines are built at these two lengths; linear rules scale by the
+# length ratio (4x), quadratic backtracking by its square (16x)
+PROBE_LENGTHS = (500, 2000)
+SUPERLINEAR_RATIO = 8
+PROBE_MIN_SECONDS = 0.001
+
+PROBE_STEMS = ['f"', "f'", 'open(', 'yaml.load(', 'subprocess', 'os.system', 'eval(', '{issue_title}']
+PROBE_FILLERS = [' ', 'a', '{', '(', '"']
+
+
+def _probe_lines(length):
+    """Adversarial lines: each stem repeated, and each stem followed by a long run of filler."""
+    lines = []
+    for stem in PROBE_STEMS:
+        lines.append(stem * (length // len(stem)))
+        lines.extend(stem + filler * length for filler in PROBE_FILLERS)
+    return lines
+
+
+def _time_search(regex, line):
+    start = time.perf_counter()
+    regex.search(line)
+    return time.perf_counter() - start
+
+
+def probe_scaling(compiled):
+    """Worst growth factor of each regex rule between the two probe lengths.
+
+    Returns {rule: {'ratio', 'seconds', 'probe'}} where seconds is the
+    slowest long-probe search.
+    """
+    short, long = (_probe_lines(length) for length in PROBE_LENGTHS)
+    results = {}
+    for name, regex in compiled.items():
+        worst = {'ratio': 0.0, 'seconds': 0.0, 'probe': None}
+        for short_line, long_line in zip(short, long):
+            long_seconds = _time_search(regex, long_line)
+            if long_seconds < PROBE_MIN_SECONDS:
+                continue
+            ratio = long_seconds / max(_time_search(regex, short_line), 1e-9)
+            if ratio > worst['ratio']:
+                worst = {'ratio': ratio, 'seconds': long_seconds, 'probe': long_line[:40]}
+        results[name] = worst
+    return results
+
+
+def profile(sources, compiled, skip_line, engines):
+    """Time every rule on every (path, text) source, one rule at a time.
+
+    The combined scanner is bypassed so each rule pays for its own
+    searches. Returns per-rule and per-file seconds, the scaling probe and
+    the list of slow rules with the reason they were flagged.
+    """
+    regex_rules = compiled if 'regex' in engines else {}
+    rule_seconds = {name: 0.0 for name in regex_rules}
+    if 'ast' in engines:
+        rule_seconds['ast:taint'] = 0.0
+    file_seconds = {}
+    scanned_bytes = 0
+
+    for path, text in sources:
+        file_start = time.perf_counter()
+        scanned_bytes += len(text.encode('utf-8'))
+        lines = [line for line in text.splitlines()
+                 if not (skip_line.match(line) or "'pattern':" in line or '"pattern":' in line)]
+        for name, regex in regex_rules.items():
+            start = time.perf_counter()
+            for line in lines:
+                regex.search(line)
+            rule_seconds[name] += time.perf_counter() - start
+        if 'ast' in engines:
+            start = time.perf_counter()
+            analyze_text(text)
+            rule_seconds['ast:taint'] += time.perf_counter() - start
+        file_seconds[path] = time.perf_counter() - file_start
+
+    probes = probe_scaling(regex_rules)
+    megabytes = max(scanned_bytes / 1e6, 1e-6)
+    slow = []
+    for name in regex_rules:
+        ms_per_mb = rule_seconds[name] * 1000 / megabytes
+        if ms_per_mb > SLOW_MS_PER_MB:
+            slow.append({'rule': name, 'reason': f"{ms_per_mb:.0f}ms per MB of source"})
+        if probes[name]['ratio'] > SUPERLINEAR_RATIO:
+            slow.append({'rule': name, 'reason': (
+                f"super-linear backtracking: {probes[name]['ratio']:.0f}x slower on a "
+                f"{PROBE_LENGTHS[1] // PROBE_LENGTHS[0]}x longer line ({probes[name]['probe']!r}...)")})
+
+    return {
+        'bytes': scanned_bytes,
+        'rules': dict(sorted(rule_seconds.items(), key=lambda item: -item[1])),
+        'files': dict(sorted(file_seconds.items(), key=lambda item: -item[1])),
+        'probes': probes,
+        'slow_rules': slow
+    }
+
+
+def print_profile(report, top_files=10, file=sys.stderr):
+    print(f"\n⏱️ Profile ({report['bytes'] / 1024:.0f} KB of source)", file=file)
+    print("  Per rule:", file=file)
+    for name, seconds in report['rules'].items():
+        print(f"    {seconds * 1000:8.2f}ms  {name}", file=file)
+    print("  Slowest files:", file=file)
+    for path, seconds in list(report['files'].items())[:top_files]:
+        print(f"    {seconds * 1000:8.2f}ms  {path}", file=file)
+    for slow in report['slow_rules']:
+        print(f"  🐢 Slow rule {slow['rule']}: {slow['reason']}", file=file)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Fingerprints, baselines and text/JSON/SARIF renderers for security_linter findings."""
+
+import re
+import json
+import hashlib
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+TOOL_NAME = "pwdocs-security-linter"
+FINGERPRINT_KEY = "pwdocsFingerprint/v1"
+SARIF_LEVELS = {'HIGH': 'error', 'MEDIUM': 'warning'}
+
+
+def _normalize(code):
+    return re.sub(r'\s+', ' ', code).strip()
+
+
+def add_fingerprints(findings):
+    """Give every finding a 'fingerprint' that survives unrelated edits.
+
+    It hashes the file, the check and the whitespace-normalized code, plus
+    the occurrence index among identical lines - not the line number, so
+    code moving up or down keeps its fingerprint.
+    """
+    seen = {}
+    for finding in findings:
+        key = (finding['file'].replace('\\', '/'), finding['check'], _normalize(finding['code']))
+        occurrence = seen.get(key, 0)
+        seen[key] = occurrence + 1
+        digest = hashlib.sha256('\0'.join(key + (str(occurrence),)).encode()).hexdigest()
+        finding['fingerprint'] = digest[:32]
+    return findings
+
+
+def load_baseline(path):
+    """Fingerprints in a baseline file (written by write_baseline, or a --format json report)."""
+    with open(path, 'r') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get('fingerprints') or [finding['fingerprint'] for finding in data.get('findings', [])]
+    return set(data)
+
+
+def write_baseline(path, findings):
+    content = {'fingerprints': sorted(finding['fingerprint'] for finding in findings)}
+    with open(path, 'w') as f:
+        json.dump(content, f, indent=2)
+        f.write('\n')
+
+
+def apply_baseline(findings, baseline):
+    """Mark each finding 'new' or 'unchanged' against the baseline fingerprints."""
+    for finding in findings:
+        finding['baseline_state'] = 'unchanged' if finding['fingerprint'] in baseline else 'new'
+    return findings
+
+
+def summarize(findings):
+    """Counts per severity, over all findings and over the new ones only."""
+    new = [finding for finding in findings if finding.get('baseline_state') != 'unchanged']
+    return {
+        'high': sum(finding['severity'] == 'HIGH' for finding in findings),
+        'medium': sum(finding['severity'] == 'MEDIUM' for finding in findings),
+        'new_high': sum(finding['severity'] == 'HIGH' for finding in new),
+        'new_medium': sum(finding['severity'] == 'MEDIUM' for finding in new),
+        'baselined': len(findings) - len(new)
+    }
+
+
+def render_text(findings, stats, summary):
+    lines = []
+    reported = [finding for finding in findings if finding.get('baseline_state') != 'unchanged']
+    if not reported:
+        if summary['baselined']:
+            lines.append(f"✅ No new security issues ({summary['baselined']} baselined)")
+        else:
+            lines.append("✅ No security issues found!")
+        return '\n'.join(lines)
+
+    lines.append("🔒 Security Linter Results:\n")
+    for finding in reported:
+        severity_icon = "🚨" if finding['severity'] == 'HIGH' else "⚠️"
+        lines.append(f"{severity_icon} {finding['severity']}: {finding['file']}:{finding['line']} [{finding['check']}]")
+        lines.append(f"   {finding['message']}")
+        if finding.get('context'):
+            for number, text in finding['context']:
+                marker = '>' if number == finding['line'] else ' '
+                lines.append(f"   {marker} {number:>4} | {text}")
+        else:
+            lines.append(f"   > {finding['code']}")
+        lines.append("")
+
+    summary_line = f"Summary: {summary['new_high']} HIGH, {summary['new_medium']} MEDIUM severity issues"
+    if summary['baselined']:
+        summary_line += f" ({summary['baselined']} baselined not shown)"
+    lines.append(summary_line)
+
+    # Exit with error if HIGH severity found
+    if summary['new_high']:
+        lines.append("\n❌ HIGH severity issues found - fix before committing!")
+    else:
+        lines.append("\n⚠️ Medium severity issues found - consider fixing")
+    return '\n'.join(lines)
+
+
+def render_json(findings, stats, summary):
+    return json.dumps({'findings': findings, 'summary': summary, 'stats': stats},
+                      indent=2, ensure_ascii=False)
+
+
+def render_sarif(findings, stats, summary, rules=None):
+    """SARIF 2.1.0 log with one rule per check and partial fingerprints for deduplication."""
+    rules = rules or {}
+    checks = sorted({finding['check'] for finding in findings} | set(rules))
+    rule_index = {check: i for i, check in enumerate(checks)}
+
+    results = []
+    for finding in findings:
+        result = {
+            'ruleId': finding['check'],
+            'ruleIndex': rule_index[finding['check']],
+            'level': SARIF_LEVELS.get(finding['severity'], 'warning'),
+            'message': {'text': finding['message']},
+            'locations': [{
+                'physicalLocation': {
+                    'artifactLocation': {'uri': finding['file'].replace('\\', '/')},
+                    'region': {'startLine': finding['line'], 'snippet': {'text': finding['code']}}
+                }
+            }],
+            'partialFingerprints': {FINGERPRINT_KEY: finding['fingerprint']}
+        }
+        if 'baseline_state' in finding:
+            result['baselineState'] = finding['baseline_state']
+        results.append(result)
+
+    driver_rules = []
+    for check in checks:
+        severity, message = rules.get(check, (None, check))
+        rule = {'id': check, 'shortDescription': {'text': message}}
+        if severity:
+            rule['defaultConfiguration'] = {'level': SARIF_LEVELS.get(severity, 'warning')}
+        driver_rules.append(rule)
+
+    log = {
+        '$schema': SARIF_SCHEMA,
+        'version': '2.1.0',
+        'runs': [{
+            'tool': {'driver': {'name': TOOL_NAME, 'rules': driver_rules}},
+            'results': results
+        }]
+    }
+    return json.dumps(log, indent=2, ensure_ascii=False)
+
+
+RENDERERS = {
+    'text': render_text,
+    'json': render_json,
+    'sarif': render_sarif
+}
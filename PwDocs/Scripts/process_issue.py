@@ -2,12 +2,15 @@
 import os
 import json
 import sys
+import time
 from Processors.shared_utils import get_issue_type, validate_issue_number, requires_claude
 from Processors.feature_processor import process_feature_proposal
 # Removed current state processor - now handled manually
 from Processors.bug_processor import process_bug_report
 from Processors.question_processor import process_question
 from Processors.strategic_processor import process_strategic_content
+from Processors.duplicate_detector import DuplicateIndex, get_duplicate_mode
+from Processors.tracing import span
 
 # Get environment variables
 api_key = os.environ.get('OPENROUTER_API_KEY')
@@ -38,71 +41,98 @@ except ValueError as e:
     print(f"ERROR: {e}")
     sys.exit(1)
 
-# Determine issue type from labels with title fallback
-issue_type = get_issue_type(issue_labels, issue_title)
+with span('issue', issue=issue_number, event=event_type):
+    # Determine issue type from labels with title fallback
+    with span('classify'):
+        issue_type = get_issue_type(issue_labels, issue_title)
 
-print(f"Processing issue #{issue_number}: {issue_title}")
-print(f"Labels: {issue_labels}")
-print(f"Detected type: {issue_type}")
+    print(f"Processing issue #{issue_number}: {issue_title}")
+    print(f"Labels: {issue_labels}")
+    print(f"Detected type: {issue_type}")
 
-# Check if Claude Code analysis is needed
-needs_claude = requires_claude(issue_labels)
-if needs_claude:
-    print("⚠️ This issue requires Claude Code analysis")
+    # Check if Claude Code analysis is needed
+    needs_claude = requires_claude(issue_labels)
+    if needs_claude:
+        print("⚠️ This issue requires Claude Code analysis")
 
-if event_type == "opened":
-    success = True
-    processors_run = []
+    if event_type == "opened":
+        success = True
+        processors_run = []
     
-    # Handle multiple types (list) or single type (string)
-    types_to_process = issue_type if isinstance(issue_type, list) else [issue_type]
-    is_duplicate = len(types_to_process) > 1
+        # Handle multiple types (list) or single type (string)
+        types_to_process = issue_type if isinstance(issue_type, list) else [issue_type]
+        is_duplicate = len(types_to_process) > 1
     
-    for process_type in types_to_process:
-        other_types = [t for t in types_to_process if t != process_type] if is_duplicate else None
+        # Check for near-duplicates of known issues before any model call
+        duplicate_mode = get_duplicate_mode()
+        similar_issues = []
+        with span('duplicates'):
+            if duplicate_mode != 'off':
+                duplicates = DuplicateIndex()
+                if not duplicates.count():
+                    print(f"🔁 Indexed {duplicates.build()} existing issue(s) for duplicate detection")
+                start = time.perf_counter()
+                similar_issues = duplicates.find(issue_title, issue_body, exclude=issue_number)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                for match in similar_issues:
+                    print(f"🔁 Possible duplicate of #{match['number']}: {match['title']} "
+                          f"({match['similarity']:.0%} similar)")
+                print(f"Duplicate check: {len(similar_issues)} match(es) in {elapsed_ms:.2f}ms")
+        skip_ai = duplicate_mode == 'skip' and bool(similar_issues)
+        if skip_ai:
+            print("⏭️  Likely duplicate - skipping AI specification")
+    
+        for process_type in types_to_process:
+            other_types = [t for t in types_to_process if t != process_type] if is_duplicate else None
         
-        if process_type == 'CURRENT_STATE_UPDATE':
-            print("📝 Current state update - manual processing required")
-            print("Use process_current_state.py to process updates")
-            # Not an error, just no automated processing
+            if process_type == 'CURRENT_STATE_UPDATE':
+                print("📝 Current state update - manual processing required")
+                print("Use process_current_state.py to process updates")
+                # Not an error, just no automated processing
             
-        elif process_type == 'FEATURE_PROPOSAL':
-            print("✨ Processing as feature proposal...")
-            success &= process_feature_proposal(api_key, issue_number, issue_title, issue_body,
-                                               is_duplicate, other_types)
-            processors_run.append('feature')
+            elif process_type == 'FEATURE_PROPOSAL':
+                print("✨ Processing as feature proposal...")
+                with span('process', type='feature'):
+                    success &= process_feature_proposal(api_key, issue_number, issue_title, issue_body,
+                                                       is_duplicate, other_types, similar_issues, skip_ai)
+                processors_run.append('feature')
             
-        elif process_type == 'BUG_REPORT':
-            print("🐛 Processing as bug report...")
-            success &= process_bug_report(api_key, issue_number, issue_title, issue_body,
-                                         is_duplicate, other_types)
-            processors_run.append('bug')
+            elif process_type == 'BUG_REPORT':
+                print("🐛 Processing as bug report...")
+                with span('process', type='bug'):
+                    success &= process_bug_report(api_key, issue_number, issue_title, issue_body,
+                                                 is_duplicate, other_types, similar_issues)
+                processors_run.append('bug')
             
-        elif process_type == 'QUESTION':
-            print("❓ Processing as question...")
-            success &= process_question(api_key, issue_number, issue_title, issue_body,
-                                       is_duplicate, other_types)
-            processors_run.append('question')
+            elif process_type == 'QUESTION':
+                print("❓ Processing as question...")
+                with span('process', type='question'):
+                    success &= process_question(api_key, issue_number, issue_title, issue_body,
+                                               is_duplicate, other_types, similar_issues)
+                processors_run.append('question')
             
-        elif process_type == 'STANDARD_ISSUE':
-            print("📋 Standard issue - no automated processing")
-            # Not an error, just no processing needed
+            elif process_type == 'STANDARD_ISSUE':
+                print("📋 Standard issue - no automated processing")
+                # Not an error, just no processing needed
             
-        else:
-            print(f"❌ Unknown issue type: {process_type}")
-            success = False
+            else:
+                print(f"❌ Unknown issue type: {process_type}")
+                success = False
+    
+        if processors_run:
+            print(f"✅ Processed as: {', '.join(processors_run)}")
+            if is_duplicate:
+                print("⚠️  Multiple processing due to multiple labels")
     
-    if processors_run:
-        print(f"✅ Processed as: {', '.join(processors_run)}")
-        if is_duplicate:
-            print("⚠️  Multiple processing due to multiple labels")
+        if not success:
+            print("❌ Processing failed")
+            sys.exit(1)
     
-    if not success:
-        print("❌ Processing failed")
-        sys.exit(1)
+        if duplicate_mode != 'off':
+            duplicates.add(issue_number, issue_title, issue_body)
     
-elif event_type == "closed":
-    print("🔒 Issue closed - no processing needed")
+    elif event_type == "closed":
+        print("🔒 Issue closed - no processing needed")
     
-else:
-    print(f"🔄 Event type '{event_type}' - no processing needed")
\ No newline at end of file
+    else:
+        print(f"🔄 Event type '{event_type}' - no processing needed")
\ No newline at end of file
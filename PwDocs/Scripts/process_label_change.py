@@ -5,9 +5,12 @@ import os
 import sys
 import json
 from issue_status_manager import IssueStatusManager
+from github_client import GitHubClient, get_backend
+from label_event_queue import LabelEventQueue
+from Processors.label_rules import get_label_rules, label_names
 
 def process_label_change(issue_number, old_labels, new_labels, issue_title):
-    """Process changes in GitHub labels."""
+    """Process changes in GitHub labels; returns False if a folder move failed."""
     
     # Convert label lists from JSON if needed
     if isinstance(old_labels, str):
@@ -15,48 +18,29 @@ def process_label_change(issue_number, old_labels, new_labels, issue_title):
     if isinstance(new_labels, str):
         new_labels = json.loads(new_labels)
     
-    # Extract label names
-    old_label_names = set(label.get('name', '') for label in old_labels)
-    new_label_names = set(label.get('name', '') for label in new_labels)
+    rules = get_label_rules()
+    old_labels = label_names(old_labels)
     
-    # Check for status changes
-    manager = IssueStatusManager()
-    
-    # Handle 'wontfix' label
-    if 'wontfix' in new_label_names and 'wontfix' not in old_label_names:
-        # Determine issue type
-        if 'feature' in old_label_names or 'enhancement' in old_label_names:
-            manager.move_to_closed(issue_number, 'features-proposed', 'Marked as wontfix')
-        elif 'bug' in old_label_names:
-            manager.move_to_closed(issue_number, 'bugs', 'Marked as wontfix')
-        elif 'question' in old_label_names:
-            manager.move_to_closed(issue_number, 'questions', 'Marked as wontfix')
+    # Only the first added label in label_change_order (wontfix, duplicate, invalid) moves
+    # the issue; once it has moved, a second move would find no source folder
+    rule = rules.label_change_rule(old_labels, new_labels)
     
-    # Handle 'duplicate' label
-    if 'duplicate' in new_label_names and 'duplicate' not in old_label_names:
-        # Move to Other for duplicates
-        if 'feature' in old_label_names or 'enhancement' in old_label_names:
-            manager.move_to_other(issue_number, 'features-proposed', 'Duplicate issue')
-        elif 'bug' in old_label_names:
-            manager.move_to_other(issue_number, 'bugs', 'Duplicate issue')
-        elif 'question' in old_label_names:
-            manager.move_to_other(issue_number, 'questions', 'Duplicate issue')
+    # Source folder is decided by the labels the issue had before the change
+    issue_type = rules.source_type(old_labels)
+    if not rule or not issue_type:
+        return True
     
-    # Handle closing via 'invalid' label
-    if 'invalid' in new_label_names and 'invalid' not in old_label_names:
-        if 'feature' in old_label_names or 'enhancement' in old_label_names:
-            manager.move_to_other(issue_number, 'features-proposed', 'Marked as invalid')
-        elif 'bug' in old_label_names:
-            manager.move_to_other(issue_number, 'bugs', 'Marked as invalid')
-        elif 'question' in old_label_names:
-            manager.move_to_other(issue_number, 'questions', 'Marked as invalid')
+    manager = IssueStatusManager()
+    if rule['action'] == 'closed':
+        return manager.move_to_closed(issue_number, issue_type, rule['reason'])
+    return manager.move_to_other(issue_number, issue_type, rule['reason'])
 
 if __name__ == '__main__':
     # Get environment variables
     issue_number = os.environ.get('ISSUE_NUMBER')
     issue_title = os.environ.get('ISSUE_TITLE')
     old_labels_json = os.environ.get('OLD_LABELS', '[]')
-    new_labels_json = os.environ.get('NEW_LABELS', '[]')
+    new_labels_json = os.environ.get('NEW_LABELS')
     
     if not all([issue_number, issue_title]):
         print("❌ Error: Required environment variables not set")
@@ -70,4 +54,18 @@ if __name__ == '__main__':
         print("❌ Error: ISSUE_NUMBER must be an integer")
         sys.exit(1)
     
+    # Without NEW_LABELS in the event, read the current labels from the API when enabled
+    if new_labels_json is None:
+        if get_backend() == 'api':
+            new_labels_json = GitHubClient().get_labels(issue_number)
+        else:
+            new_labels_json = '[]'
+    
+    # --enqueue spools the event for label_event_queue.py drain instead of processing it now,
+    # so rapid relabels coalesce into one transition
+    if '--enqueue' in sys.argv:
+        LabelEventQueue().enqueue(issue_number, old_labels_json, new_labels_json, issue_title)
+        print(f"📥 Spooled label change for #{issue_number}")
+        sys.exit(0)
+    
     process_label_change(issue_number, old_labels_json, new_labels_json, issue_title)
\ No newline at end of file
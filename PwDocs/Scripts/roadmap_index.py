@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Streaming, cached index of the phases in the roadmap."""
+
+import os
+import re
+import sys
+
+ROADMAP_FILE = "templates/roadmap.md"
+
+# "### Phase 2: Core Pipeline ⏳ **IN PROGRESS** (stretch)" - separator, status
+# and any note after them are optional
+PHASE_HEADER = re.compile(
+    r'^###\s*Phase\s+(\d+):\s*([^=⏳🔄✅\n]*?)\s*'
+    r'(?:(?:[=⏳🔄✅-]+\s*)?\*\*([^*\n]+)\*\*.*|[=⏳🔄✅].*)?$',
+    re.IGNORECASE)
+DURATION = re.compile(r'\*\*Duration\*\*:\s*([^\n]+)')
+
+# In-process memo: path -> ((mtime_ns, size), RoadmapIndex)
+_memo = {}
+
+
+def parse_roadmap(roadmap_file):
+    """Parse every phase of the roadmap in a single streaming pass.
+
+    Returns a list of phase dicts with number, title, status, duration and
+    the [start, end) byte offsets of the phase section in the file.
+    """
+    phases = []
+    current = None
+    offset = 0
+
+    with open(roadmap_file, 'rb') as f:
+        for raw in f:
+            line = raw.decode('utf-8', errors='replace')
+            if line.startswith('###'):
+                if current:
+                    current['end'] = offset
+                    phases.append(current)
+                    current = None
+                match = PHASE_HEADER.match(line.rstrip('\r\n'))
+                if match:
+                    current = {
+                        'phase': match.group(1),
+                        'title': match.group(2).strip(),
+                        'status': (match.group(3) or '').strip().upper() or None,
+                        'duration': "Unknown",
+                        'start': offset
+                    }
+            elif current and current['duration'] == "Unknown":
+                duration = DURATION.search(line)
+                if duration:
+                    current['duration'] = duration.group(1).strip()
+            offset += len(raw)
+
+    if current:
+        current['end'] = offset
+        phases.append(current)
+
+    return phases
+
+
+class RoadmapIndex:
+    """Queryable index of roadmap phases."""
+
+    def __init__(self, phases, path=ROADMAP_FILE):
+        self.path = path
+        self.phases = phases
+
+    @classmethod
+    def load(cls, path=ROADMAP_FILE, cache=None):
+        """Load the index, re-parsing the roadmap only when its mtime or size changes.
+
+        With a ScanCache the parsed phases also persist across runs.
+        Returns an empty index if the roadmap does not exist.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return cls([], path)
+
+        stamp = (st.st_mtime_ns, st.st_size)
+        memo = _memo.get(path)
+        if memo and memo[0] == stamp:
+            return memo[1]
+
+        if cache is not None:
+            phases = cache.read(path, parse_roadmap, 'roadmap-index') or []
+        else:
+            phases = parse_roadmap(path)
+        index = cls(phases, path)
+        _memo[path] = (stamp, index)
+        return index
+
+    def phases_by_status(self, status):
+        """All phases with the given status (case-insensitive), in roadmap order."""
+        status = status.upper()
+        return [phase for phase in self.phases if phase['status'] == status]
+
+    def statuses(self):
+        """Map of status -> phase numbers, for every status in the roadmap."""
+        result = {}
+        for phase in self.phases:
+            result.setdefault(phase['status'], []).append(phase['phase'])
+        return result
+
+    def get_phase(self, number):
+        """Look up a phase by number, or None."""
+        number = str(number)
+        return next((phase for phase in self.phases if phase['phase'] == number), None)
+
+    def current_phase(self):
+        """The first IN PROGRESS phase, or None."""
+        in_progress = self.phases_by_status('IN PROGRESS')
+        return in_progress[0] if in_progress else None
+
+    def read_phase(self, number):
+        """Read just one phase section from disk using its byte offsets."""
+        phase = self.get_phase(number)
+        if not phase:
+            return None
+        with open(self.path, 'rb') as f:
+            f.seek(phase['start'])
+            return f.read(phase['end'] - phase['start']).decode('utf-8', errors='replace')
+
+
+if __name__ == '__main__':
+    index = RoadmapIndex.load(sys.argv[1] if len(sys.argv) > 1 else ROADMAP_FILE)
+    if not index.phases:
+        print(f"No phases found in {index.path}")
+        sys.exit(1)
+    for phase in index.phases:
+        print(f"Phase {phase['phase']}: {phase['title']} [{phase['status'] or 'NO STATUS'}] "
+              f"- {phase['duration']} (bytes {phase['start']}-{phase['end']})")
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Persistent scan cache for the documentation state summary."""
+
+import os
+import sys
+import json
+import time
+import threading
+
+# Run as a plain script, so make the Processors package importable
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Processors.shared_utils import get_cache_dir, write_file_atomic
+from Processors.metrics import CACHE_REQUESTS, FS_OPERATIONS
+
+CACHE_VERSION = 1
+
+
+class ScanCache:
+    """Cache directory listings and parsed file contents between runs.
+
+    Directory listings are keyed on the directory mtime, parsed files on
+    their (mtime, size) pair. Anything whose key still matches is served
+    from the cache instead of being re-read. Safe to share between the
+    dashboard's collector threads.
+
+    Entries not looked up through this object are dropped on save(), so
+    deleted and renamed files do not pile up in the cache file. Runs that
+    scan different parts of the tree should therefore use separate files.
+    """
+
+    def __init__(self, cache_path=None, enabled=True):
+        self.cache_path = cache_path or os.path.join(get_cache_dir(), 'documentation-state.json')
+        self.enabled = enabled
+        self.data = {'version': CACHE_VERSION, 'dirs': {}, 'files': {}}
+        self.hits = 0
+        self.misses = 0
+        self.miss_seconds = 0.0
+        self._dirty = False
+        self._touched = {'dirs': set(), 'files': set()}
+        self._lock = threading.Lock()
+        if enabled:
+            self._load()
+
+    def _load(self):
+        """Load the cache file, discarding it if unreadable or outdated."""
+        try:
+            with open(self.cache_path, 'r') as f:
+                data = json.load(f)
+        except (IOError, ValueError):
+            return
+        if data.get('version') == CACHE_VERSION:
+            self.data = data
+
+    def save(self):
+        """Write the cache back to disk if anything changed, dropping entries this run never looked up."""
+        if not self.enabled:
+            return
+        with self._lock:
+            for section, touched in self._touched.items():
+                entries = self.data[section]
+                stale = [key for key in entries if key not in touched]
+                for key in stale:
+                    del entries[key]
+                if stale:
+                    self._dirty = True
+            if not self._dirty:
+                return
+            content = json.dumps(self.data, separators=(',', ':'))
+            self._dirty = False
+        write_file_atomic(self.cache_path, content)
+
+    def list_dir(self, path, mtime=None):
+        """Return [(name, is_dir)] for a directory, or [] if it does not exist.
+
+        Callers that already hold the directory's ``st_mtime_ns`` (e.g. from a
+        parent ``os.scandir`` entry) can pass it to skip the validating stat.
+        """
+        if mtime is None:
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                return []
+
+        cached = self.data['dirs'].get(path)
+        if self.enabled and cached and cached['mtime'] == mtime:
+            self._record_hit('dirs', path)
+            return [tuple(entry) for entry in cached['entries']]
+
+        start = time.perf_counter()
+        try:
+            with os.scandir(path) as it:
+                entries = sorted((entry.name, entry.is_dir()) for entry in it)
+        except OSError:
+            return []
+        FS_OPERATIONS.inc(component='scan_cache', operation='scandir')
+        with self._lock:
+            self.data['dirs'][path] = {'mtime': mtime, 'entries': entries}
+        self._record_miss('dirs', path, start)
+        return entries
+
+    def read(self, path, parser, kind):
+        """Return parser(path), reusing the cached result while the file is unchanged.
+
+        The parser result must be JSON-serializable. ``kind`` names the parser
+        so one file can be cached under several parsers.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+
+        key = f"{kind}:{path}"
+        stamp = [st.st_mtime_ns, st.st_size]
+        cached = self.data['files'].get(key)
+        if self.enabled and cached and cached['stamp'] == stamp:
+            self._record_hit('files', key)
+            return cached['value']
+
+        start = time.perf_counter()
+        value = parser(path)
+        FS_OPERATIONS.inc(component='scan_cache', operation='read')
+        with self._lock:
+            self.data['files'][key] = {'stamp': stamp, 'value': value}
+        self._record_miss('files', key, start)
+        return value
+
+    def _record_hit(self, section, key):
+        with self._lock:
+            self.hits += 1
+            self._touched[section].add(key)
+        CACHE_REQUESTS.inc(cache='scan', result='hit')
+
+    def _record_miss(self, section, key, start):
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.misses += 1
+            self._touched[section].add(key)
+            self.miss_seconds += elapsed
+            self._dirty = True
+        CACHE_REQUESTS.inc(cache='scan', result='miss')
+
+    def hit_ratio(self):
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Search Content/ and ClaudeDocs/ through the local BM25 index."""
+
+import sys
+import json
+import time
+from Processors.search_index import SearchIndex, tokenize
+
+SNIPPET_WIDTH = 100
+
+
+def snippet(path, query):
+    """The first line of the file containing a query term, trimmed for display."""
+    terms = set(tokenize(query))
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                if terms.intersection(tokenize(line)):
+                    line = line.strip()
+                    return line if len(line) <= SNIPPET_WIDTH else line[:SNIPPET_WIDTH - 3] + '...'
+    except OSError:
+        pass
+    return ''
+
+
+def print_usage():
+    print("Usage:")
+    print("  search_docs.py search <query...> [--limit N] [--json]  # Ranked matches")
+    print("  search_docs.py update [--full]                         # Apply changes (or rebuild)")
+    print("  search_docs.py status                                  # Index size")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print_usage()
+        sys.exit(1)
+
+    action = sys.argv[1]
+    index = SearchIndex()
+
+    if action == 'search':
+        args = sys.argv[2:]
+        limit = 10
+        if '--limit' in args[:-1]:
+            position = args.index('--limit')
+            limit = int(args[position + 1])
+            del args[position:position + 2]
+        as_json = '--json' in args
+        query = ' '.join(arg for arg in args if arg != '--json')
+        if not query:
+            print_usage()
+            sys.exit(1)
+
+        start = time.perf_counter()
+        results = index.search(query, limit)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if as_json:
+            print(json.dumps(results, indent=2))
+        elif not results:
+            print(f"No matches for '{query}'")
+        else:
+            for result in results:
+                print(f"{result['score']:7.2f}  {result['path']}")
+                line = snippet(result['path'], query)
+                if line:
+                    print(f"         {line}")
+            print(f"\n🔍 {len(results)} match(es) in {elapsed_ms:.1f}ms", file=sys.stderr)
+
+    elif action == 'update':
+        stats = index.update(full='--full' in sys.argv)
+        print(f"✅ Indexed {stats['indexed']} file(s), removed {stats['removed']} "
+              f"in {stats['elapsed_ms']:.0f}ms ({stats['docs']} docs, {stats['terms']} terms, "
+              f"{stats['bytes'] / 1024:.0f} KB)")
+
+    elif action == 'status':
+        stats = index.stats()
+        print(f"docs: {stats['docs']}")
+        print(f"terms: {stats['terms']}")
+        print(f"unmerged changes: {stats['delta_docs']} doc(s)")
+        print(f"segments: {stats['bytes'] / 1024:.0f} KB")
+        print(f"pending changes: {'yes' if index.pending() else 'no'}")
+
+    else:
+        print(f"❌ Error: Invalid action '{action}'")
+        print_usage()
+        sys.exit(1)
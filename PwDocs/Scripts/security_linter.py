@@ -3,8 +3,22 @@
 
 import re
 import sys
-import glob
+import json
+import time
+import hashlib
 import os
+import argparse
+import subprocess
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+
+# Run as a plain script from hooks, so make the Processors package importable
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Processors.shared_utils import get_cache_dir, write_file_atomic
+from ast_linter import CHECKS as AST_CHECKS, ENGINE_VERSION, analyze_text
+from lint_report import (RENDERERS, add_fingerprints, apply_baseline, load_baseline,
+                         summarize, write_baseline)
+from lint_profile import print_profile, profile
 
 DANGEROUS_PATTERNS = {
     'eval_exec': {
@@ -14,7 +28,7 @@ DANGEROUS_PATTERNS = {
     },
     'shell_command': {
         'pattern': r'(os\.system|subprocess.*shell=True)',
-        'severity': 'HIGH', 
+        'severity': 'HIGH',
         'message': 'Shell commands can be injected'
     },
     'unsafe_f_string': {
@@ -34,91 +48,415 @@ DANGEROUS_PATTERNS = {
     }
 }
 
+# Directories scanned by default: the scripts and the issue processors
+DEFAULT_ROOTS = [os.path.dirname(os.path.abspath(__file__)),
+                 os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Processors')]
 
-def scan_file(filepath):
-    """Scan a single file for security issues."""
+# The linter's own rule definitions would match themselves
+SELF_NAMES = ('security-linter.py', 'security_linter.py', 'lint_profile.py')
+
+# Below this many uncached files a process pool costs more than it saves
+PARALLEL_THRESHOLD = 16
+
+# Lines of source shown around a finding in diff-scoped runs
+CONTEXT_LINES = 2
+
+# "@@ -12,3 +14,5 @@" - the new-file start line and optional line count
+HUNK_HEADER = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+
+# 'regex' runs DANGEROUS_PATTERNS line by line; 'ast' runs the taint engine
+# in ast_linter, which replaces the line rules that guess at data flow.
+ENGINES = ('regex', 'ast')
+AST_SUPERSEDES = {'unsafe_f_string', 'raw_input_usage'}
+
+# Every rule compiled once, plus one alternation of all of them. A line is
+# searched with the combined scanner first; only lines it hits are checked
+# against the individual rules, so clean lines cost a single regex search.
+COMPILED = {name: re.compile(check['pattern']) for name, check in DANGEROUS_PATTERNS.items()}
+SKIP_LINE = re.compile(r'\s*#')
+_combined = {}
+
+
+def _combined_scanner(rule_names):
+    scanner = _combined.get(rule_names)
+    if scanner is None:
+        scanner = _combined[rule_names] = re.compile('|'.join(
+            f"(?P<{name}>{DANGEROUS_PATTERNS[name]['pattern']})" for name in rule_names))
+    return scanner
+
+
+def rules_version(engines=ENGINES):
+    """Cached results are only valid for the rules and engines that produced them."""
+    key = json.dumps([DANGEROUS_PATTERNS, ENGINE_VERSION, sorted(engines)], sort_keys=True)
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+def scan_lines(text, rule_names=tuple(DANGEROUS_PATTERNS)):
+    """Line-rule findings (without the file) for the given source text."""
+    if not rule_names:
+        return []
+    combined = _combined_scanner(rule_names)
     findings = []
-    
-    # Skip the security linter itself to avoid false positives
-    if 'security-linter.py' in filepath:
-        return findings
-    
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-    except (UnicodeDecodeError, IOError):
-        return findings  # Skip unreadable files
-    
-    for i, line in enumerate(lines, 1):
+    for i, line in enumerate(text.splitlines(), 1):
         # Skip comments and string literals that contain pattern definitions
-        if re.match(r'\s*#', line) or "'pattern':" in line or '"pattern":' in line:
+        if SKIP_LINE.match(line) or "'pattern':" in line or '"pattern":' in line:
             continue
-            
-        for check_name, check in DANGEROUS_PATTERNS.items():
-            if re.search(check['pattern'], line):
+
+        match = combined.search(line)
+        if not match:
+            continue
+
+        for check_name in rule_names:
+            if check_name == match.lastgroup or COMPILED[check_name].search(line):
+                check = DANGEROUS_PATTERNS[check_name]
                 findings.append({
-                    'file': filepath,
                     'line': i,
                     'severity': check['severity'],
                     'message': check['message'],
                     'code': line.strip(),
                     'check': check_name
                 })
-    
     return findings
 
 
-def main():
+def scan_text(text, engines=ENGINES):
+    """Findings (without the file) from the enabled engines for the given source text."""
+    findings = []
+    if 'regex' in engines:
+        superseded = AST_SUPERSEDES if 'ast' in engines else set()
+        findings += scan_lines(text, tuple(name for name in DANGEROUS_PATTERNS if name not in superseded))
+    if 'ast' in engines:
+        findings += analyze_text(text)
+    findings.sort(key=lambda finding: (finding['line'], finding['check']))
+    return findings
+
+
+def _read(filepath):
+    """(content hash, decoded text) of a file, or None if it cannot be read."""
+    try:
+        with open(filepath, 'rb') as f:
+            data = f.read()
+        return hashlib.sha256(data).hexdigest(), data.decode('utf-8')
+    except (UnicodeDecodeError, IOError):
+        return None
+
+
+def _scan_path(filepath, engines=ENGINES):
+    """Worker: (content hash, findings) for one file, or None if unreadable."""
+    read = _read(filepath)
+    if read is None:
+        return None
+    digest, text = read
+    return digest, scan_text(text, engines)
+
+
+def scan_file(filepath, engines=ENGINES):
+    """Scan a single file for security issues."""
+    # Skip the security linter itself to avoid false positives
+    if os.path.basename(filepath) in SELF_NAMES:
+        return []
+
+    result = _scan_path(filepath, engines)
+    if result is None:
+        return []  # Skip unreadable files
+    return [dict(finding, file=filepath) for finding in result[1]]
+
+
+class LintCache:
+    """Findings per file content hash, persisted under the cache directory.
+
+    Unchanged files are never parsed or rescanned, wherever they live; the
+    whole cache is dropped when the rules or engines change.
+    """
+
+    def __init__(self, path=None, enabled=True, version=None):
+        self.path = path or os.path.join(get_cache_dir(), 'security-lint.json')
+        self.enabled = enabled
+        self.version = version or rules_version()
+        self.entries = {}
+        self.used = {}
+        if enabled:
+            try:
+                with open(self.path, 'r') as f:
+                    data = json.load(f)
+                if data.get('rules') == self.version:
+                    self.entries = data.get('files', {})
+            except (IOError, ValueError):
+                pass
+
+    def get(self, digest):
+        findings = self.entries.get(digest)
+        if findings is not None:
+            self.used[digest] = findings
+        return findings
+
+    def put(self, digest, findings):
+        self.used[digest] = findings
+
+    def save(self, prune=True):
+        """Persist the cache; with prune, only the entries used by this run are kept."""
+        if self.enabled:
+            entries = self.used if prune else dict(self.entries, **self.used)
+            write_file_atomic(self.path, json.dumps({'rules': self.version, 'files': entries},
+                                                    separators=(',', ':')))
+
+
+def find_python_files(roots):
+    """Every .py file under the roots (files given directly are kept), minus the linter itself."""
+    files = []
+    for root in roots:
+        if os.path.isfile(root):
+            candidates = [root]
+        else:
+            candidates = [os.path.join(dirpath, name)
+                          for dirpath, dirs, names in os.walk(root)
+                          for name in names if name.endswith('.py')]
+        files.extend(path for path in candidates if os.path.basename(path) not in SELF_NAMES)
+    return sorted(set(files))
+
+
+def repo_root():
+    """Top level of the git work tree, or the current directory outside one."""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--show-toplevel'],
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return os.getcwd()
+
+
+def lint(roots=None, jobs=None, cache=None, engines=ENGINES):
+    """Scan every Python file under the roots; returns (findings, stats).
+
+    Files whose content hash is cached are not rescanned. The rest are
+    scanned in a process pool when there are enough of them.
+    """
+    start = time.perf_counter()
+    cache = cache or LintCache(enabled=False, version=rules_version(engines))
+    files = find_python_files(roots or DEFAULT_ROOTS)
+
+    findings = []
+    misses = []
+    for path in files:
+        read = _read(path) if cache.enabled else None
+        cached = cache.get(read[0]) if read else None
+        if cached is None:
+            misses.append(path)
+        else:
+            findings.extend(dict(finding, file=path) for finding in cached)
+
+    if len(misses) >= PARALLEL_THRESHOLD and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(partial(_scan_path, engines=engines), misses,
+                                    chunksize=max(1, len(misses) // 32)))
+    else:
+        results = [_scan_path(path, engines) for path in misses]
+
+    for path, result in zip(misses, results):
+        if result is None:
+            continue  # Unreadable
+        digest, file_findings = result
+        cache.put(digest, file_findings)
+        findings.extend(dict(finding, file=path) for finding in file_findings)
+    cache.save()
+
+    # Report paths relative to the repository, as --staged does, so fingerprints
+    # are the same whichever directory the linter runs from
+    root = repo_root()
+    for finding in findings:
+        finding['file'] = os.path.relpath(finding['file'], root).replace(os.sep, '/')
+
+    findings.sort(key=lambda finding: (finding['file'], finding['line'], finding['check']))
+    stats = {
+        'files': len(files),
+        'cached': len(files) - len(misses),
+        'scanned': len(misses),
+        'elapsed_ms': (time.perf_counter() - start) * 1000
+    }
+    return findings, stats
+
+
+def staged_line_ranges():
+    """Map each staged .py file (repo-relative) to the [start, end] line ranges it adds or changes."""
+    output = subprocess.run(
+        ['git', 'diff', '--cached', '--unified=0', '--no-color', '--no-ext-diff',
+         '--diff-filter=ACMR', '--', '*.py'],
+        capture_output=True, text=True, check=True).stdout
+
+    ranges = {}
+    path = None
+    for line in output.splitlines():
+        if line.startswith('+++ '):
+            path = line[6:] if line.startswith('+++ b/') else None
+            if path:
+                ranges.setdefault(path, [])
+        elif path and line.startswith('@@'):
+            match = HUNK_HEADER.match(line)
+            if match:
+                start, count = int(match.group(1)), int(match.group(2) or 1)
+                if count:  # count 0 is a pure deletion
+                    ranges[path].append((start, start + count - 1))
+    return {path: spans for path, spans in ranges.items() if spans}
+
+
+def read_staged(paths):
+    """Staged (index) contents of the paths, read with one `git cat-file --batch`."""
+    if not paths:
+        return {}
+    request = ''.join(f":{path}\n" for path in paths).encode()
+    output = subprocess.run(['git', 'cat-file', '--batch'], input=request,
+                            capture_output=True, check=True).stdout
+
+    contents = {}
+    offset = 0
+    for path in paths:
+        end = output.index(b'\n', offset)
+        header = output[offset:end].split()
+        offset = end + 1
+        if len(header) < 3 or header[1] != b'blob':
+            continue  # "missing"
+        size = int(header[2])
+        contents[path] = output[offset:offset + size]
+        offset += size + 1
+    return contents
+
+
+def lint_staged(cache=None, engines=ENGINES):
+    """Lint only the lines added or changed in the staged diff; returns (findings, stats).
+
+    The staged version of each file is analyzed whole (cached by content
+    hash), so taint that flows in from unchanged lines is still seen, but
+    only findings on changed lines are reported. Each finding carries the
+    surrounding lines as context.
+    """
+    start = time.perf_counter()
+    cache = cache or LintCache(enabled=False, version=rules_version(engines))
+    ranges = {path: spans for path, spans in staged_line_ranges().items()
+              if os.path.basename(path) not in SELF_NAMES}
+    contents = read_staged(sorted(ranges))
+
+    findings = []
+    cached = 0
+    for path, data in contents.items():
+        digest = hashlib.sha256(data).hexdigest()
+        try:
+            text = data.decode('utf-8')
+        except UnicodeDecodeError:
+            continue
+        file_findings = cache.get(digest)
+        if file_findings is None:
+            file_findings = scan_text(text, engines)
+            cache.put(digest, file_findings)
+        else:
+            cached += 1
+
+        spans = ranges[path]
+        lines = None
+        for finding in file_findings:
+            if not any(first <= finding['line'] <= last for first, last in spans):
+                continue
+            lines = lines or text.splitlines()
+            first = max(1, finding['line'] - CONTEXT_LINES)
+            last = min(len(lines), finding['line'] + CONTEXT_LINES)
+            findings.append(dict(finding, file=path,
+                                 context=[(number, lines[number - 1]) for number in range(first, last + 1)]))
+    cache.save(prune=False)
+
+    findings.sort(key=lambda finding: (finding['file'], finding['line'], finding['check']))
+    stats = {
+        'files': len(contents),
+        'cached': cached,
+        'scanned': len(contents) - cached,
+        'changed_lines': sum(last - first + 1 for spans in ranges.values() for first, last in spans),
+        'elapsed_ms': (time.perf_counter() - start) * 1000
+    }
+    return findings, stats
+
+
+def rule_descriptions(engines=ENGINES):
+    """check -> (severity, message) for every active check, for SARIF rule metadata."""
+    rules = {}
+    if 'regex' in engines:
+        superseded = AST_SUPERSEDES if 'ast' in engines else set()
+        rules.update((name, (check['severity'], check['message']))
+                     for name, check in DANGEROUS_PATTERNS.items() if name not in superseded)
+    if 'ast' in engines:
+        rules.update((name, (severity, message.format(source='input')))
+                     for name, (severity, message) in AST_CHECKS.items())
+    return rules
+
+
+def _profile_sources(roots, staged):
+    """(path, text) pairs for --profile, from the staged blobs or the files under the roots."""
+    if staged:
+        blobs = read_staged(sorted(staged_line_ranges()))
+        return [(path, data.decode('utf-8', errors='replace')) for path, data in blobs.items()]
+    sources = []
+    for path in find_python_files(roots):
+        read = _read(path)
+        if read:
+            sources.append((os.path.relpath(path), read[1]))
+    return sources
+
+
+def main(argv=None):
     """Run security linter on all Python files."""
-    # Find all Python files in scripts directory
-    script_files = []
-    for root, dirs, files in os.walk('scripts'):
-        for file in files:
-            if file.endswith('.py'):
-                script_files.append(os.path.join(root, file))
-    
-    if not script_files:
-        print("No Python files found in scripts/ directory")
-        return 0
-    
-    all_findings = []
-    
-    for file in script_files:
-        findings = scan_file(file)
-        all_findings.extend(findings)
-    
-    # Report findings
-    if all_findings:
-        print("🔒 Security Linter Results:\n")
-        
-        high_count = 0
-        medium_count = 0
-        
-        for finding in all_findings:
-            severity_icon = "🚨" if finding['severity'] == 'HIGH' else "⚠️"
-            print(f"{severity_icon} {finding['severity']}: {finding['file']}:{finding['line']}")
-            print(f"   {finding['message']}")
-            print(f"   > {finding['code']}")
-            print()
-            
-            if finding['severity'] == 'HIGH':
-                high_count += 1
-            else:
-                medium_count += 1
-        
-        print(f"Summary: {high_count} HIGH, {medium_count} MEDIUM severity issues")
-        
-        # Exit with error if HIGH severity found
-        if high_count > 0:
-            print("\n❌ HIGH severity issues found - fix before committing!")
+    parser = argparse.ArgumentParser(description="Security linter for the PwDocs scripts and processors")
+    parser.add_argument('roots', nargs='*', help="Files or directories to scan (default: Scripts and Processors)")
+    parser.add_argument('--staged', action='store_true', help="Only lint lines changed in the staged diff")
+    parser.add_argument('--engine', choices=['all', 'regex', 'ast'], default='all', help="Which engines to run")
+    parser.add_argument('--jobs', type=int, help="Worker processes for large scans")
+    parser.add_argument('--no-cache', action='store_true', help="Ignore and don't update the results cache")
+    parser.add_argument('--format', choices=sorted(RENDERERS), default='text', help="Output format")
+    parser.add_argument('--baseline', help="Only fail on findings whose fingerprint is not in this file")
+    parser.add_argument('--write-baseline', metavar='PATH', help="Write the current findings as a baseline")
+    parser.add_argument('--profile', action='store_true', help="Time every rule and file and flag slow rules")
+    args = parser.parse_args(argv)
+
+    engines = ENGINES if args.engine == 'all' else (args.engine,)
+    roots = args.roots or DEFAULT_ROOTS
+    cache = LintCache(enabled=not args.no_cache, version=rules_version(engines))
+    if args.staged:
+        try:
+            all_findings, stats = lint_staged(cache, engines)
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"❌ Could not read the staged diff: {e}")
             return 1
-        else:
-            print("\n⚠️ Medium severity issues found - consider fixing")
+        if not stats['files'] and args.format == 'text':
+            print("✅ No staged Python changes to check")
             return 0
     else:
-        print("✅ No security issues found!")
-        return 0
+        all_findings, stats = lint(roots, args.jobs, cache, engines)
+        if not stats['files'] and args.format == 'text':
+            print("No Python files found to scan")
+            return 0
+
+    print(f"🔍 Scanned {stats['files']} file(s) ({stats['cached']} cached) "
+          f"in {stats['elapsed_ms']:.0f}ms", file=sys.stderr)
+
+    add_fingerprints(all_findings)
+    if args.baseline:
+        try:
+            apply_baseline(all_findings, load_baseline(args.baseline))
+        except (IOError, ValueError) as e:
+            print(f"❌ Could not read baseline {args.baseline}: {e}", file=sys.stderr)
+            return 1
+    if args.write_baseline:
+        write_baseline(args.write_baseline, all_findings)
+        print(f"📝 Wrote {len(all_findings)} fingerprint(s) to {args.write_baseline}", file=sys.stderr)
+
+    if args.profile:
+        stats['profile'] = profile(_profile_sources(roots, args.staged), COMPILED, SKIP_LINE, engines)
+        print_profile(stats['profile'])
+
+    summary = summarize(all_findings)
+    if args.format == 'sarif':
+        print(RENDERERS['sarif'](all_findings, stats, summary, rule_descriptions(engines)))
+    else:
+        print(RENDERERS[args.format](all_findings, stats, summary))
+
+    # Exit with error if new HIGH severity findings
+    return 1 if summary['new_high'] else 0
 
 
 if __name__ == '__main__':
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
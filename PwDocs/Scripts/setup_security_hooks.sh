@@ -15,7 +15,7 @@ fi
 
 # Test the security linter
 echo "🧪 Testing security linter..."
-python scripts/security-linter.py
+python PwDocs/Scripts/security_linter.py
 
 linter_exit=$?
 if [ $linter_exit -eq 0 ]; then
@@ -31,5 +31,5 @@ fi
 echo "🎉 Security hooks setup complete!"
 echo ""
 echo "Usage:"
-echo "  python scripts/security-linter.py    # Manual run"
+echo "  python PwDocs/Scripts/security_linter.py    # Manual run"
 echo "  git commit                           # Auto-runs on commit"
\ No newline at end of file
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Output formats for the documentation state summary."""
+
+import os
+import json
+import html
+from urllib.parse import quote
+from roadmap_index import ROADMAP_FILE
+from Processors.shared_utils import escape_markdown
+
+FOOTER = "Use `gdocs` alias to pull latest issues and regenerate this summary"
+
+
+def link_target(path, base_dir='.'):
+    """URL for a repository path, relative to the directory the page is written to.
+
+    Percent-encoded, so names with spaces or parentheses
+    (``staged_enrichment_status (1).md``) still make working links.
+    """
+    return quote(os.path.relpath(path, base_dir or '.').replace(os.sep, '/'))
+
+
+def _markdown_link(path, base_dir):
+    text = path.replace('[', r'\[').replace(']', r'\]')
+    return f"[{text}]({link_target(path, base_dir)})"
+
+
+def render_markdown(state, base_dir='.'):
+    """Render the state as the Documentation-State.md page.
+
+    Links are relative to base_dir, the directory the page is written to.
+    """
+    sections = state['sections']
+    lines = ["# 📊 Documentation State Summary",
+             f"\n*Generated: {state['generated']}*\n"]
+
+    if 'core_docs' in sections:
+        lines.append("## 📚 Core Documentation Status\n")
+        lines.append("| Document | Last Update | Age | Status | Link |")
+        lines.append("|----------|-------------|-----|--------|------|")
+        for doc in sections['core_docs']:
+            update_str = f"{doc['last_update']} ({doc['issue']})" if doc['last_update'] else "No changelog"
+            lines.append(f"| {doc['name']} | {update_str} | {doc['age_days']}d | {doc['status']} "
+                         f"| {_markdown_link(doc['path'], base_dir)} |")
+
+    if 'staleness' in sections:
+        staleness = sections['staleness']
+        lines.append("\n## 🗂️ Documentation Staleness\n")
+        totals = " · ".join(f"{label} {count}" for label, count in zip(staleness['bands'], staleness['totals']))
+        lines.append(f"**{staleness['files']} documents**: {totals}\n")
+        directories = _stalest_directories(staleness)
+        if directories:
+            lines.append("| Directory | " + " | ".join(staleness['bands']) + " |")
+            lines.append("|-----------|" + "---|" * len(staleness['bands']))
+            for directory, histogram in directories:
+                lines.append(f"| {directory} | " + " | ".join(str(count) for count in histogram) + " |")
+        if staleness['stalest']:
+            lines.append("\n**Stalest documents:**")
+            for item in staleness['stalest']:
+                lines.append(f"- {item['status']} {item['age_days']}d: {_markdown_link(item['path'], base_dir)}")
+
+    if 'sprint' in sections:
+        lines.append("\n## 🏃 Current Sprint\n")
+        sprint = sections['sprint']
+        if sprint:
+            lines.append(f"**Phase {sprint['phase']}**: {sprint['title']}")
+            lines.append(f"- **Duration**: {sprint['duration']}")
+            lines.append(f"- **Details**: [View Roadmap]({link_target(ROADMAP_FILE, base_dir)}#phase-{sprint['phase']})")
+            if sprint.get('also_in_progress'):
+                others = ", ".join(f"Phase {num}" for num in sprint['also_in_progress'])
+                lines.append(f"- **Also in progress**: {others}")
+        else:
+            lines.append("*No active sprint found in roadmap*")
+
+    for key, heading, noun in [('bugs', "🐛 Open Bugs", "bugs"),
+                               ('questions', "❓ Open Questions", "questions")]:
+        if key not in sections:
+            continue
+        lines.append(f"\n## {heading}\n")
+        section = sections[key]
+        if section['top']:
+            for item in section['top']:
+                priority = item.get('priority')
+                label = f" - **{priority}**" if priority and priority.upper() != 'TBD' else ""
+                lines.append(f"- {item['issue']}: {escape_markdown(item['title'])}{label} "
+                             f"([view]({link_target(item['path'], base_dir)}))")
+            remaining = section['count'] - len(section['top'])
+            if remaining > 0:
+                lines.append(f"\n*...and {remaining} more {noun}*")
+        else:
+            lines.append(f"*No open {noun} found*")
+
+    if 'features' in sections or 'updates' in sections:
+        lines.append("\n## 🔄 Recent Issue Processing\n")
+        features = sections.get('features', {}).get('newest')
+        if features:
+            lines.append("### Latest Features")
+            for item in features:
+                lines.append(f"- {item['issue']}: {item['name']} ([view]({link_target(item['path'], base_dir)}))")
+        updates = sections.get('updates', {}).get('newest')
+        if updates:
+            lines.append("\n### Latest Documentation Updates")
+            for item in updates:
+                lines.append(f"- {item['issue']}: {item['name']} ([view]({link_target(item['path'], base_dir)}))")
+
+    lines.append("\n---")
+    lines.append(f"\n*{FOOTER}*")
+    return "\n".join(lines) + "\n"
+
+
+def _stalest_directories(staleness, limit=10):
+    """Directories with the most aging and stale documents, worst first."""
+    ranked = sorted(staleness['directories'].items(),
+                    key=lambda item: (item[1][-1], item[1][-2]), reverse=True)
+    return [(directory, histogram) for directory, histogram in ranked[:limit]
+            if histogram[-1] or histogram[-2]]
+
+
+def render_json(state, base_dir='.'):
+    """Render the state as JSON for CI and other tools."""
+    return json.dumps(state, indent=2, ensure_ascii=False) + "\n"
+
+
+def _html_list(items, key, base_dir):
+    if not items:
+        return "<p><em>None</em></p>"
+    rows = "".join(
+        f'<li>{html.escape(item["issue"])}: {html.escape(item[key])} '
+        f'(<a href="{html.escape(link_target(item["path"], base_dir))}">view</a>)</li>'
+        for item in items)
+    return f"<ul>{rows}</ul>"
+
+
+def render_html(state, base_dir='.'):
+    """Render the state as a self-contained static HTML page."""
+    sections = state['sections']
+    body = ["<h1>Documentation State Summary</h1>",
+            f"<p><em>Generated: {html.escape(state['generated'])}</em></p>"]
+
+    if 'core_docs' in sections:
+        rows = "".join(
+            f"<tr><td>{html.escape(doc['name'])}</td>"
+            f"<td>{html.escape(doc['last_update'] or 'No changelog')}</td>"
+            f"<td>{doc['age_days']}d</td><td>{html.escape(doc['status'])}</td>"
+            f'<td><a href="{html.escape(link_target(doc["path"], base_dir))}">{html.escape(doc["path"])}</a></td></tr>'
+            for doc in sections['core_docs'])
+        body.append("<h2>Core Documentation Status</h2>")
+        body.append("<table><tr><th>Document</th><th>Last Update</th><th>Age</th>"
+                    f"<th>Status</th><th>Link</th></tr>{rows}</table>")
+
+    if 'staleness' in sections:
+        staleness = sections['staleness']
+        header = "".join(f"<th>{html.escape(label)}</th>" for label in staleness['bands'])
+        rows = "".join(
+            f"<tr><td>{html.escape(directory)}</td>" +
+            "".join(f"<td>{count}</td>" for count in histogram) + "</tr>"
+            for directory, histogram in _stalest_directories(staleness))
+        body.append("<h2>Documentation Staleness</h2>")
+        body.append(f"<p>{staleness['files']} documents</p>")
+        body.append(f"<table><tr><th>Directory</th>{header}</tr>{rows}</table>")
+
+    if 'sprint' in sections:
+        body.append("<h2>Current Sprint</h2>")
+        sprint = sections['sprint']
+        if sprint:
+            body.append(f"<p><strong>Phase {html.escape(sprint['phase'])}</strong>: "
+                        f"{html.escape(sprint['title'])} ({html.escape(sprint['duration'])})</p>")
+        else:
+            body.append("<p><em>No active sprint found in roadmap</em></p>")
+
+    for key, heading, field in [('bugs', "Open Bugs", 'top'),
+                                ('questions', "Open Questions", 'top'),
+                                ('features', "Latest Features", 'newest'),
+                                ('updates', "Latest Documentation Updates", 'newest')]:
+        if key in sections:
+            body.append(f"<h2>{heading}</h2>")
+            body.append(_html_list(sections[key][field], 'title' if field == 'top' else 'name', base_dir))
+
+    return ("<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+            "<title>Documentation State</title>"
+            "<style>body{font-family:sans-serif;max-width:60em;margin:auto}"
+            "table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:4px 8px}</style>"
+            "</head><body>\n" + "\n".join(body) + "\n</body></html>\n")
+
+
+RENDERERS = {
+    'markdown': render_markdown,
+    'json': render_json,
+    'html': render_html,
+}
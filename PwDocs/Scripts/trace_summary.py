@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Per-stage latency percentiles across issue pipeline traces."""
+
+import os
+import sys
+import json
+from Processors.shared_utils import get_cache_dir
+from Processors.tracing import read_traces, summarize, get_trace_path, DEFAULT_TRACE_FILE, PERCENTILES
+
+
+def print_usage():
+    print("Usage:")
+    print("  trace_summary.py [trace.jsonl ...] [--json]  # Stage latencies (default: PWDOCS_TRACE file)")
+    print()
+    print("Record traces by running process_issue.py with PWDOCS_TRACE=1 (or a file path).")
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    if '--help' in args or '-h' in args:
+        print_usage()
+        sys.exit(0)
+
+    as_json = '--json' in args
+    paths = [arg for arg in args if arg != '--json']
+    if not paths:
+        paths = [get_trace_path() or os.path.join(get_cache_dir(), 'traces', DEFAULT_TRACE_FILE)]
+    missing = [path for path in paths if not os.path.exists(path)]
+    if missing:
+        print(f"❌ Error: No trace file at {', '.join(missing)}")
+        print_usage()
+        sys.exit(1)
+
+    records = read_traces(paths)
+    stages = summarize(records)
+    if as_json:
+        print(json.dumps(stages, indent=2))
+        sys.exit(0)
+    if not stages:
+        print("No spans recorded")
+        sys.exit(0)
+
+    runs = len({record.get('trace') for record in records if record.get('parent') is None})
+    print(f"📊 {len(records)} span(s) from {runs} run(s)\n")
+    columns = [f"p{p}" for p in PERCENTILES]
+    print(f"{'stage':<12} {'count':>6} {'mean':>9} " + ' '.join(f"{c:>9}" for c in columns)
+          + f" {'max':>9} {'share':>6} {'errors':>6}")
+    for stage in stages:
+        print(f"{stage['stage']:<12} {stage['count']:>6} {stage['mean_ms']:>7.1f}ms "
+              + ' '.join(f"{stage[f'{c}_ms']:>7.1f}ms" for c in columns)
+              + f" {stage['max_ms']:>7.1f}ms {stage['share']:>6.0%} {stage['errors']:>6}")
@@ -0,0 +1,201 @@
+"""Shared pytest setup: import paths for Processors and Scripts, a scratch working tree and a fake GitHub server."""
+
+import os
+import sys
+import json
+import atexit
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, unquote
+
+import pytest
+
+PWDOCS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPTS_DIR = os.path.join(PWDOCS_DIR, 'Scripts')
+for path in (SCRIPTS_DIR, PWDOCS_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from Processors.metrics import _flush_at_exit, get_registry
+
+
+class FakeGitHub(ThreadingHTTPServer):
+    """Enough of the GitHub issues REST API on localhost to exercise the clients.
+
+    `issues` maps numbers to {'title', 'state', 'labels', 'updated_at'}
+    (plus 'pull_request' for PRs). Responses queued with `script()` are
+    served, in order, before normal handling; `on_request(method, path,
+    query)` runs before each request is answered, e.g. to edit an issue
+    mid-sync. Every request is logged as (method, path, query, headers).
+    Set `now` (epoch seconds) to pin the Date header.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _FakeGitHubHandler)
+        self.url = f"http://127.0.0.1:{self.server_address[1]}"
+        self.repo = 'octo/docs'
+        self.issues = {}
+        self.comments = []
+        self.log = []
+        self.scripted = []
+        self.rate_limit = {'limit': 5000, 'remaining': 4999, 'reset': 0}
+        self.on_request = None
+        self.now = None
+        self.lock = threading.Lock()
+
+    def add_issue(self, number, updated_at, labels=(), state='open', title=None, pull_request=False):
+        issue = {'number': number, 'title': title or f"Issue {number}", 'state': state,
+                 'labels': list(labels), 'updated_at': updated_at}
+        if pull_request:
+            issue['pull_request'] = {'url': f"{self.url}/pulls/{number}"}
+        self.issues[number] = issue
+        return issue
+
+    def script(self, status, body=None, headers=None):
+        """Answer the next request with this response instead of handling it."""
+        self.scripted.append((status, body, headers or {}))
+
+    def requests(self, method=None):
+        return [entry for entry in self.log if method is None or entry[0] == method]
+
+
+class _FakeGitHubHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def date_time_string(self, timestamp=None):
+        return super().date_time_string(self.server.now if timestamp is None else timestamp)
+
+    def _send(self, status, body=None, headers=None):
+        data = json.dumps(body).encode() if body is not None else b''
+        rate = self.server.rate_limit
+        self.send_response(status)
+        self.send_header('X-RateLimit-Limit', str(rate['limit']))
+        self.send_header('X-RateLimit-Remaining', str(rate['remaining']))
+        self.send_header('X-RateLimit-Reset', str(rate['reset']))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_cacheable(self, body, headers=None):
+        etag = '"' + hashlib.sha1(json.dumps(body, sort_keys=True).encode()).hexdigest() + '"'
+        headers = dict(headers or {}, ETag=etag)
+        if self.headers.get('If-None-Match') == etag:
+            return self._send(304, None, headers)
+        self._send(200, body, headers)
+
+    def _handle(self, method):
+        server = self.server
+        url = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        with server.lock:
+            server.log.append((method, url.path, query, dict(self.headers)))
+            scripted = server.scripted.pop(0) if server.scripted else None
+        if server.on_request:
+            server.on_request(method, url.path, query)
+        if scripted:
+            return self._send(*scripted)
+
+        prefix = f"/repos/{server.repo}/issues"
+        parts = url.path[len(prefix):].strip('/').split('/') if url.path.startswith(prefix) else None
+        if parts is None:
+            return self._send(404, {'message': "Not Found"})
+        if parts == ['']:
+            return self._list_issues(query)
+        issue = server.issues.get(int(parts[0]))
+        if issue is None:
+            return self._send(404, {'message': "Not Found"})
+        if len(parts) == 1:
+            return self._send_cacheable(self._render(issue))
+        if parts[1] == 'labels':
+            if method == 'POST':
+                issue['labels'] += [label for label in body['labels'] if label not in issue['labels']]
+            elif method == 'DELETE':
+                issue['labels'].remove(unquote(parts[2]))
+            return self._send(200, [{'name': label} for label in issue['labels']])
+        if parts[1] == 'comments' and method == 'POST':
+            server.comments.append((issue['number'], body['body']))
+            return self._send(201, {'id': len(server.comments), 'body': body['body']})
+        self._send(404, {'message': "Not Found"})
+
+    def _render(self, issue):
+        return dict(issue, labels=[{'name': label} for label in issue['labels']])
+
+    def _list_issues(self, query):
+        issues = list(self.server.issues.values())
+        if query.get('state', 'open') != 'all':
+            issues = [issue for issue in issues if issue['state'] == query.get('state', 'open')]
+        if 'since' in query:
+            issues = [issue for issue in issues if issue['updated_at'] >= query['since']]
+        if 'labels' in query:
+            wanted = set(query['labels'].split(','))
+            issues = [issue for issue in issues if wanted <= set(issue['labels'])]
+        issues.sort(key=lambda issue: (issue['updated_at'], issue['number']),
+                    reverse=query.get('direction', 'desc') == 'desc')
+
+        per_page, page = int(query.get('per_page', 30)), int(query.get('page', 1))
+        last = max(1, -(-len(issues) // per_page))
+        chunk = [self._render(issue) for issue in issues[(page - 1) * per_page:page * per_page]]
+        base = f"{self.server.url}/repositories/1/issues?per_page={per_page}"
+        links = [f'<{base}&page={page + 1}>; rel="next"'] if page < last else []
+        links.append(f'<{base}&page={last}>; rel="last"')
+        self._send_cacheable(chunk, {'Link': ', '.join(links)})
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_DELETE(self):
+        self._handle('DELETE')
+
+
+@pytest.fixture(autouse=True)
+def metrics_off(monkeypatch):
+    """Keep test runs out of .pwdocs-cache/metrics, and start every test from an empty registry.
+
+    Gauges survive reset(), so the flush at exit is dropped as well.
+    """
+    monkeypatch.setenv('PWDOCS_METRICS', 'off')
+    atexit.unregister(_flush_at_exit)
+    registry = get_registry()
+    registry.reset()
+    yield registry
+    registry.reset()
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run the test from an empty tmp_path, so relative Content/ paths stay inside it."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(text)
+
+
+@pytest.fixture
+def write():
+    """write(path, text): create a text file and any missing parent directories."""
+    return _write
+
+
+@pytest.fixture
+def fake_github():
+    server = FakeGitHub()
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,141 @@
+"""Issue section collection from the Content tree, and watch-mode section signatures."""
+
+import os
+
+import pytest
+
+from documentation_state import (collect_issue_sections, section_signature, read_issue_header,
+                                 issue_rank, CORE_DOCS, HEADER_BYTES, TAIL_BYTES)
+from scan_cache import ScanCache
+
+
+@pytest.fixture
+def tree(workdir, write):
+    for path in ('Content/Guides/setup.md', 'ClaudeDocs/notes.md', CORE_DOCS[-1]):
+        write(path, "# Draft\n")
+    return workdir
+
+
+def touch(path, seconds):
+    os.utime(path, ns=(seconds * 10**9, seconds * 10**9))
+
+
+@pytest.fixture
+def features(workdir, write):
+    root = 'Content/Issues/Features-Proposed'
+    for age, name in enumerate(['7-dark-mode', '12-export-pdf', '3-autosave', '30-tags', '21-search',
+                                '5-themes', '9-sync']):
+        write(f'{root}/{name}/README.md', "# Feature\n")
+        touch(f'{root}/{name}', 1_700_000_000 + age)
+    write(f'{root}/40-draft/notes.md', "No README yet\n")
+    write(f'{root}/README.md', "# Proposed features\n")
+    return root
+
+
+def test_issue_sections_count_directories_with_their_marker_file(features):
+    section = collect_issue_sections(names=['features'])['features']
+    assert section['count'] == 7
+    # Unranked sections list the first names; newest follows the directory mtime
+    assert [item['name'] for item in section['top']] == [
+        '12-export-pdf', '21-search', '3-autosave', '30-tags', '5-themes']
+    assert [item['name'] for item in section['newest']] == ['9-sync', '5-themes', '21-search']
+    assert section['newest'][0] == {
+        'issue': '#9', 'title': 'Sync', 'name': '9-sync',
+        'path': os.path.join(features, '9-sync', 'README.md')}
+
+
+def test_missing_section_directories_are_empty(workdir):
+    sections = collect_issue_sections()
+    assert set(sections) == {'bugs', 'questions', 'features', 'updates'}
+    assert all(section == {'count': 0, 'top': [], 'newest': []} for section in sections.values())
+
+
+def test_cached_listings_follow_new_issues(features, write, tmp_path):
+    cache = ScanCache(str(tmp_path / 'cache.json'))
+    first = collect_issue_sections(cache, names=['features'])
+    assert cache.hits == 0
+    assert collect_issue_sections(cache, names=['features']) == first
+    assert cache.hits == cache.misses
+
+    write(f'{features}/40-draft/README.md', "# Feature\n")
+    touch(f'{features}/40-draft', 1_800_000_000)
+    section = collect_issue_sections(cache, names=['features'])['features']
+    assert section['count'] == 8
+    assert section['newest'][0]['name'] == '40-draft'
+
+
+def issue_document(status_blocks, body_bytes=0):
+    """A bug report as the processors write it, with a body of the given size."""
+    text = "# Bug Report: Crash on save\n\n- **Processed**: 2026-09-01T10:00:00\n\n"
+    text += "x" * body_bytes + "\n"
+    for status, priority in status_blocks:
+        text += f"\n## Status\n- Status: {status}\n- Priority: {priority}\n"
+    return text
+
+
+def test_issue_header_reads_the_head_and_the_tail(workdir, write):
+    # The body pushes the first Status block out of both bounded reads
+    write('bug.md', issue_document([('Open', 'Low')], HEADER_BYTES)
+          + "y" * (TAIL_BYTES * 2) + "\n- Status: Fixed\n- Priority: High\n")
+    assert read_issue_header('bug.md') == {
+        'title': 'Crash on save', 'processed': '2026-09-01T10:00:00',
+        'status': 'Fixed', 'priority': 'High'}
+
+
+def test_issue_header_of_a_short_file_takes_the_last_status(workdir, write):
+    write('bug.md', issue_document([('Open', 'Low'), ('Closed', 'Medium')]))
+    header = read_issue_header('bug.md')
+    assert (header['status'], header['priority']) == ('Closed', 'Medium')
+
+
+def test_issue_header_without_fields(workdir, write):
+    write('bug.md', "Notes only\n")
+    assert read_issue_header('bug.md') == {
+        'title': None, 'processed': None, 'status': None, 'priority': None}
+    assert read_issue_header('missing.md') is None
+
+
+def test_issue_rank_orders_open_then_priority_then_oldest():
+    headers = {
+        'closed-critical': {'status': 'Resolved', 'priority': 'Critical', 'processed': '2026-01-01'},
+        'low': {'status': 'Open', 'priority': 'Low', 'processed': '2026-01-01'},
+        'high-new': {'status': 'Open', 'priority': 'HIGH', 'processed': '2026-09-01'},
+        'high-old': {'status': None, 'priority': 'high', 'processed': '2026-02-01'},
+        'tbd': {'status': 'Open', 'priority': 'TBD', 'processed': '2026-01-01'},
+        'unprocessed': {'status': 'Open', 'priority': 'Low', 'processed': None},
+        'empty': {},
+    }
+    ranked = sorted(headers, key=lambda name: issue_rank(headers[name]))
+    assert ranked == ['high-old', 'high-new', 'low', 'unprocessed', 'tbd', 'empty',
+                      'closed-critical']
+    assert issue_rank({}) == (False, 4, '9999-99-99')
+
+
+def edit_in_place(path, text):
+    """Rewrite a file without touching its directory's mtime, as most editors' saves do."""
+    directory = os.path.dirname(os.path.abspath(path))
+    before = os.stat(directory)
+    with open(path, 'w') as f:
+        f.write(text)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    os.utime(directory, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+
+@pytest.mark.parametrize('section, path', [
+    ('staleness', 'Content/Guides/setup.md'),
+    ('staleness', 'ClaudeDocs/notes.md'),
+    ('core_docs', CORE_DOCS[-1]),
+])
+def test_in_place_edits_change_the_signature(tree, section, path):
+    before = section_signature(section)
+    edit_in_place(path, "# Draft\n\nRevised.\n")
+    assert section_signature(section) != before
+
+
+def test_unrelated_files_leave_staleness_alone(tree):
+    before = section_signature('staleness')
+    (tree / 'Content' / 'Guides' / 'diagram.png').write_bytes(b'png')
+    assert section_signature('staleness') == before
+    (tree / 'Content' / 'Guides' / 'new.md').write_text("# New\n")
+    assert section_signature('staleness') != before
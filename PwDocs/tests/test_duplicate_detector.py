@@ -0,0 +1,72 @@
+"""MinHash/LSH duplicate detection finds reworded issues and ignores unrelated ones."""
+
+import pytest
+
+from Processors.duplicate_detector import (
+    DuplicateIndex, extract_issue_text, format_duplicate_notice, shingles, signature, similarity
+)
+
+EXPORT_BUG = ("Export to PDF crashes with custom fonts",
+              "When I export a manuscript to PDF with a custom font selected, the app crashes "
+              "immediately. Steps: open a project, choose a custom font in settings, export to PDF.")
+EXPORT_BUG_AGAIN = ("PDF export crash when using a custom font",
+                    "Exporting a manuscript to PDF with a custom font selected makes the app crash "
+                    "immediately. Steps: open a project, pick a custom font in settings, export to PDF.")
+DARK_MODE = ("Add a dark mode toggle",
+             "Writers working at night would like a dark theme with a toggle in the settings panel.")
+
+
+@pytest.fixture
+def index(workdir):
+    index = DuplicateIndex(db_path='duplicates/index.sqlite3')
+    yield index
+    index.close()
+
+
+def test_signature_estimates_jaccard_similarity():
+    first, second = shingles(*EXPORT_BUG), shingles(*EXPORT_BUG_AGAIN)
+    jaccard = len(first & second) / len(first | second)
+    assert abs(similarity(signature(first), signature(second)) - jaccard) < 0.15
+    assert similarity(signature(first), signature(first)) == 1.0
+    assert signature(set()) is None
+
+
+def test_finds_reworded_duplicates_only(index):
+    index.add(12, *EXPORT_BUG)
+    index.add(13, *DARK_MODE)
+    matches = index.find(*EXPORT_BUG_AGAIN, threshold=0.3)
+    assert [match['number'] for match in matches] == [12]
+    assert index.find("Timeline view for chapters", "Show chapters on a timeline.") == []
+    assert index.find(*EXPORT_BUG, exclude=12) == []
+
+
+def test_add_replaces_an_issue(index):
+    index.add(12, *EXPORT_BUG)
+    index.add(12, *DARK_MODE)
+    assert index.count() == 1
+    assert index.find(*EXPORT_BUG) == []
+    assert [match['number'] for match in index.find(*DARK_MODE)] == [12]
+
+
+def test_build_reads_generated_issue_documents(index, write):
+    write('Content/Issues/Bugs/12-export-crash/bug-report.md',
+          f"# Bug Report: {EXPORT_BUG[0]}\n\n"
+          "⚠️ **POSSIBLE DUPLICATE**\nThis issue looks similar to existing issues:\n- #3 Old (60% similar)\n\n"
+          "## GitHub Issue Reference\n- **Issue**: [#12](https://example.invalid/12)\n\n"
+          f"## Issue Description\n\n{EXPORT_BUG[1]}\n\n## Status\n\n- Status: Open\n")
+    write('Content/Issues/Closed/Other/13-dark-mode/README.md', f"# Feature: {DARK_MODE[0]}\n\n{DARK_MODE[1]}\n")
+    write('Content/Issues/Bugs/README.md', "# Bugs\n")
+
+    title, body = extract_issue_text('Content/Issues/Bugs/12-export-crash/bug-report.md')
+    assert (title, body.strip()) == EXPORT_BUG
+    assert index.build('Content/Issues') == 2
+    assert index.find(*EXPORT_BUG)[0]['similarity'] == 1.0
+    assert [match['number'] for match in index.find(*DARK_MODE)] == [13]
+
+
+def test_notice_lists_matches():
+    assert format_duplicate_notice([]) == ""
+    assert format_duplicate_notice([{'number': 12, 'title': "Export crash", 'similarity': 0.75}]) == (
+        "⚠️ **POSSIBLE DUPLICATE**\n"
+        "This issue looks similar to existing issues:\n"
+        "- #12 Export crash (75% similar)\n\n")
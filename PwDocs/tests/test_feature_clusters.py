@@ -0,0 +1,67 @@
+"""TF-IDF clustering finds overlapping feature proposals with exact cosine similarities."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from Processors.feature_clusters import (
+    TfidfMatrix, collect_proposals, consolidation_groups, similar_pairs, cluster
+)
+
+
+def dense_similarities(matrix):
+    vectors = np.zeros(matrix.shape)
+    vectors[matrix.rows(), matrix.indices] = matrix.data
+    return vectors @ vectors.T
+
+
+@pytest.mark.parametrize('dense_min_df, block_rows', [(0, 7), (3, 512), (10**9, 64)])
+def test_similar_pairs_match_dense_cosine(dense_min_df, block_rows):
+    rng = random.Random(48)
+    words = [f"term{i}" for i in range(400)]
+    weights = [1 / (i + 1) for i in range(400)]
+    texts = [' '.join(rng.choices(words, weights, k=rng.randint(5, 80))) for _ in range(150)]
+    matrix = TfidfMatrix.from_texts(texts)
+    expected = dense_similarities(matrix)
+
+    first, second, similarity = similar_pairs(matrix, 0.2, dense_min_df, block_rows)
+    upper = np.triu_indices(matrix.shape[0], 1)
+    wanted = expected[upper] >= 0.2
+    assert set(zip(first.tolist(), second.tolist())) == set(zip(upper[0][wanted], upper[1][wanted]))
+    assert np.allclose(similarity, expected[first, second], atol=1e-5)
+
+
+def test_rows_are_unit_vectors():
+    matrix = TfidfMatrix.from_texts(["export pdf fonts", "export export csv", ""])
+    norms = np.sqrt(np.diag(dense_similarities(matrix)))
+    assert np.allclose(norms, [1, 1, 0])
+
+
+def test_large_groups_split_at_higher_thresholds():
+    # A chain 0-1-2-3 where only 0-1 and 2-3 are tight
+    first, second, similarity = np.array([0, 1, 2]), np.array([1, 2, 3]), np.array([0.9, 0.4, 0.8])
+    assert sorted(members for members, _ in cluster(5, first, second, similarity, 0.35, max_group=4)) == [
+        [0, 1, 2, 3]]
+    assert sorted(members for members, _ in cluster(5, first, second, similarity, 0.35, max_group=2)) == [
+        [0, 1], [2, 3]]
+
+
+def test_groups_overlapping_proposals(workdir, write):
+    root = 'Content/Issues/Features-Proposed'
+    write(f'{root}/README.md', "# Proposed features\n")
+    write(f'{root}/Cost-Tracking-System.md',
+          "# Cost Tracking System\n\nTrack token spend per agent run and budget alerts for model costs.")
+    write(f'{root}/7-token-budget/README.md',
+          "# Feature: Token budget alerts\n\nAlert when agent token spend exceeds the model cost budget.")
+    write(f'{root}/7-token-budget/status.md', "## Status: Token budget alerts\n")
+    write(f'{root}/Dark-Mode.md', "# Dark mode\n\nA dark theme for the editor with a settings toggle.")
+
+    paths = collect_proposals((root,))
+    assert paths == [f'{root}/7-token-budget/README.md', f'{root}/Cost-Tracking-System.md',
+                     f'{root}/Dark-Mode.md']
+    groups = consolidation_groups(paths, threshold=0.2)
+    assert [sorted(group['paths']) for group in groups] == [paths[:2]]
+    assert 0.2 <= groups[0]['similarity'] <= 1
+    assert 'budget' in groups[0]['terms']
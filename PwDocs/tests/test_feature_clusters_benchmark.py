@@ -0,0 +1,68 @@
+"""Benchmark tier: feature proposal clustering timed from 250 to 8000 documents.
+
+Skipped unless PWDOCS_BENCHMARK is set:
+
+    PWDOCS_BENCHMARK=1 python -m pytest PwDocs/tests -k benchmark -s
+
+Documents are 400 words drawn from a Zipf-distributed 30k-word vocabulary.
+Building the TF-IDF vectors should grow linearly with the document count;
+pairwise similarity is quadratic by nature, so a step fails only when it
+grows faster than that.
+"""
+
+import os
+import math
+import time
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from Processors.feature_clusters import TfidfMatrix, similar_pairs, cluster, DEFAULT_THRESHOLD
+
+MODE = os.environ.get('PWDOCS_BENCHMARK', '')
+
+SIZES = [250, 500, 1000, 2000, 4000, 8000]
+VOCABULARY = 30_000
+WORDS_PER_DOCUMENT = 400
+
+# Allowed growth exponent per stage; steps faster than MIN_TIMED_SECONDS are too noisy to judge
+MAX_EXPONENT = {'tfidf': 1.5, 'pairs': 2.5}
+MIN_TIMED_SECONDS = 0.05
+
+
+def _corpus(size, seed=48):
+    rng = np.random.default_rng(seed)
+    weights = 1 / np.arange(1, VOCABULARY + 1) ** 1.1
+    words = np.array([f"term{i}" for i in range(VOCABULARY)])
+    picks = rng.choice(VOCABULARY, size=(size, WORDS_PER_DOCUMENT), p=weights / weights.sum())
+    return [' '.join(words[row]) for row in picks]
+
+
+@pytest.mark.skipif(not MODE, reason="benchmark tier: set PWDOCS_BENCHMARK=1")
+def test_benchmark_clustering_scaling():
+    timings = {}
+    previous = None
+    for size in SIZES:
+        texts = _corpus(size)
+        start = time.perf_counter()
+        matrix = TfidfMatrix.from_texts(texts)
+        built = time.perf_counter()
+        first, second, similarity = similar_pairs(matrix, DEFAULT_THRESHOLD)
+        paired = time.perf_counter()
+        cluster(size, first, second, similarity)
+        timings[size] = {'tfidf': built - start, 'pairs': paired - built}
+        print(f"\n{size} documents: tfidf {timings[size]['tfidf'] * 1000:.0f}ms, "
+              f"pairs {timings[size]['pairs'] * 1000:.0f}ms, "
+              f"cluster {(time.perf_counter() - paired) * 1000:.0f}ms", end='')
+
+        if previous:
+            for stage, limit in MAX_EXPONENT.items():
+                if timings[previous][stage] < MIN_TIMED_SECONDS:
+                    continue
+                exponent = (math.log(timings[size][stage] / timings[previous][stage])
+                            / math.log(size / previous))
+                assert exponent <= limit, (
+                    f"{stage} scales as n^{exponent:.2f}: {timings[previous][stage] * 1000:.0f}ms at "
+                    f"{previous} documents, {timings[size][stage] * 1000:.0f}ms at {size}")
+        previous = size
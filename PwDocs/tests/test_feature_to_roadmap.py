@@ -0,0 +1,62 @@
+"""Bulk roadmap promotion: one folder listing, one roadmap index load, one search journal write."""
+
+import os
+
+import pytest
+
+import feature_to_roadmap
+from feature_to_roadmap import promote_features, promote_feature, ROADMAP_DIR
+from roadmap_index import RoadmapIndex
+
+ROADMAP = """# Roadmap
+
+### Phase 1: Foundations ✅ **COMPLETE**
+### Phase 2: Core Pipeline ⏳ **IN PROGRESS**
+**Duration**: 6 weeks
+"""
+
+STATUS = """# Status
+- Roadmap Ready: No
+
+## Roadmap Integration
+"""
+
+
+@pytest.fixture
+def tree(workdir, write):
+    write('templates/roadmap.md', ROADMAP)
+    for number in (41, 42):
+        write(f'Content/Issues/Features-Proposed/{number}-feature-{number}/status.md', STATUS)
+    return workdir
+
+
+def test_bulk_promotion(tree, monkeypatch):
+    loads = []
+    real_load = RoadmapIndex.load
+
+    def counting_load(*args, **kwargs):
+        loads.append(args)
+        return real_load(*args, **kwargs)
+
+    monkeypatch.setattr(RoadmapIndex, 'load', counting_load)
+    journal = []
+    monkeypatch.setattr(feature_to_roadmap, 'record_change', lambda *paths: journal.append(paths))
+
+    results = promote_features([41, 99, 42])
+    assert [(result['feature'], result['success'], result['error']) for result in results] == [
+        (41, True, None), (99, False, "Feature #99 not found"), (42, True, None)]
+    assert sorted(os.listdir(ROADMAP_DIR)) == ['41-feature-41', '42-feature-42']
+    assert len(loads) == 1
+    assert journal == [(results[0]['source'], results[0]['target'], results[2]['source'], results[2]['target'])]
+
+    with open(os.path.join(ROADMAP_DIR, '41-feature-41', 'status.md')) as f:
+        status = f.read()
+    assert '- Roadmap Ready: Yes' in status
+    assert '(during Phase 2: Core Pipeline)' in status
+
+
+def test_promoting_twice_reports_instead_of_exiting(tree):
+    assert promote_feature(41)['success']
+    os.makedirs('Content/Issues/Features-Proposed/41-feature-41')
+    result = promote_feature(41)
+    assert not result['success'] and result['error'].startswith("Feature already exists in roadmap")
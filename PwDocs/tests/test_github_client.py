@@ -0,0 +1,97 @@
+"""GitHubClient against a local fake server: ETag revalidation, rate-limit waits, retries and errors."""
+
+import time
+from email.utils import formatdate
+
+import pytest
+
+from github_client import GitHubClient, GitHubAPIError, retry_after_seconds
+
+
+@pytest.fixture
+def client(fake_github, tmp_path):
+    fake_github.add_issue(1, '2026-01-01T00:00:00Z', labels=['bug'])
+    return GitHubClient(repo=fake_github.repo, token='test-token', base_url=fake_github.url,
+                        cache_path=str(tmp_path / 'etags.json'), max_rate_limit_wait=0.05)
+
+
+def test_etag_revalidation_serves_304s_from_the_cache(fake_github, client, tmp_path):
+    first = client.get_issue(1)
+    assert client.get_issue(1) == first
+    assert client.stats == {'requests': 2, 'cache_hits': 1, 'rate_limit_waits': 0}
+    gets = fake_github.requests('GET')
+    assert 'If-None-Match' not in gets[0][3] and gets[1][3]['If-None-Match']
+    assert gets[0][3]['Authorization'] == 'Bearer test-token'
+
+    # The cache survives the process, and a changed issue is fetched again
+    client.save_cache()
+    reloaded = GitHubClient(repo=fake_github.repo, base_url=fake_github.url,
+                            cache_path=str(tmp_path / 'etags.json'))
+    assert reloaded.get_issue(1) == first and reloaded.stats['cache_hits'] == 1
+    fake_github.issues[1]['labels'].append('closed')
+    assert [label['name'] for label in reloaded.get_issue(1)['labels']] == ['bug', 'closed']
+    assert reloaded.stats['cache_hits'] == 1
+
+
+def test_writes_are_never_revalidated(fake_github, client):
+    assert client.add_labels(1, ['bug', 'closed']) == [{'name': 'bug'}, {'name': 'closed'}]
+    client.add_comment(1, "Status updated: done")
+    assert fake_github.comments == [(1, "Status updated: done")]
+    assert all('If-None-Match' not in headers for _, _, _, headers in fake_github.requests('POST'))
+
+
+def test_retry_after_is_honoured_then_retried(fake_github, client):
+    fake_github.script(429, {'message': "secondary rate limit"}, {'Retry-After': '1'})
+    fake_github.script(403, {'message': "secondary rate limit"}, {'Retry-After': '1'})
+    assert client.get_issue(1)['number'] == 1
+    assert client.stats['requests'] == 3
+    assert client.stats['rate_limit_waits'] == 2
+
+
+def test_retry_after_accepts_http_dates():
+    assert retry_after_seconds('3', 1) == 3
+    assert 28 < retry_after_seconds(formatdate(time.time() + 30, usegmt=True), 1) <= 30
+    assert retry_after_seconds(formatdate(time.time() - 30, usegmt=True), 1) < 0
+    assert retry_after_seconds('soon', 4) == 4
+
+
+def test_http_date_and_malformed_retry_after_are_retried(fake_github, client):
+    fake_github.script(429, {'message': "secondary rate limit"},
+                       {'Retry-After': formatdate(time.time() + 30, usegmt=True)})
+    fake_github.script(403, {'message': "secondary rate limit"}, {'Retry-After': 'soon'})
+    assert client.get_issue(1)['number'] == 1
+    assert client.stats['requests'] == 3
+    assert client.stats['rate_limit_waits'] == 2
+
+
+def test_exhausted_budget_waits_for_the_reset(fake_github, client):
+    fake_github.rate_limit.update(remaining=0, reset=int(time.time()) + 30)
+    client.get_issue(1)
+    assert client.rate_limit['remaining'] == 0
+    fake_github.rate_limit.update(remaining=4999, reset=0)
+    start = time.perf_counter()
+    client.get_issue(1)
+    # The wait is capped by max_rate_limit_wait
+    assert client.stats['rate_limit_waits'] == 1
+    assert time.perf_counter() - start < 1
+
+
+def test_errors_raise_github_api_error(fake_github, client):
+    with pytest.raises(GitHubAPIError, match="404: Not Found") as error:
+        client.get_issue(99)
+    assert error.value.status_code == 404
+
+    for _ in range(client.max_retries + 1):
+        fake_github.script(429, {'message': "slow down"}, {'Retry-After': '1'})
+    with pytest.raises(GitHubAPIError, match="429: slow down") as error:
+        client.get_issue(1)
+    assert error.value.status_code == 429
+    assert client.stats['requests'] == 1 + client.max_retries + 1
+
+
+def test_list_issues_follows_link_headers(fake_github, client):
+    for number in range(2, 8):
+        fake_github.add_issue(number, f'2026-01-0{number}T00:00:00Z')
+    numbers = [issue['number'] for issue in client.list_issues(per_page=3)]
+    assert numbers == [7, 6, 5, 4, 3, 2, 1]
+    assert [query['page'] for _, _, query, _ in fake_github.requests('GET')] == ['1', '2', '3']
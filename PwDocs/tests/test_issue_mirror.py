@@ -0,0 +1,101 @@
+"""IssueMirror against a local fake server: paging, the since watermark, PRs, labels and mid-sync edits."""
+
+import calendar
+import time
+
+import pytest
+
+from github_client import GitHubClient
+from issue_mirror import IssueMirror
+
+
+def stamp(minute):
+    return f"2025-03-01T10:{minute:02d}:00Z"
+
+
+def epoch(timestamp):
+    return calendar.timegm(time.strptime(timestamp, '%Y-%m-%dT%H:%M:%SZ'))
+
+
+@pytest.fixture
+def mirror(fake_github, tmp_path):
+    client = GitHubClient(repo=fake_github.repo, base_url=fake_github.url,
+                          cache_path=str(tmp_path / 'etags.json'))
+    return IssueMirror(str(tmp_path / 'issues.sqlite3'), client=client)
+
+
+def list_requests(fake_github):
+    return [query for _, path, query, _ in fake_github.requests('GET') if path.endswith('/issues')]
+
+
+def test_full_sync_follows_link_pages_and_skips_pull_requests(fake_github, mirror):
+    for number in range(1, 8):
+        fake_github.add_issue(number, stamp(number), labels=['bug'] if number % 2 else [])
+    fake_github.add_issue(8, stamp(8), pull_request=True)
+
+    result = mirror.sync(per_page=3)
+    assert (result['issues'], result['pages'], result['since'], result['advanced']) == (7, 3, None, True)
+    assert sorted(query['page'] for query in list_requests(fake_github)) == ['1', '2', '3', '3']
+    assert all(query['direction'] == 'asc' for query in list_requests(fake_github))
+    assert mirror.get(8) is None
+    assert [issue['number'] for issue in mirror.query(label='bug')] == [7, 5, 3, 1]
+    assert mirror.watermark() == stamp(7)
+
+
+def test_incremental_sync_asks_since_the_watermark_and_replaces_labels(fake_github, mirror):
+    fake_github.add_issue(1, stamp(1), labels=['bug', 'needs-triage'])
+    fake_github.add_issue(2, stamp(2), labels=['question'])
+    mirror.sync()
+    assert mirror.watermark() == stamp(2)
+
+    fake_github.add_issue(1, stamp(5), labels=['bug', 'closed'], state='closed')
+    result = mirror.sync()
+    assert result['since'] == stamp(2)
+    assert list_requests(fake_github)[-1]['since'] == stamp(2)
+    assert mirror.get(1)['labels'] == ['bug', 'closed']
+    assert mirror.get(1)['state'] == 'closed'
+    assert mirror.labels_by_issue() == {1: {'bug', 'closed'}, 2: {'question'}}
+    assert mirror.watermark() == stamp(5)
+
+
+def test_an_edit_mid_sync_holds_the_watermark_until_nothing_was_skipped(fake_github, mirror):
+    for number in range(1, 7):
+        fake_github.add_issue(number, stamp(number))
+
+    # Issue 2 is edited in the second page 1 was read: 4 slides back onto page 1 and is skipped
+    fake_github.now = epoch(stamp(30))
+
+    def edit_issue_2(method, path, query):
+        if query.get('page') == '2' and fake_github.issues[2]['updated_at'] == stamp(2):
+            fake_github.issues[2]['updated_at'] = stamp(30)
+    fake_github.on_request = edit_issue_2
+
+    result = mirror.sync(per_page=3)
+    assert mirror.get(4) is None
+    assert result['advanced'] is False
+    assert mirror.watermark() is None
+
+    fake_github.on_request = None
+    fake_github.now = epoch(stamp(31))
+    result = mirror.sync(per_page=3)
+    assert result['advanced'] is True
+    assert sorted(mirror.labels_by_issue()) == [1, 2, 3, 4, 5, 6]
+    assert mirror.watermark() == stamp(30)
+
+
+def test_an_edit_seen_only_in_the_last_page_reread_holds_the_watermark(fake_github, mirror):
+    for number in range(1, 7):
+        fake_github.add_issue(number, stamp(number))
+    fake_github.now = epoch(stamp(30))
+
+    # Issue 1 is edited just before the last page is read a second time, so no
+    # page already fetched shows the new updated_at
+    def edit_issue_1(method, path, query):
+        if len(list_requests(fake_github)) == 3:
+            fake_github.issues[1]['updated_at'] = stamp(30)
+    fake_github.on_request = edit_issue_1
+
+    result = mirror.sync(per_page=3, max_workers=1)
+    assert [query['page'] for query in list_requests(fake_github)] == ['1', '2', '2']
+    assert (result['issues'], result['advanced']) == (6, False)
+    assert mirror.watermark() is None
@@ -0,0 +1,120 @@
+"""Spooled label events coalesce per issue, and failed transitions stay queued for retry."""
+
+import os
+import threading
+
+import pytest
+
+from label_event_queue import LabelEventQueue, coalesce
+from process_label_change import process_label_change
+
+
+def event(old, new, title="Crash on export"):
+    return {'old_labels': [{'name': label} for label in old],
+            'new_labels': [{'name': label} for label in new], 'title': title}
+
+
+def names(labels):
+    return [label['name'] for label in labels]
+
+
+@pytest.mark.parametrize('events, expected', [
+    ([event(['bug'], ['bug', 'duplicate']), event(['bug', 'duplicate'], ['bug', 'invalid'])],
+     (['bug'], ['bug', 'invalid'])),
+    ([event(['bug'], ['bug', 'wontfix'])], (['bug'], ['bug', 'wontfix'])),
+    ([event(['bug'], ['bug', 'wontfix']), event(['bug', 'wontfix'], ['bug'])], None),
+    ([event(['bug', 'question'], ['question', 'bug'])], None),
+])
+def test_coalesce_keeps_the_net_transition(events, expected):
+    transition = coalesce(events)
+    if expected is None:
+        assert transition is None
+    else:
+        assert (names(transition[0]), names(transition[1]), transition[2]) == expected + ("Crash on export",)
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return LabelEventQueue(str(tmp_path / 'events.sqlite3'))
+
+
+def test_drain_runs_one_handler_call_per_issue(queue):
+    queue.enqueue(1, '["bug"]', '["bug", "duplicate"]', "One")
+    queue.enqueue(2, ['question'], ['question', 'invalid'], "Two")
+    queue.enqueue(1, '["bug", "duplicate"]', '["bug", "invalid"]', "One, renamed")
+    queue.enqueue(3, ['bug'], ['bug', 'wontfix'], "Three")
+    queue.enqueue(3, ['bug', 'wontfix'], ['bug'], "Three")
+
+    calls = []
+    lock = threading.Lock()
+
+    def handler(issue, old_labels, new_labels, title):
+        with lock:
+            calls.append((issue, names(old_labels), names(new_labels), title))
+        return True
+
+    assert queue.drain(handler) == (3, 5, 0)
+    assert sorted(calls) == [(1, ['bug'], ['bug', 'invalid'], "One, renamed"),
+                             (2, ['question'], ['question', 'invalid'], "Two")]
+    assert queue.counts() == {'done': 5}
+    assert queue.drain(handler) == (0, 0, 0)
+
+
+def test_falsy_results_and_exceptions_fail_until_retried(queue):
+    queue.enqueue(1, ['bug'], ['bug', 'wontfix'])
+    queue.enqueue(2, ['bug'], ['bug', 'invalid'])
+    outcomes = {1: False, 2: RuntimeError("disk full")}
+
+    def handler(issue, old_labels, new_labels, title):
+        outcome = outcomes[issue]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert queue.drain(handler) == (2, 2, 2)
+    assert queue.counts() == {'failed': 2}
+    assert queue.retry_failed() == 2
+    outcomes.update({1: True, 2: True})
+    assert queue.drain(handler) == (2, 2, 0)
+    assert queue.counts() == {'done': 2}
+
+
+def test_retry_skips_failures_superseded_by_a_processed_event(queue):
+    queue.enqueue(1, ['bug'], ['bug', 'wontfix'])
+    queue.enqueue(2, ['bug'], ['bug', 'wontfix'])
+    assert queue.drain(lambda *args: False) == (2, 2, 2)
+    # Issue 1 was reopened and that newer change went through
+    queue.enqueue(1, ['bug', 'wontfix'], ['bug'])
+    queue.enqueue(2, ['bug', 'wontfix'], ['bug', 'invalid'])
+    queue.drain(lambda issue, *args: issue == 1)
+    assert queue.counts() == {'done': 1, 'failed': 3}
+
+    assert queue.retry_failed() == 2
+    assert queue.counts() == {'done': 1, 'pending': 2, 'superseded': 1}
+    calls = []
+
+    def handler(issue, old_labels, new_labels, title):
+        calls.append((issue, names(old_labels), names(new_labels)))
+        return True
+
+    assert queue.drain(handler) == (1, 2, 0)
+    # Issue 2's failures replay in order, as one net transition
+    assert calls == [(2, ['bug'], ['bug', 'invalid'])]
+
+
+def test_claimed_issues_are_not_claimed_twice(queue):
+    queue.enqueue(1, ['bug'], ['bug', 'wontfix'])
+    first = queue._claim()
+    queue.enqueue(1, ['bug', 'wontfix'], ['bug', 'invalid'])
+    queue.enqueue(2, ['bug'], ['bug', 'invalid'])
+    assert list(first) == [1]
+    assert list(queue._claim()) == [2]
+
+
+def test_failed_folder_moves_are_kept_for_retry(queue, workdir):
+    os.makedirs('Content/Issues/Bugs/7-crash')
+    queue.enqueue(7, ['bug'], ['bug', 'wontfix'], "Crash")
+    queue.enqueue(8, ['bug'], ['bug', 'wontfix'], "Not mirrored locally")
+    assert queue.drain(process_label_change) == (2, 2, 1)
+    assert os.path.isdir('Content/Issues/Closed/Bugs/7-crash')
+    assert queue.counts() == {'done': 1, 'failed': 1}
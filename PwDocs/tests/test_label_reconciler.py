@@ -0,0 +1,85 @@
+"""Reconciliation plans the minimal moves, promotions and label edits for a fixture tree."""
+
+import os
+
+import pytest
+
+from github_client import GitHubClient
+from label_reconciler import snapshot_local, plan_reconciliation, apply_plan, reconcile
+from label_sync_manager import LabelSyncManager
+from Processors.scheduler import RateLimitedScheduler
+
+# issue number -> (local folder, GitHub labels or None when not on GitHub)
+TREE = {
+    10: ('Content/Issues/Bugs', {'bug', 'wontfix'}),
+    11: ('Content/Issues/Questions', {'question'}),
+    12: ('Content/Issues/Features-Proposed', {'feature', 'roadmap-approved'}),
+    13: ('Content/Issues/Bugs', {'bug', 'duplicate'}),
+    14: ('Content/Issues/Closed/Bugs', {'bug'}),
+    15: ('Content/Issues/Closed/Features-Not-Planned', {'feature', 'wontfix'}),
+    16: ('content/planning/roadmap', {'feature'}),
+    17: ('Content/Issues/Bugs', None),
+}
+
+
+@pytest.fixture
+def tree(workdir):
+    for number, (folder, _) in TREE.items():
+        os.makedirs(os.path.join(folder, f"{number}-issue-{number}"))
+    return workdir
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = RateLimitedScheduler({'github': (1000.0, 100, 4)})
+    yield scheduler
+    scheduler.shutdown()
+
+
+def remote():
+    return {number: labels for number, (_, labels) in TREE.items() if labels is not None}
+
+
+def test_snapshot_finds_open_and_closed_locations(tree, scheduler):
+    local = snapshot_local(LabelSyncManager(scheduler=scheduler).status_manager)
+    assert sorted(local) == sorted(TREE)
+    assert local[10] == [{'path': 'Content/Issues/Bugs/10-issue-10', 'source_type': 'bugs', 'open': True}]
+    assert local[16] == [{'path': 'content/planning/roadmap/16-issue-16', 'source_type': None, 'open': False}]
+
+
+def test_plan_is_the_minimal_set_of_changes(tree, scheduler):
+    syncer = LabelSyncManager(scheduler=scheduler)
+    plan = plan_reconciliation(snapshot_local(syncer.status_manager), remote(), syncer)
+    assert plan == {
+        'moves': [(10, 'bugs', 'closed', "Marked as wontfix on GitHub"),
+                  (13, 'bugs', 'other', "Marked as duplicate on GitHub")],
+        'promotions': [12],
+        'label_edits': [(14, ['closed'], None), (15, ['closed'], None), (16, ['roadmap-approved'], None)],
+    }
+
+
+def test_reconcile_applies_the_plan_and_converges(tree, scheduler, fake_github):
+    for number, labels in remote().items():
+        fake_github.add_issue(number, '2026-01-01T00:00:00Z', labels=sorted(labels))
+    client = GitHubClient(repo=fake_github.repo, base_url=fake_github.url,
+                          cache_path=str(tree / 'etags.json'))
+    syncer = LabelSyncManager(client=client, scheduler=scheduler)
+
+    assert reconcile(dry_run=True, syncer=syncer)
+    assert os.path.isdir('Content/Issues/Bugs/10-issue-10')
+    assert not fake_github.requests('POST')
+
+    assert reconcile(syncer=syncer)
+    assert os.path.isdir('Content/Issues/Closed/Bugs/10-issue-10')
+    assert os.path.isdir('Content/Issues/Closed/Other/13-issue-13')
+    assert os.path.isdir('content/planning/roadmap/12-issue-12')
+    assert fake_github.issues[14]['labels'] == ['bug', 'closed']
+    assert fake_github.issues[16]['labels'] == ['feature', 'roadmap-approved']
+
+    # The second pass only has the label that moving #10 into Closed/Bugs implies
+    plan = plan_reconciliation(snapshot_local(syncer.status_manager), {
+        number: set(issue['labels']) for number, issue in fake_github.issues.items()}, syncer)
+    assert plan['moves'] == [] and plan['promotions'] == []
+    assert plan['label_edits'] == [(10, ['closed'], None)]
+    assert apply_plan(plan, syncer)
+    assert fake_github.issues[10]['labels'] == ['bug', 'wontfix', 'closed']
@@ -0,0 +1,55 @@
+"""Label decisions from the compiled rule table, and the precedence process_label_change applies."""
+
+import os
+
+import pytest
+
+from Processors.label_rules import (
+    get_label_rules, label_names, label_change_batch, _chain_label_change, _compiled_label_change
+)
+from process_label_change import process_label_change
+
+
+def dicts(*names):
+    return [{'name': name} for name in names]
+
+
+def test_label_names_accepts_names_dicts_and_mixes():
+    assert label_names(['Bug', 'question']) == {'bug', 'question'}
+    assert label_names(dicts('Bug')) == {'bug'}
+    assert label_names(['Bug', {'name': 'WontFix'}]) == {'bug', 'wontfix'}
+    assert label_names(None) == frozenset()
+
+
+@pytest.mark.parametrize('old, new, expected', [
+    (['bug'], ['bug', 'duplicate', 'wontfix'], 'wontfix'),
+    (['bug'], ['bug', 'invalid', 'duplicate'], 'duplicate'),
+    (['bug', 'wontfix'], ['bug', 'wontfix', 'invalid'], 'invalid'),
+    (['bug'], ['bug', 'roadmap-approved'], None),
+    (['bug', 'duplicate'], ['bug', 'duplicate'], None),
+])
+def test_label_change_rule_is_first_added_in_wontfix_duplicate_invalid_order(old, new, expected):
+    rule = get_label_rules().label_change_rule(old, new)
+    assert (rule['label'] if rule else None) == expected
+
+
+def test_compiled_table_decides_like_the_old_chain():
+    rules = get_label_rules()
+    for old, new in label_change_batch(2000):
+        assert _compiled_label_change(rules, old, new) == _chain_label_change(old, new)
+
+
+def test_only_the_first_matching_status_moves_the_issue(workdir):
+    os.makedirs('Content/Issues/Bugs/7-crash')
+    os.makedirs('Content/Issues/Features-Proposed/8-dark-mode')
+    with open('Content/Issues/Features-Proposed/8-dark-mode/status.md', 'w') as f:
+        f.write("- Status: Proposal\n")
+
+    assert process_label_change(7, dicts('bug'), dicts('bug', 'duplicate', 'wontfix'), "Crash") is True
+    assert os.path.isdir('Content/Issues/Closed/Bugs/7-crash')
+    assert not os.path.exists('Content/Issues/Closed/Other/7-crash')
+
+    assert process_label_change(8, dicts('feature'), dicts('feature', 'invalid', 'duplicate'), "Dark") is True
+    assert os.path.isdir('Content/Issues/Closed/Other/8-dark-mode')
+    with open('Content/Issues/Closed/Other/8-dark-mode/status.md') as f:
+        assert "- Reason: Duplicate issue" in f.read()
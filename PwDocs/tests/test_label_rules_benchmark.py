@@ -0,0 +1,31 @@
+"""Benchmark tier: label-change decisions over a 20k event batch, compiled table against the old chain.
+
+Skipped unless PWDOCS_BENCHMARK is set:
+
+    PWDOCS_BENCHMARK=1 python -m pytest PwDocs/tests -k benchmark -s
+
+The compiled table lower-cases every label, which the hand-written chain
+never did, so it is allowed to be slower per event - but not by more than
+MAX_SLOWDOWN, and a batch must stay well inside the drain's budget.
+"""
+
+import os
+
+import pytest
+
+from Processors.label_rules import benchmark_batch
+
+MODE = os.environ.get('PWDOCS_BENCHMARK', '')
+
+BATCH = 20000
+MAX_SLOWDOWN = 4.0
+MAX_BATCH_SECONDS = 0.5
+
+
+@pytest.mark.skipif(not MODE, reason="benchmark tier: set PWDOCS_BENCHMARK=1")
+def test_benchmark_label_change_batch():
+    chain, compiled = benchmark_batch(BATCH)
+    print(f"\n{BATCH} label changes: if/elif chain {chain * 1000:.1f}ms, "
+          f"compiled table {compiled * 1000:.1f}ms", end='')
+    assert compiled <= chain * MAX_SLOWDOWN
+    assert compiled <= MAX_BATCH_SECONDS
@@ -0,0 +1,48 @@
+"""Label edits are one scheduled call per issue, and the status comment follows only a successful edit."""
+
+import pytest
+
+from github_client import GitHubAPIError
+from label_sync_manager import LabelSyncManager
+from Processors.scheduler import RateLimitedScheduler
+
+
+class FakeClient:
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = []
+
+    def add_labels(self, issue_number, labels):
+        self.calls.append(('labels', issue_number, tuple(labels)))
+        if issue_number in self.failing:
+            raise GitHubAPIError(422, "Validation Failed")
+        return []
+
+    def add_comment(self, issue_number, body):
+        self.calls.append(('comment', issue_number, body))
+        return {}
+
+    def save_cache(self):
+        pass
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = RateLimitedScheduler({'github': (1000.0, 100, 4)})
+    yield scheduler
+    scheduler.shutdown()
+
+
+def test_comment_only_follows_a_successful_edit(scheduler):
+    client = FakeClient(failing={2})
+    syncer = LabelSyncManager(client=client, scheduler=scheduler)
+    ok = syncer.apply_label_edits([(1, ['bug', 'closed'], "Fixed"), (2, ['wontfix'], "Not planned"),
+                                   (3, ['question'], None)])
+    assert ok is False
+    assert sorted(client.calls, key=lambda call: (call[1], call[0] != 'labels')) == [
+        ('labels', 1, ('bug', 'closed')),
+        ('comment', 1, "Status updated: Fixed"),
+        ('labels', 2, ('wontfix',)),
+        ('labels', 3, ('question',)),
+    ]
+    assert scheduler.stats()['github']['submitted'] == 3
@@ -0,0 +1,36 @@
+"""Per-rule profiling of the security linter and the backtracking probe."""
+
+import re
+
+import lint_profile
+from lint_profile import SUPERLINEAR_RATIO, probe_scaling, profile
+from security_linter import SKIP_LINE
+
+SOURCE = "import os\n# os.system(cmd) in a comment\nos.system(cmd)\n"
+
+
+def test_probe_flags_quadratic_rules_only():
+    probes = probe_scaling({'linear': re.compile(r'eval\('), 'quadratic': re.compile(r' *x')})
+    assert probes['linear'] == {'ratio': 0.0, 'seconds': 0.0, 'probe': None}
+    assert probes['quadratic']['ratio'] > SUPERLINEAR_RATIO
+    assert probes['quadratic']['probe'].endswith(' ' * 10)
+
+
+def test_profile_times_every_rule_and_file():
+    compiled = {'shell': re.compile(r'os\.system'), 'eval': re.compile(r'eval\(')}
+    report = profile([('a.py', SOURCE), ('b.py', "x = 1\n")], compiled, SKIP_LINE, ('regex', 'ast'))
+    assert report['bytes'] == len(SOURCE) + 6
+    assert set(report['rules']) == {'shell', 'eval', 'ast:taint'}
+    assert set(report['files']) == {'a.py', 'b.py'}
+    assert set(report['probes']) == {'shell', 'eval'}
+    assert list(report['rules'].values()) == sorted(report['rules'].values(), reverse=True)
+
+    report = profile([('a.py', SOURCE)], compiled, SKIP_LINE, ('ast',))
+    assert list(report['rules']) == ['ast:taint'] and report['slow_rules'] == []
+
+
+def test_rules_over_the_per_megabyte_budget_are_slow(monkeypatch):
+    monkeypatch.setattr(lint_profile, 'SLOW_MS_PER_MB', 0)
+    report = profile([('a.py', SOURCE)], {'shell': re.compile(r'os\.system')}, SKIP_LINE, ('regex',))
+    slow, = report['slow_rules']
+    assert slow['rule'] == 'shell' and slow['reason'].endswith("ms per MB of source")
@@ -0,0 +1,91 @@
+"""Finding fingerprints, baseline filtering and the SARIF log."""
+
+import json
+
+from lint_report import (FINGERPRINT_KEY, SARIF_SCHEMA, add_fingerprints, apply_baseline,
+                         load_baseline, render_sarif, render_text, summarize, write_baseline)
+
+
+def finding(line, code="os.system(cmd)", file='Scripts/tool.py', check='shell_command',
+            severity='HIGH'):
+    return {'file': file, 'line': line, 'check': check, 'severity': severity,
+            'message': "Shell commands can be injected", 'code': code}
+
+
+def fingerprints(findings):
+    return [item['fingerprint'] for item in add_fingerprints(findings)]
+
+
+def test_fingerprints_ignore_line_numbers_and_whitespace():
+    before = fingerprints([finding(6), finding(20, "x = 1", check='eval_exec')])
+    after = fingerprints([finding(9, "os.system(cmd)   "), finding(31, "x  =\t1", check='eval_exec')])
+    assert after == before
+    assert len(before[0]) == 32
+
+
+def test_fingerprints_tell_files_checks_and_repeated_lines_apart():
+    first, second, other_file, other_check = fingerprints([
+        finding(3), finding(8), finding(3, file='Scripts/other.py'), finding(3, check='taint_shell')])
+    assert len({first, second, other_file, other_check}) == 4
+    # The n-th identical line keeps its fingerprint when an earlier unrelated line moves
+    assert fingerprints([finding(4), finding(12)]) == [first, second]
+    assert fingerprints([finding(3, file='Scripts\\tool.py')]) == [first]
+
+
+def test_baseline_only_reports_new_findings(tmp_path):
+    old = add_fingerprints([finding(3), finding(5, "eval(x)", check='eval_exec')])
+    baseline_path = str(tmp_path / 'baseline.json')
+    write_baseline(baseline_path, old)
+    baseline = load_baseline(baseline_path)
+    assert baseline == {item['fingerprint'] for item in old}
+
+    # A report written with --format json works as a baseline too
+    report_path = tmp_path / 'report.json'
+    report_path.write_text(json.dumps({'findings': old}))
+    assert load_baseline(str(report_path)) == baseline
+
+    current = add_fingerprints([finding(4), finding(7, "eval(x)", check='eval_exec'),
+                                finding(9, "os.system(user)")])
+    apply_baseline(current, baseline)
+    assert [item['baseline_state'] for item in current] == ['unchanged', 'unchanged', 'new']
+    summary = summarize(current)
+    assert summary == {'high': 3, 'medium': 0, 'new_high': 1, 'new_medium': 0, 'baselined': 2}
+    text = render_text(current, {}, summary)
+    assert "Scripts/tool.py:9 [shell_command]" in text
+    assert ":4 " not in text and "(2 baselined not shown)" in text
+
+    apply_baseline(current, baseline | {current[2]['fingerprint']})
+    assert render_text(current, {}, summarize(current)) == "✅ No new security issues (3 baselined)"
+
+
+def test_sarif_log_shape():
+    findings = add_fingerprints([finding(6, file='Scripts\\tool.py'),
+                                 finding(2, "open(path)", check='taint_open', severity='MEDIUM')])
+    apply_baseline(findings, {findings[0]['fingerprint']})
+    rules = {'shell_command': ('HIGH', "Shell commands can be injected"),
+             'eval_exec': ('HIGH', "Never use eval/exec with user input")}
+
+    log = json.loads(render_sarif(findings, {}, summarize(findings), rules))
+    assert (log['$schema'], log['version']) == (SARIF_SCHEMA, '2.1.0')
+    run, = log['runs']
+    driver_rules = run['tool']['driver']['rules']
+    # Every active rule is listed, with or without findings, in a stable order
+    assert [rule['id'] for rule in driver_rules] == ['eval_exec', 'shell_command', 'taint_open']
+    assert driver_rules[1] == {'id': 'shell_command',
+                               'shortDescription': {'text': "Shell commands can be injected"},
+                               'defaultConfiguration': {'level': 'error'}}
+    assert driver_rules[2] == {'id': 'taint_open', 'shortDescription': {'text': 'taint_open'}}
+
+    shell, taint = run['results']
+    assert shell == {
+        'ruleId': 'shell_command',
+        'ruleIndex': 1,
+        'level': 'error',
+        'message': {'text': "Shell commands can be injected"},
+        'locations': [{'physicalLocation': {
+            'artifactLocation': {'uri': 'Scripts/tool.py'},
+            'region': {'startLine': 6, 'snippet': {'text': "os.system(cmd)"}}}}],
+        'partialFingerprints': {FINGERPRINT_KEY: findings[0]['fingerprint']},
+        'baselineState': 'unchanged',
+    }
+    assert (taint['ruleIndex'], taint['level'], taint['baselineState']) == (2, 'warning', 'new')
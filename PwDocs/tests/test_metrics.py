@@ -0,0 +1,141 @@
+"""Metrics registry semantics, Prometheus rendering and totals accumulated across flushes."""
+
+import os
+import json
+import threading
+
+import pytest
+
+from Processors.metrics import (
+    MetricsRegistry, get_registry, record_llm_response, render_prometheus, LLM_REQUESTS, LLM_TOKENS,
+    TEXTFILE_NAME, SNAPSHOT_NAME, get_metrics_dir
+)
+
+
+class FakeResponse:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self._body = body
+
+    def json(self):
+        return self._body
+
+
+def samples(snapshot, name):
+    return {tuple(sorted(sample['labels'].items())): sample for sample in snapshot['metrics'][name]['samples']}
+
+
+def test_metric_types():
+    registry = MetricsRegistry()
+    requests = registry.counter('requests_total', "Requests", ('status',))
+    requests.inc(status=200)
+    requests.inc(2, status=200)
+    with pytest.raises(ValueError, match="only go up"):
+        requests.inc(-1, status=200)
+    with pytest.raises(ValueError, match="takes labels"):
+        requests.inc(method='GET')
+    assert registry.counter('requests_total', "Requests", ('status',)) is requests
+    with pytest.raises(ValueError, match="already registered"):
+        registry.gauge('requests_total', "Requests")
+
+    depth = registry.gauge('queue_depth', "Queue depth")
+    depth.set(5)
+    depth.inc(-2)
+    latency = registry.histogram('latency_seconds', "Latency", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe(value)
+
+    snapshot = registry.snapshot()
+    assert samples(snapshot, 'requests_total')[(('status', '200'),)]['value'] == 3
+    assert samples(snapshot, 'queue_depth')[()]['value'] == 3
+    assert samples(snapshot, 'latency_seconds')[()] == {
+        'labels': {}, 'counts': [2, 3, 4], 'sum': 3.65, 'count': 4}
+
+
+def test_prometheus_textfile_format():
+    registry = MetricsRegistry()
+    registry.counter('requests_total', "Requests\nby status", ('path',)).inc(path='a"b\\c')
+    registry.histogram('latency_seconds', "Latency", buckets=(0.5,)).observe(0.25)
+    assert render_prometheus(registry.snapshot()) == (
+        '# HELP latency_seconds Latency\n'
+        '# TYPE latency_seconds histogram\n'
+        'latency_seconds_bucket{le="0.5"} 1\n'
+        'latency_seconds_bucket{le="+Inf"} 1\n'
+        'latency_seconds_sum 0.25\n'
+        'latency_seconds_count 1\n'
+        '# HELP requests_total Requests\\nby status\n'
+        '# TYPE requests_total counter\n'
+        'requests_total{path="a\\"b\\\\c"} 1\n'
+    )
+
+
+def test_flushes_accumulate_across_runs(tmp_path):
+    for run, hits in enumerate((3, 1)):
+        registry = MetricsRegistry()
+        cache = registry.counter('pwdocs_cache_requests_total', "Lookups", ('cache', 'result'))
+        cache.inc(hits, cache='scan', result='hit')
+        cache.inc(cache='scan', result='miss')
+        registry.gauge('sections', "Sections").set(run + 7)
+        registry.histogram('latency_seconds', "Latency", buckets=(1.0,)).observe(0.5)
+        registry.flush(tmp_path)
+
+    snapshot = json.loads((tmp_path / SNAPSHOT_NAME).read_text())
+    cache = samples(snapshot, 'pwdocs_cache_requests_total')
+    assert cache[(('cache', 'scan'), ('result', 'hit'))]['value'] == 4
+    assert cache[(('cache', 'scan'), ('result', 'miss'))]['value'] == 2
+    assert samples(snapshot, 'pwdocs_cache_hit_ratio')[(('cache', 'scan'),)]['value'] == round(4 / 6, 6)
+    assert samples(snapshot, 'sections')[()]['value'] == 8
+    assert samples(snapshot, 'latency_seconds')[()]['count'] == 2
+    assert 'pwdocs_cache_hit_ratio{cache="scan"} 0.666667' in (tmp_path / TEXTFILE_NAME).read_text()
+
+    # Flushing resets this run's counts, so a second flush adds nothing twice
+    assert registry.flush(tmp_path) is not None
+    assert samples(json.loads((tmp_path / SNAPSHOT_NAME).read_text()), 'latency_seconds')[()]['count'] == 2
+
+
+def test_concurrent_flushes_add_up(tmp_path):
+    def run():
+        registry = MetricsRegistry()
+        registry.counter('runs_total', "Runs").inc()
+        registry.flush(tmp_path)
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert samples(json.loads((tmp_path / SNAPSHOT_NAME).read_text()), 'runs_total')[()]['value'] == 8
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+
+def test_metrics_dir_setting(monkeypatch, tmp_path):
+    assert get_metrics_dir() is None  # Tests run with PWDOCS_METRICS=off
+    monkeypatch.setenv('PWDOCS_METRICS', str(tmp_path))
+    assert get_metrics_dir() == str(tmp_path)
+    monkeypatch.delenv('PWDOCS_METRICS')
+    assert get_metrics_dir().endswith(os.path.join('.pwdocs-cache', 'metrics'))
+
+
+def test_changed_buckets_start_over(tmp_path):
+    registry = MetricsRegistry()
+    registry.histogram('latency_seconds', "Latency", buckets=(1.0,)).observe(0.5)
+    registry.flush(tmp_path)
+    registry = MetricsRegistry()
+    registry.histogram('latency_seconds', "Latency", buckets=(0.1, 1.0)).observe(0.5)
+    merged = registry.flush(tmp_path)
+    assert samples(merged, 'latency_seconds')[()]['counts'] == [0, 1, 1]
+
+
+def test_llm_responses_record_tokens_and_status():
+    # The conftest fixture resets the process-wide registry around every test
+    body = {'usage': {'prompt_tokens': 120, 'completion_tokens': 30}}
+    record_llm_response('feature', FakeResponse(200, body), 1.5)
+    record_llm_response('feature', FakeResponse(429, {}), 0.2)
+    snapshot = get_registry().snapshot()
+    requests = samples(snapshot, LLM_REQUESTS.name)
+    assert requests[(('processor', 'feature'), ('status', '200'))]['value'] == 1
+    assert requests[(('processor', 'feature'), ('status', '429'))]['value'] == 1
+    tokens = samples(snapshot, LLM_TOKENS.name)
+    assert tokens[(('direction', 'in'), ('processor', 'feature'))]['value'] == 120
+    assert tokens[(('direction', 'out'), ('processor', 'feature'))]['value'] == 30
@@ -0,0 +1,65 @@
+"""Phase header parsing and byte-offset section reads of the roadmap index."""
+
+import pytest
+
+from roadmap_index import RoadmapIndex, parse_roadmap
+
+
+def parse_header(tmp_path, header):
+    roadmap = tmp_path / 'roadmap.md'
+    roadmap.write_text(f"# Roadmap\n\n{header}\n**Duration**: 2 weeks\n", encoding='utf-8')
+    phases = parse_roadmap(str(roadmap))
+    assert len(phases) == 1, header
+    return phases[0]
+
+
+@pytest.mark.parametrize('header', [
+    "### Phase 2: Core Pipeline = **IN PROGRESS**",
+    "### Phase 2: Core Pipeline ⏳ **IN PROGRESS**",
+    "### Phase 2: Core Pipeline 🔄 **IN PROGRESS**",
+    "### Phase 2: Core Pipeline ✅ **IN PROGRESS**",
+    "### Phase 2: Core Pipeline - **IN PROGRESS**",
+    "### Phase 2: Core Pipeline **in progress**",
+])
+def test_every_status_marker(tmp_path, header):
+    phase = parse_header(tmp_path, header)
+    assert (phase['phase'], phase['title'], phase['status'], phase['duration']) == \
+        ('2', 'Core Pipeline', 'IN PROGRESS', '2 weeks')
+
+
+@pytest.mark.parametrize('header, title', [
+    ("### Phase 1: Setup", 'Setup'),
+    ("### Phase 1: Setup (stretch)", 'Setup (stretch)'),
+    ("### Phase 1: Setup ✅", 'Setup'),
+    ("### Phase 1: Setup ✅ done early", 'Setup'),
+])
+def test_missing_status(tmp_path, header, title):
+    phase = parse_header(tmp_path, header)
+    assert (phase['title'], phase['status']) == (title, None)
+
+
+@pytest.mark.parametrize('header', [
+    "### Phase 3: Polish = **IN PROGRESS** (stretch)",
+    "### Phase 3: Polish ⏳ **IN PROGRESS** - blocked on review  ",
+    "### Phase 3: Polish **IN PROGRESS**, see notes",
+])
+def test_text_after_the_status_is_kept_out_of_title_and_status(tmp_path, header):
+    phase = parse_header(tmp_path, header)
+    assert (phase['phase'], phase['title'], phase['status']) == ('3', 'Polish', 'IN PROGRESS')
+
+
+def test_sections_span_up_to_the_next_heading(tmp_path):
+    roadmap = tmp_path / 'roadmap.md'
+    roadmap.write_text(
+        "# Roadmap\n\n"
+        "### Phase 1: Setup ✅ **COMPLETED**\n- done\n\n"
+        "### Notes\nnot a phase\n\n"
+        "### Phase 2: Core Pipeline ⏳ **IN PROGRESS** (stretch)\n- doing\n",
+        encoding='utf-8')
+    index = RoadmapIndex.load(str(roadmap))
+
+    assert index.statuses() == {'COMPLETED': ['1'], 'IN PROGRESS': ['2']}
+    assert index.current_phase()['title'] == 'Core Pipeline'
+    assert index.read_phase(1) == "### Phase 1: Setup ✅ **COMPLETED**\n- done\n\n"
+    assert index.read_phase(2).endswith("- doing\n")
+    assert index.read_phase(9) is None
@@ -0,0 +1,54 @@
+"""Scan cache hits, invalidation and pruning of entries a run no longer looks up."""
+
+import json
+
+from scan_cache import ScanCache
+
+
+def parse(path):
+    with open(path) as f:
+        return f.read().upper()
+
+
+def test_changed_files_are_reread(tmp_path):
+    doc = tmp_path / 'doc.md'
+    doc.write_text("one")
+    cache_path = str(tmp_path / 'cache.json')
+    cache = ScanCache(cache_path)
+    assert cache.read(str(doc), parse, 'upper') == "ONE"
+    cache.save()
+
+    cache = ScanCache(cache_path)
+    assert cache.read(str(doc), parse, 'upper') == "ONE"
+    assert (cache.hits, cache.misses) == (1, 0)
+    doc.write_text("three")
+    assert cache.read(str(doc), parse, 'upper') == "THREE"
+    assert cache.misses == 1
+
+
+def test_save_prunes_entries_not_looked_up(tmp_path):
+    docs = tmp_path / 'docs'
+    docs.mkdir()
+    for name in ('keep.md', 'gone.md'):
+        (docs / name).write_text(name)
+    cache_path = tmp_path / 'cache.json'
+    cache = ScanCache(str(cache_path))
+    assert cache.list_dir(str(docs)) == [('gone.md', False), ('keep.md', False)]
+    for name in ('keep.md', 'gone.md'):
+        cache.read(str(docs / name), parse, 'upper')
+    cache.save()
+
+    (docs / 'gone.md').unlink()
+    cache = ScanCache(str(cache_path))
+    assert cache.list_dir(str(docs)) == [('keep.md', False)]
+    assert cache.read(str(docs / 'gone.md'), parse, 'upper') is None
+    assert cache.read(str(docs / 'keep.md'), parse, 'upper') == "KEEP.MD"
+    cache.save()
+
+    data = json.loads(cache_path.read_text())
+    assert list(data['dirs']) == [str(docs)]
+    assert list(data['files']) == [f"upper:{docs / 'keep.md'}"]
+
+    # A run that looks nothing up still prunes, even with no misses to save
+    ScanCache(str(cache_path)).save()
+    assert json.loads(cache_path.read_text())['files'] == {}
@@ -0,0 +1,71 @@
+"""RateLimitedScheduler: priority order, re-queued throttles, and GitHub retries left to the client."""
+
+import threading
+
+import pytest
+
+from github_client import GitHubClient
+from Processors.scheduler import RateLimitedScheduler, INTERACTIVE, NORMAL, BULK
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = RateLimitedScheduler({'github': (1000.0, 100, 1), 'openrouter': (1000.0, 100, 1)})
+    yield scheduler
+    scheduler.shutdown()
+
+
+def test_queued_calls_start_by_priority_then_fifo(scheduler):
+    started = []
+    gate = threading.Event()
+    blocker = scheduler.submit('openrouter', gate.wait, 5)
+    futures = [scheduler.submit('openrouter', started.append, name, priority=priority)
+               for name, priority in [('bulk', BULK), ('normal 1', NORMAL), ('interactive', INTERACTIVE),
+                                      ('normal 2', NORMAL)]]
+    gate.set()
+    for future in [blocker] + futures:
+        future.result(timeout=5)
+    assert started == ['interactive', 'normal 1', 'normal 2', 'bulk']
+
+
+def test_throttled_results_are_requeued_until_they_succeed(scheduler):
+    responses = [FakeResponse(429, {'Retry-After': '0.01'}), FakeResponse(503, {'Retry-After': '0.01'}),
+                 FakeResponse(200)]
+    assert scheduler.call('openrouter', responses.pop, 0).status_code == 200
+    assert not responses
+    stats = scheduler.stats()['openrouter']
+    assert (stats['retried'], stats['throttled'], stats['completed']) == (2, 2, 1)
+
+
+def test_requeues_stop_after_max_retries(scheduler):
+    calls = []
+
+    def throttled():
+        calls.append(1)
+        return FakeResponse(429, {'Retry-After': '0.01'})
+
+    assert scheduler.call('openrouter', throttled).status_code == 429
+    assert len(calls) == scheduler.max_retries + 1
+
+
+def test_github_calls_retry_in_the_client_only(fake_github, scheduler, tmp_path):
+    fake_github.add_issue(1, '2025-03-01T10:00:00Z')
+    client = GitHubClient(repo=fake_github.repo, base_url=fake_github.url, scheduler=scheduler,
+                          cache_path=str(tmp_path / 'etags.json'))
+    fake_github.script(429, {'message': "slow down"}, {'Retry-After': '0'})
+
+    assert scheduler.call('github', client.get_issue, 1)['number'] == 1
+    assert len(fake_github.requests('GET')) == 2
+    stats = scheduler.stats()['github']
+    assert (stats['retried'], stats['throttled'], stats['completed']) == (0, 1, 1)
+
+
+def test_throttled_github_results_are_not_requeued(scheduler):
+    assert scheduler.call('github', FakeResponse, 429).status_code == 429
+    assert scheduler.stats()['github']['retried'] == 0
@@ -0,0 +1,123 @@
+"""Incremental updates of the BM25 search index give the same results as a rebuild."""
+
+import os
+import time
+import threading
+
+import pytest
+
+from Processors.search_index import SearchIndex, record_change, tokenize
+
+
+@pytest.fixture
+def docs(workdir, write):
+    write('Content/Issues/Bugs/1-export-crash/bug-report.md', "Export crashes when the zebra palette is used")
+    write('Content/Issues/Questions/2-palette/question.md', "How do I change the palette colours?")
+    write('ClaudeDocs/notes.txt', "Notes on the export pipeline and rate limits")
+    write('Content/image.png', "zebra zebra zebra")
+    return workdir
+
+
+def paths(results):
+    return [result['path'] for result in results]
+
+
+def test_tokenize_drops_stopwords_and_single_characters():
+    assert tokenize("The Zebra-palette is 2x, not a 3") == ['zebra', 'palette', '2x', 'not']
+
+
+def test_ranks_matching_documents(docs):
+    index = SearchIndex(index_dir='index')
+    assert paths(index.search("zebra")) == ['Content/Issues/Bugs/1-export-crash/bug-report.md']
+    assert paths(index.search("palette export", limit=1)) == ['Content/Issues/Bugs/1-export-crash/bug-report.md']
+    assert set(paths(index.search("export"))) == {
+        'Content/Issues/Bugs/1-export-crash/bug-report.md', 'ClaudeDocs/notes.txt'}
+    assert index.search("nonexistent") == []
+
+
+def test_recorded_changes_are_applied_before_searching(docs, write):
+    index = SearchIndex(index_dir='index')
+    index.update()
+
+    write('Content/Issues/Bugs/3-zebra-scroll/bug-report.md', "Scrolling the zebra list stutters")
+    os.rename('Content/Issues/Bugs/1-export-crash', 'Content/Issues/Closed-1-export-crash')
+    record_change('Content/Issues/Bugs/3-zebra-scroll', index_dir='index')
+    record_change('Content/Issues/Bugs/1-export-crash', 'Content/Issues/Closed-1-export-crash',
+                  index_dir='index')
+
+    assert set(paths(index.search("zebra"))) == {
+        'Content/Issues/Bugs/3-zebra-scroll/bug-report.md',
+        'Content/Issues/Closed-1-export-crash/bug-report.md'}
+    assert index.stats()['delta_docs'] == 2
+    assert not index.pending()
+
+    rebuilt = SearchIndex(index_dir='rebuilt')
+    for query in ("zebra", "export palette", "stutters list"):
+        assert index.search(query) == rebuilt.search(query)
+
+
+def test_a_claim_left_by_a_crashed_update_is_applied_with_the_new_journal(docs, write):
+    index = SearchIndex(index_dir='index')
+    index.update()
+
+    write('Content/Issues/Bugs/4-zebra-crash/bug-report.md', "Zebra export crashes")
+    record_change('Content/Issues/Bugs/4-zebra-crash', index_dir='index')
+    os.replace('index/journal', 'index/journal.applying')  # Claimed, then the update died
+    write('Content/Issues/Bugs/5-zebra-font/bug-report.md', "Zebra font is blurry")
+    record_change('Content/Issues/Bugs/5-zebra-font', index_dir='index')
+
+    stats = index.update()
+    assert stats['indexed'] == 2
+    assert not os.path.exists('index/journal.applying')
+    assert set(paths(index.search("zebra"))) == {
+        'Content/Issues/Bugs/1-export-crash/bug-report.md', 'Content/Issues/Bugs/4-zebra-crash/bug-report.md',
+        'Content/Issues/Bugs/5-zebra-font/bug-report.md'}
+    assert not index.pending()
+
+
+def test_concurrent_updates_apply_a_claim_once(docs, write, monkeypatch):
+    index = SearchIndex(index_dir='index')
+    index.update()
+    write('Content/Issues/Bugs/6-zebra-sort/bug-report.md', "Sorting zebra rows is slow")
+    record_change('Content/Issues/Bugs/6-zebra-sort', index_dir='index')
+
+    # Slow enough that every updater starts while the first holds the claim
+    sync_path = SearchIndex._sync_path
+
+    def slow_sync_path(self, conn, path):
+        time.sleep(0.05)
+        return sync_path(self, conn, path)
+
+    monkeypatch.setattr(SearchIndex, '_sync_path', slow_sync_path)
+    results, errors = [], []
+
+    def run():
+        try:
+            results.append(SearchIndex(index_dir='index').update()['indexed'])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert sorted(results) == [0, 0, 0, 1]
+    assert not index.pending()
+    assert [name for name in os.listdir('index') if name.endswith('.tmp')] == []
+    assert set(paths(index.search("zebra"))) == {
+        'Content/Issues/Bugs/1-export-crash/bug-report.md', 'Content/Issues/Bugs/6-zebra-sort/bug-report.md'}
+
+
+def test_full_update_merges_the_delta(docs):
+    index = SearchIndex(index_dir='index')
+    index.update()
+    os.remove('ClaudeDocs/notes.txt')
+    stats = index.update(paths=['ClaudeDocs'])
+    assert (stats['removed'], stats['docs'], stats['delta_docs']) == (1, 2, 0)
+
+    stats = index.update(full=True)
+    assert (stats['indexed'], stats['docs'], stats['delta_docs']) == (2, 2, 0)
+    assert paths(index.search("pipeline")) == []
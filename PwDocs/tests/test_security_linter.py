@@ -0,0 +1,54 @@
+"""Security linter line rules: the combined scanner against the per-rule scan, and the repo's own sources."""
+
+import os
+
+import pytest
+
+from security_linter import (COMPILED, DANGEROUS_PATTERNS, DEFAULT_ROOTS, SELF_NAMES, SKIP_LINE,
+                             find_python_files, scan_lines)
+
+
+def scan_each_rule(text, rule_names=tuple(DANGEROUS_PATTERNS)):
+    """The pre-combined scan: every rule searched on every line."""
+    findings = []
+    for i, line in enumerate(text.splitlines(), 1):
+        if SKIP_LINE.match(line) or "'pattern':" in line or '"pattern":' in line:
+            continue
+        for name in rule_names:
+            if COMPILED[name].search(line):
+                findings.append((i, name))
+    return findings
+
+
+def found(findings):
+    return [(finding['line'], finding['check']) for finding in findings]
+
+
+def repo_sources():
+    """Every Python file the linter scans by default, plus the ones it skips as its own."""
+    paths = find_python_files(DEFAULT_ROOTS)
+    for root in DEFAULT_ROOTS:
+        paths += [os.path.join(root, name) for name in os.listdir(root) if name in SELF_NAMES]
+    return sorted(paths)
+
+
+@pytest.mark.parametrize('path', repo_sources(), ids=os.path.basename)
+def test_combined_scanner_matches_the_per_rule_scan(path):
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    assert found(scan_lines(text)) == scan_each_rule(text)
+    subset = ('shell_command', 'unsafe_yaml')
+    assert found(scan_lines(text, subset)) == scan_each_rule(text, subset)
+
+
+def test_one_line_can_hit_several_rules():
+    text = 'eval(f"{issue_title}"); os.system(cmd)\n# eval(x)\nyaml.load(stream)\n'
+    assert found(scan_lines(text)) == scan_each_rule(text) == [
+        (1, 'eval_exec'), (1, 'shell_command'), (1, 'unsafe_f_string'), (3, 'unsafe_yaml')]
+
+
+def test_ast_linter_rule_tables_do_not_trip_the_line_rules():
+    # So ast_linter.py is linted like any other script rather than skipped as one of SELF_NAMES
+    assert 'ast_linter.py' not in SELF_NAMES
+    with open(os.path.join(DEFAULT_ROOTS[0], 'ast_linter.py'), encoding='utf-8') as f:
+        assert scan_lines(f.read()) == []
@@ -0,0 +1,116 @@
+"""--staged: hunk headers map to changed line ranges, and only findings on those lines are reported."""
+
+import os
+import subprocess
+
+import pytest
+
+from lint_report import add_fingerprints
+from security_linter import HUNK_HEADER, lint, lint_staged, staged_line_ranges
+
+BEFORE = """import os
+
+
+def run(cmd):
+    return cmd
+
+
+def keep():
+    return 1
+
+
+def legacy():
+    os.system('ls')
+"""
+
+AFTER = """import os
+import subprocess
+
+
+def run(cmd):
+    os.system(cmd)
+    return cmd
+
+
+def keep():
+    return 2
+
+
+def legacy():
+    os.system('ls')
+"""
+
+
+def git(*args):
+    subprocess.run(['git', '-c', 'user.name=Test', '-c', 'user.email=test@example.com', *args],
+                   check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(workdir):
+    git('init', '-q')
+    os.makedirs('Scripts')
+    for name, text in (('Scripts/tool.py', BEFORE), ('Scripts/gone.py', BEFORE)):
+        with open(name, 'w') as f:
+            f.write(text)
+    git('add', '.')
+    git('commit', '-q', '-m', 'initial')
+    return workdir
+
+
+@pytest.mark.parametrize('header, expected', [
+    ('@@ -12,3 +14,5 @@ def run():', ('14', '5')),
+    ('@@ -1 +1 @@', ('1', None)),
+    ('@@ -7,2 +6,0 @@', ('6', '0')),
+])
+def test_hunk_header(header, expected):
+    assert HUNK_HEADER.match(header).groups() == expected
+
+
+def test_staged_ranges_cover_added_and_changed_lines_only(repo):
+    with open('Scripts/tool.py', 'w') as f:
+        f.write(AFTER)
+    with open('Scripts/new.py', 'w') as f:
+        f.write("x = 1\ny = 2\n")
+    with open('notes.txt', 'w') as f:
+        f.write("not python\n")
+    os.remove('Scripts/gone.py')
+    git('add', '-A')
+
+    assert staged_line_ranges() == {
+        'Scripts/tool.py': [(2, 2), (6, 6), (11, 11)],
+        'Scripts/new.py': [(1, 2)],
+    }
+
+
+def test_only_findings_on_changed_lines_are_reported(repo):
+    with open('Scripts/tool.py', 'w') as f:
+        f.write(AFTER)
+    git('add', '-A')
+    # Unstaged edits are not what gets committed, so they are not linted
+    with open('Scripts/tool.py', 'a') as f:
+        f.write("os.system(input())\n")
+
+    findings, stats = lint_staged(engines=('regex',))
+    assert [(finding['file'], finding['line'], finding['check']) for finding in findings] == [
+        ('Scripts/tool.py', 6, 'shell_command')]
+    assert findings[0]['context'][0] == (4, '')
+    assert (stats['files'], stats['changed_lines']) == (1, 3)
+
+
+def test_fingerprints_do_not_depend_on_the_working_directory(repo):
+    with open('Scripts/tool.py', 'w') as f:
+        f.write(AFTER)
+    git('add', '-A')
+    staged = add_fingerprints(lint_staged(engines=('regex',))[0])
+    from_root = add_fingerprints(lint(['Scripts'], engines=('regex',))[0])
+    os.chdir('Scripts')
+    from_scripts = add_fingerprints(lint(['.'], engines=('regex',))[0])
+
+    assert [(finding['file'], finding['line']) for finding in from_scripts] == [
+        ('Scripts/gone.py', 13), ('Scripts/tool.py', 6), ('Scripts/tool.py', 15)]
+    assert [finding['fingerprint'] for finding in from_root] == \
+        [finding['fingerprint'] for finding in from_scripts]
+    # --staged reports the same finding under the same fingerprint
+    assert [(finding['line'], finding['fingerprint']) for finding in staged] == \
+        [(6, from_scripts[1]['fingerprint'])]
@@ -0,0 +1,138 @@
+"""Benchmark tier: shared_utils helpers timed from 1 KB to 10 MB, including ReDoS inputs.
+
+Skipped unless PWDOCS_BENCHMARK is set:
+
+    PWDOCS_BENCHMARK=1 python -m pytest PwDocs/tests -k benchmark -s
+    PWDOCS_BENCHMARK=update python -m pytest PwDocs/tests -k benchmark
+
+A case fails when its time grows super-linearly with the input size, or
+when it is more than REGRESSION_FACTOR slower than the stored baseline at
+the largest size. 'update' rewrites benchmark_baselines.json instead.
+"""
+
+import os
+import json
+import math
+import time
+
+import pytest
+
+from Processors.shared_utils import (
+    validate_issue_number, escape_markdown, sanitize_for_ai, clean_title_for_filename,
+    get_issue_type, format_github_metadata_yaml, format_github_metadata_markdown
+)
+
+MODE = os.environ.get('PWDOCS_BENCHMARK', '')
+BASELINES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baselines.json')
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+# Time growth per 10x input beyond 10**MAX_EXPONENT counts as super-linear;
+# steps faster than MIN_TIMED_SECONDS are too noisy to judge
+MAX_EXPONENT = 1.5
+MIN_TIMED_SECONDS = 0.002
+REGRESSION_FACTOR = 2.0
+
+# Stop repeating a size once this much time went into it
+REPEAT_BUDGET_SECONDS = 0.2
+MAX_REPEATS = 5
+
+
+def _repeat(stem, size):
+    return (stem * (size // len(stem) + 1))[:size]
+
+
+def _metadata(title):
+    return {
+        'github_issue': "#123",
+        'github_url': "https://github.com/tmcfar/plotweaver-docs/issues/123",
+        'issue_title': title,
+        'processed_date': "2026-10-19"
+    }
+
+
+PROSE = "Add a **dark mode** toggle to [settings](#ui) so `theme` follows the OS | system > app.\n"
+
+# name -> (function, input builder); the builder returns the argument for a size in bytes
+CASES = {
+    'validate_issue_number': (validate_issue_number, lambda size: _repeat("#12a", size)),
+    'escape_markdown': (escape_markdown, lambda size: _repeat(PROSE, size)),
+    'sanitize_for_ai': (sanitize_for_ai, lambda size: _repeat(PROSE, size)),
+    # ReDoS inputs for the old 'word.*word.*word' regexes: one long line of
+    # partial matches that never complete
+    'sanitize_for_ai:ignore_previous': (sanitize_for_ai, lambda size: _repeat("ignore previous ", size)),
+    'sanitize_for_ai:new_instructions': (sanitize_for_ai, lambda size: _repeat("new instructions ", size)),
+    'sanitize_for_ai:open_tags': (sanitize_for_ai, lambda size: _repeat("</a", size)),
+    'sanitize_for_ai:fences': (sanitize_for_ai, lambda size: _repeat("``` ", size)),
+    'clean_title_for_filename': (clean_title_for_filename, lambda size: _repeat("Add <Dark> Mode: ", size)),
+    'clean_title_for_filename:separators': (clean_title_for_filename, lambda size: _repeat(" -", size)),
+    'get_issue_type': (lambda title: get_issue_type([], title), lambda size: _repeat("feature ", size)),
+    'format_github_metadata_yaml': (format_github_metadata_yaml,
+                                    lambda size: _metadata(_repeat('Title "with" quotes: ', size))),
+    'format_github_metadata_markdown': (format_github_metadata_markdown,
+                                        lambda size: _metadata(_repeat(PROSE, size))),
+}
+
+
+def _time(function, argument):
+    """Best of a few runs, fewer for the slow sizes."""
+    best = math.inf
+    spent = 0.0
+    for _ in range(MAX_REPEATS):
+        start = time.perf_counter()
+        function(argument)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        spent += elapsed
+        if spent > REPEAT_BUDGET_SECONDS:
+            break
+    return best
+
+
+def _load_baselines():
+    if not os.path.exists(BASELINES_FILE):
+        return {}
+    with open(BASELINES_FILE, 'r') as f:
+        return json.load(f)
+
+
+_results = {}
+
+
+@pytest.fixture(scope='module', autouse=True)
+def baselines():
+    stored = _load_baselines()
+    yield stored
+    if MODE == 'update' and _results:
+        stored.update(_results)
+        with open(BASELINES_FILE, 'w') as f:
+            json.dump(dict(sorted(stored.items())), f, indent=2)
+            f.write('\n')
+
+
+@pytest.mark.skipif(not MODE, reason="benchmark tier: set PWDOCS_BENCHMARK=1 (or =update to store baselines)")
+@pytest.mark.parametrize('case', sorted(CASES))
+def test_benchmark_scaling(case, baselines):
+    function, build = CASES[case]
+    timings = {}
+    previous = None
+    # Check each step as it is timed, so a quadratic case fails before the 10 MB run
+    for size in SIZES:
+        timings[size] = _time(function, build(size))
+        print(f"\n{case}: {size // 1000}KB {timings[size] * 1000:.2f}ms", end='')
+        if previous and timings[previous] >= MIN_TIMED_SECONDS:
+            exponent = math.log(timings[size] / timings[previous]) / math.log(size / previous)
+            assert exponent <= MAX_EXPONENT, (
+                f"{case} scales super-linearly: {timings[previous] * 1000:.1f}ms at {previous} bytes, "
+                f"{timings[size] * 1000:.1f}ms at {size} bytes (n^{exponent:.2f})")
+        previous = size
+    _results[case] = {str(size): round(seconds, 6) for size, seconds in timings.items()}
+
+    largest = str(SIZES[-1])
+    baseline = baselines.get(case, {}).get(largest)
+    if MODE != 'update' and baseline:
+        ratio = timings[SIZES[-1]] / baseline
+        print(f"  {ratio:.2f}x baseline ({baseline * 1000:.1f}ms) at {largest} bytes")
+        assert ratio <= REGRESSION_FACTOR, (
+            f"{case} regressed: {timings[SIZES[-1]] * 1000:.1f}ms at {largest} bytes, "
+            f"baseline {baseline * 1000:.1f}ms ({ratio:.2f}x)")
@@ -0,0 +1,40 @@
+"""Staleness band boundaries, for single ages and for a scanned tree."""
+
+import os
+
+import pytest
+
+from staleness import BAND_LABELS, SECONDS_PER_DAY, band_index, compute_staleness
+
+NOW = 1_700_000_000
+
+
+@pytest.mark.parametrize('age, band', [
+    (0, 0), (6, 0), (7, 1), (29, 1), (30, 2), (89, 2), (90, 3), (1000, 3),
+])
+def test_band_upper_limits_are_exclusive(age, band):
+    assert band_index(age) == band
+
+
+def test_files_at_each_threshold_land_in_the_next_band(workdir, write):
+    ages = {'a.md': 6, 'b.md': 7, 'c.md': 29, 'd.md': 30, 'e.md': 89, 'f.md': 90,
+            'g.md': 1000}
+    for name, days in ages.items():
+        path = os.path.join('Content', name)
+        write(path, name)
+        mtime = NOW - days * SECONDS_PER_DAY
+        os.utime(path, (mtime, mtime))
+    # One second short of seven days is still six whole days
+    write('Content/Old/h.md', "h")
+    os.utime('Content/Old/h.md', (NOW - 7 * SECONDS_PER_DAY + 1,) * 2)
+
+    report = compute_staleness(['Content'], top_n=3, now=NOW)
+
+    assert report['files'] == 8
+    assert report['totals'] == [2, 2, 2, 2]
+    assert report['directories'] == {'Content': [1, 2, 2, 2], 'Content/Old': [1, 0, 0, 0]}
+    assert [(item['path'], item['age_days'], item['status']) for item in report['stalest']] == [
+        ('Content/g.md', 1000, BAND_LABELS[3]),
+        ('Content/f.md', 90, BAND_LABELS[3]),
+        ('Content/e.md', 89, BAND_LABELS[2]),
+    ]
@@ -0,0 +1,46 @@
+"""Dashboard renderers link documents relative to the page, with encoded targets."""
+
+from state_renderers import render_markdown, render_html, link_target
+
+PATH = 'ClaudeDocs/staged_enrichment_status (1).md'
+
+
+def state():
+    return {
+        'generated': '2026-10-19 12:00',
+        'sections': {
+            'core_docs': [{'name': 'CLAUDE', 'path': 'CLAUDE.md', 'last_update': None, 'issue': None,
+                           'age_days': 3, 'status': '✅ Fresh'}],
+            'staleness': {'files': 1, 'bands': ['✅ Fresh', '🟡 Recent', '🟠 Aging', '🔴 Stale'],
+                          'totals': [0, 0, 0, 1], 'directories': {'ClaudeDocs': [0, 0, 0, 1]},
+                          'stalest': [{'path': PATH, 'age_days': 120, 'status': '🔴 Stale'}]},
+            'bugs': {'count': 1, 'top': [{'issue': '#7', 'title': 'Crash in [setup](x) | *all*',
+                                          'priority': None,
+                                          'path': 'Content/Issues/Bugs/bug-7 [x]/bug-report.md'}]},
+        }
+    }
+
+
+def test_link_targets_are_relative_and_encoded():
+    assert link_target(PATH) == 'ClaudeDocs/staged_enrichment_status%20%281%29.md'
+    assert link_target('CLAUDE.md', 'Content/Technical') == '../../CLAUDE.md'
+    assert link_target('CLAUDE.md', '') == 'CLAUDE.md'
+
+
+def test_markdown_links_resolve_from_the_output_directory():
+    page = render_markdown(state(), 'Content/Technical')
+    assert ("- 🔴 Stale 120d: [ClaudeDocs/staged_enrichment_status (1).md]"
+            "(../../ClaudeDocs/staged_enrichment_status%20%281%29.md)") in page
+    assert "| [CLAUDE.md](../../CLAUDE.md) |" in page
+    assert "([view](../Issues/Bugs/bug-7%20%5Bx%5D/bug-report.md))" in page
+
+
+def test_markdown_escapes_issue_titles():
+    page = render_markdown(state())
+    assert r"- #7: Crash in \[setup\]\(x\) \| \*all\* ([view](" in page
+
+
+def test_html_links_are_encoded():
+    page = render_html(state(), 'Content/Technical')
+    assert '<a href="../../CLAUDE.md">CLAUDE.md</a>' in page
+    assert 'href="../Issues/Bugs/bug-7%20%5Bx%5D/bug-report.md"' in page
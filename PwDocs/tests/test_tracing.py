@@ -0,0 +1,73 @@
+"""Spans nest per thread, are written as JSON lines only when enabled, and summarize into percentiles."""
+
+import json
+
+import pytest
+
+from Processors import tracing
+from Processors.tracing import span, read_traces, summarize, percentile
+
+
+@pytest.fixture
+def trace_file(tmp_path, monkeypatch):
+    path = tmp_path / 'traces' / 'run.jsonl'
+    monkeypatch.setenv('PWDOCS_TRACE', str(path))
+    tracing.reset()
+    yield path
+    tracing.reset()
+
+
+def test_disabled_tracing_writes_nothing(workdir, monkeypatch):
+    monkeypatch.delenv('PWDOCS_TRACE', raising=False)
+    tracing.reset()
+    with span('issue') as current:
+        current.set(status=200)
+    assert span('issue') is span('render')
+    assert not (workdir / '.pwdocs-cache').exists()
+
+
+def test_nested_spans_share_a_trace(trace_file):
+    with span('issue', issue='12'):
+        with span('render') as render:
+            render.set(bytes=10)
+        with pytest.raises(ValueError):
+            with span('write'):
+                raise ValueError("disk full")
+
+    records = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    assert [record['name'] for record in records] == ['render', 'write', 'issue']
+    render, write, issue = records
+    assert issue['parent'] is None and issue['attributes'] == {'issue': '12'}
+    assert render['parent'] == write['parent'] == issue['span']
+    assert render['trace'] == write['trace'] == issue['trace']
+    assert render['attributes'] == {'bytes': 10}
+    assert write['error'] == 'ValueError' and 'error' not in issue
+    assert issue['duration_ms'] >= render['duration_ms'] + write['duration_ms']
+
+    with span('issue'):
+        pass
+    assert read_traces([trace_file])[-1]['trace'] != issue['trace']
+
+
+def test_percentiles_use_nearest_rank():
+    values = list(range(1, 101))
+    assert [percentile(values, p) for p in (50, 90, 99, 100)] == [50, 90, 99, 100]
+    assert percentile([7.0], 99) == 7.0
+    assert percentile([], 50) == 0.0
+
+
+def test_summary_aggregates_runs_per_stage():
+    records = []
+    for run, (llm, write) in enumerate([(900, 10), (1100, 30), (1000, 20)]):
+        records += [
+            {'trace': run, 'span': f'{run}a', 'parent': None, 'name': 'issue', 'duration_ms': llm + write},
+            {'trace': run, 'span': f'{run}b', 'parent': f'{run}a', 'name': 'llm', 'duration_ms': llm},
+            {'trace': run, 'span': f'{run}c', 'parent': f'{run}a', 'name': 'write', 'duration_ms': write,
+             **({'error': 'OSError'} if run == 1 else {})},
+        ]
+    stages = {stage['stage']: stage for stage in summarize(records + [{'name': 'partial'}])}
+    assert list(stages) == ['issue', 'llm', 'write']
+    assert stages['llm']['count'] == 3
+    assert (stages['llm']['p50_ms'], stages['llm']['p99_ms'], stages['llm']['max_ms']) == (1000, 1100, 1100)
+    assert stages['llm']['share'] == round(3000 / 3060, 4)
+    assert stages['write']['errors'] == 1 and stages['write']['mean_ms'] == 20